@@ -108,6 +108,18 @@ impl TestClock {
             .collect()
     }
 
+    /// Return the next time event timestamp across all active timers
+    /// (zero if there are no active timers).
+    #[inline]
+    pub fn next_event_time_ns(&self) -> Timestamp {
+        self.timers
+            .values()
+            .filter(|timer| !timer.is_expired)
+            .map(|timer| timer.next_time_ns)
+            .min()
+            .unwrap_or(0)
+    }
+
     // #[inline]
     // pub fn match_handlers(&self, events: Vec<TimeEvent>) -> Vec<TimeEventHandler> {
     //     events
@@ -284,6 +296,11 @@ pub extern "C" fn test_clock_time_ns(clock: &CTestClock) -> u64 {
     clock.time_ns
 }
 
+#[no_mangle]
+pub extern "C" fn test_clock_next_event_time_ns(clock: &CTestClock) -> u64 {
+    clock.next_event_time_ns()
+}
+
 #[no_mangle]
 pub extern "C" fn test_clock_timer_names(clock: &CTestClock) -> *mut ffi::PyObject {
     Python::with_gil(|py| -> Py<PyList> {
@@ -415,4 +432,17 @@ mod tests {
         assert_eq!(clock.timer_names().len(), 1);
         assert_eq!(clock.timer_count(), 1);
     }
+
+    #[test]
+    fn test_next_event_time_ns() {
+        let mut clock = TestClock::new();
+        assert_eq!(clock.next_event_time_ns(), 0);
+
+        clock.set_timer_ns(String::from("TEST_TIME1"), 10, 0, None, None);
+        clock.set_time_alert_ns(String::from("TEST_ALERT1"), 5, None);
+        assert_eq!(clock.next_event_time_ns(), 5);
+
+        clock.advance_time(5);
+        assert_eq!(clock.next_event_time_ns(), 10);
+    }
 }
@@ -0,0 +1,55 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint32_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.data cimport Data
+
+
+cpdef enum ColumnarDataKind:
+    QUOTE_TICK = 0
+    TRADE_TICK = 1
+    BAR = 2
+
+
+cdef class ColumnarDataStream:
+    cdef readonly list keys
+    """The instrument IDs (for ticks) or bar types (for bars) referenced by row.\n\n:returns: `list[InstrumentId | BarType]`"""
+    cdef readonly dict columns
+    """The underlying column arrays by name.\n\n:returns: `dict[str, np.ndarray]`"""
+
+    cdef uint64_t _len
+    cdef const uint8_t[:] _kind
+    cdef const uint32_t[:] _key
+    cdef const uint64_t[:] _ts_event
+    cdef const uint64_t[:] _ts_init
+    cdef const int64_t[:] _price_0
+    cdef const int64_t[:] _price_1
+    cdef const int64_t[:] _price_2
+    cdef const int64_t[:] _price_3
+    cdef const uint64_t[:] _size_0
+    cdef const uint64_t[:] _size_1
+    cdef const uint8_t[:] _price_prec
+    cdef const uint8_t[:] _size_prec
+    cdef const uint8_t[:] _side
+    cdef object _trade_id
+
+    cdef uint64_t ts_init_c(self, uint64_t index) except *
+    cdef uint8_t kind_c(self, uint64_t index) except *
+    cdef uint32_t key_c(self, uint64_t index) except *
+    cdef Data get_c(self, uint64_t index)
@@ -0,0 +1,492 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import json
+
+import numpy as np
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint32_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.data cimport Data
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport TradeId
+
+
+# Column name -> NumPy dtype (columns after `size_prec` are optional)
+_COLUMN_DTYPES = {
+    "kind": np.uint8,
+    "key": np.uint32,
+    "ts_event": np.uint64,
+    "ts_init": np.uint64,
+    "price_prec": np.uint8,
+    "size_prec": np.uint8,
+    "price_0": np.int64,
+    "price_1": np.int64,
+    "price_2": np.int64,
+    "price_3": np.int64,
+    "size_0": np.uint64,
+    "size_1": np.uint64,
+    "side": np.uint8,
+    "trade_id": None,  # Fixed width bytes
+}
+
+_REQUIRED_COLUMNS = ("kind", "key", "ts_event", "ts_init", "price_prec", "size_prec")
+
+# Row kind -> the optional columns required for the rows of that kind
+_KIND_COLUMNS = {
+    ColumnarDataKind.QUOTE_TICK: ("price_0", "price_1", "size_0", "size_1"),
+    ColumnarDataKind.TRADE_TICK: ("price_0", "size_0", "side", "trade_id"),
+    ColumnarDataKind.BAR: ("price_0", "price_1", "price_2", "price_3", "size_0"),
+}
+
+# Binary file format: magic, header length (uint64 little-endian), JSON header, column data
+_FILE_MAGIC = b"NTCOLS01"
+_FILE_VERSION = 1
+_FILE_ALIGNMENT = 64  # Column offsets are aligned to 64 bytes
+
+
+cdef class ColumnarDataStream:
+    """
+    Provides a columnar in-memory stream of market data for backtesting.
+
+    Rows are held as raw fixed-point fields in NumPy arrays, with `QuoteTick`,
+    `TradeTick` and `Bar` objects only materialized as each row is read. The
+    stream is sorted by `ts_init` on construction (stable, if not already sorted).
+
+    Row fields are interpreted according to the row `kind`:
+     - ``QUOTE_TICK``: `price_0` bid, `price_1` ask, `size_0` bid size, `size_1` ask size.
+     - ``TRADE_TICK``: `price_0` price, `size_0` size, `side` aggressor side, `trade_id`.
+     - ``BAR``: `price_0` open, `price_1` high, `price_2` low, `price_3` close, `size_0` volume.
+
+    Parameters
+    ----------
+    keys : list[InstrumentId | BarType]
+        The instrument IDs (for ticks) or bar types (for bars) indexed by the `key` column.
+    columns : dict[str, np.ndarray]
+        The column arrays by name. Columns not required by any row kind may be omitted.
+
+    Raises
+    ------
+    ValueError
+        If `keys` is empty.
+    ValueError
+        If `columns` is missing a required column.
+    ValueError
+        If the column lengths are not all equal.
+    ValueError
+        If any `key` value is out of range for `keys`.
+    ValueError
+        If any `kind` value is not a `ColumnarDataKind`.
+    ValueError
+        If `columns` is missing a column required by a row kind present.
+
+    Warnings
+    --------
+    Each row materializes a new object, so repeated reads of the same row
+    return equal (but not identical) objects.
+    """
+
+    def __init__(self, list keys not None, dict columns not None):
+        Condition.not_empty(keys, "keys")
+        for name in _REQUIRED_COLUMNS:
+            Condition.is_in(name, columns, "name", "columns")
+
+        cdef dict cols = {}
+        cdef uint64_t length = len(columns["ts_init"])
+        for name, dtype in _COLUMN_DTYPES.items():
+            values = columns.get(name)
+            if values is None:
+                continue
+            Condition.equal(len(values), length, f"len({name})", "len(ts_init)")
+            if dtype is None:
+                cols[name] = np.asarray(values)
+            else:
+                cols[name] = np.ascontiguousarray(values, dtype=dtype)
+
+        if length > 0:
+            Condition.true(cols["key"].max() < len(keys), "`key` out of range for `keys`")
+        for kind in np.unique(cols["kind"]).tolist():
+            Condition.is_in(kind, _KIND_COLUMNS, "kind", "_KIND_COLUMNS")
+            for name in _KIND_COLUMNS[kind]:
+                Condition.is_in(name, cols, "name", "columns")
+
+        # Ensure sorted by `ts_init` (stable, so ties retain their input order)
+        ts_init = cols["ts_init"]
+        if length > 1 and (ts_init[1:] < ts_init[:-1]).any():
+            order = np.argsort(ts_init, kind="stable")
+            cols = {name: values[order] for name, values in cols.items()}
+
+        self.keys = keys
+        self.columns = cols
+
+        self._len = length
+        self._kind = cols["kind"]
+        self._key = cols["key"]
+        self._ts_event = cols["ts_event"]
+        self._ts_init = cols["ts_init"]
+        self._price_prec = cols["price_prec"]
+        self._size_prec = cols["size_prec"]
+        self._price_0 = cols.get("price_0")
+        self._price_1 = cols.get("price_1")
+        self._price_2 = cols.get("price_2")
+        self._price_3 = cols.get("price_3")
+        self._size_0 = cols.get("size_0")
+        self._size_1 = cols.get("size_1")
+        self._side = cols.get("side")
+        self._trade_id = cols.get("trade_id")
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, int64_t index) -> Data:
+        if index < 0:
+            index += self._len
+        if index < 0 or index >= <int64_t>self._len:
+            raise IndexError("index out of range")
+        return self.get_c(index)
+
+    def __iter__(self):
+        cdef uint64_t i
+        for i in range(self._len):
+            yield self.get_c(i)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={self._len}, keys={len(self.keys)})"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Return the total bytes held by the stream columns.
+
+        Returns
+        -------
+        int
+
+        """
+        return sum([values.nbytes for values in self.columns.values()])
+
+    def to_file(self, path) -> None:
+        """
+        Write the stream to the given path in a compact binary format.
+
+        The file holds a header (format version, keys and column layout)
+        followed by the raw column arrays, each aligned to 64 bytes.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file path to write to.
+
+        """
+        Condition.not_none(path, "path")
+
+        cdef list keys = [
+            ["bar", str(key)] if isinstance(key, BarType) else ["instrument", str(key)]
+            for key in self.keys
+        ]
+
+        cdef list layout = []
+        offset = 0
+        for name, values in self.columns.items():
+            offset += -offset % _FILE_ALIGNMENT
+            layout.append([name, values.dtype.str, len(values), offset])
+            offset += values.nbytes
+
+        cdef bytes header = json.dumps(
+            {"version": _FILE_VERSION, "keys": keys, "columns": layout},
+        ).encode()
+        data_start = len(_FILE_MAGIC) + 8 + len(header)
+        data_start += -data_start % _FILE_ALIGNMENT
+
+        with open(path, "wb") as f:
+            f.write(_FILE_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for name, dtype, length, offset in layout:
+                f.seek(data_start + offset)
+                f.write(np.ascontiguousarray(self.columns[name]).tobytes())
+
+    @staticmethod
+    def from_file(path, bint mmap=True) -> ColumnarDataStream:
+        """
+        Return a stream read from the given binary file (written by `to_file`).
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file path to read from.
+        mmap : bool, default True
+            If the file should be memory-mapped (read-only), rather than read
+            into memory. Objects are then built straight from the mapped pages.
+
+        Returns
+        -------
+        ColumnarDataStream
+
+        Raises
+        ------
+        ValueError
+            If the file is not a columnar data stream file.
+        ValueError
+            If the file format version is not supported.
+
+        """
+        Condition.not_none(path, "path")
+
+        cdef dict header = _read_file_header(path)
+        data_start = header["data_start"]
+
+        if mmap:
+            buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            buffer = np.fromfile(path, dtype=np.uint8)
+
+        cdef list keys = [
+            BarType.from_str(value) if kind == "bar" else InstrumentId.from_str(value)
+            for kind, value in header["keys"]
+        ]
+        cdef dict columns = {
+            name: np.frombuffer(buffer, dtype=dtype, count=length, offset=data_start + offset)
+            for name, dtype, length, offset in header["columns"]
+        }
+
+        return ColumnarDataStream(keys, columns)
+
+    cdef uint64_t ts_init_c(self, uint64_t index) except *:
+        return self._ts_init[index]
+
+    cdef uint8_t kind_c(self, uint64_t index) except *:
+        return self._kind[index]
+
+    cdef uint32_t key_c(self, uint64_t index) except *:
+        return self._key[index]
+
+    cdef Data get_c(self, uint64_t index):
+        cdef uint8_t kind = self._kind[index]
+        cdef object key = self.keys[self._key[index]]
+        if kind == ColumnarDataKind.QUOTE_TICK:
+            return QuoteTick.from_raw_c(
+                <InstrumentId>key,
+                self._price_0[index],
+                self._price_1[index],
+                self._price_prec[index],
+                self._price_prec[index],
+                self._size_0[index],
+                self._size_1[index],
+                self._size_prec[index],
+                self._size_prec[index],
+                self._ts_event[index],
+                self._ts_init[index],
+            )
+        elif kind == ColumnarDataKind.TRADE_TICK:
+            return TradeTick.from_raw_c(
+                <InstrumentId>key,
+                self._price_0[index],
+                self._price_prec[index],
+                self._size_0[index],
+                self._size_prec[index],
+                <AggressorSide>self._side[index],
+                TradeId(self._trade_id[index].decode()),
+                self._ts_event[index],
+                self._ts_init[index],
+            )
+        elif kind == ColumnarDataKind.BAR:
+            return Bar.from_raw_c(
+                <BarType>key,
+                self._price_0[index],
+                self._price_1[index],
+                self._price_2[index],
+                self._price_3[index],
+                self._price_prec[index],
+                self._size_0[index],
+                self._size_prec[index],
+                self._ts_event[index],
+                self._ts_init[index],
+            )
+        else:  # pragma: no cover (design-time error)
+            raise RuntimeError(f"invalid `ColumnarDataKind`, was {kind}")
+
+    @staticmethod
+    def from_data(list data not None) -> ColumnarDataStream:
+        """
+        Return a columnar stream built from the given data.
+
+        Parameters
+        ----------
+        data : list[QuoteTick | TradeTick | Bar]
+            The data for the stream.
+
+        Returns
+        -------
+        ColumnarDataStream
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+        ValueError
+            If a quote tick has differing bid and ask price or size precisions.
+        TypeError
+            If `data` contains a type other than `QuoteTick`, `TradeTick` or `Bar`.
+
+        """
+        Condition.not_empty(data, "data")
+
+        cdef bint has_quotes = False
+        cdef bint has_trades = False
+        cdef bint has_bars = False
+        for x in data:
+            if isinstance(x, QuoteTick):
+                has_quotes = True
+            elif isinstance(x, TradeTick):
+                has_trades = True
+            elif isinstance(x, Bar):
+                has_bars = True
+            else:
+                raise TypeError(
+                    f"cannot add `{type(x).__name__}` to a `ColumnarDataStream`",
+                )
+
+        cdef uint64_t length = len(data)
+        cdef dict columns = {
+            "kind": np.empty(length, dtype=np.uint8),
+            "key": np.empty(length, dtype=np.uint32),
+            "ts_event": np.empty(length, dtype=np.uint64),
+            "ts_init": np.empty(length, dtype=np.uint64),
+            "price_prec": np.empty(length, dtype=np.uint8),
+            "size_prec": np.empty(length, dtype=np.uint8),
+            "price_0": np.zeros(length, dtype=np.int64),
+            "size_0": np.zeros(length, dtype=np.uint64),
+        }
+        if has_quotes or has_bars:
+            columns["price_1"] = np.zeros(length, dtype=np.int64)
+        if has_quotes:
+            columns["size_1"] = np.zeros(length, dtype=np.uint64)
+        if has_bars:
+            columns["price_2"] = np.zeros(length, dtype=np.int64)
+            columns["price_3"] = np.zeros(length, dtype=np.int64)
+        if has_trades:
+            columns["side"] = np.zeros(length, dtype=np.uint8)
+
+        cdef:
+            uint8_t[:] kinds = columns["kind"]
+            uint32_t[:] key_indexes = columns["key"]
+            uint64_t[:] ts_events = columns["ts_event"]
+            uint64_t[:] ts_inits = columns["ts_init"]
+            uint8_t[:] price_precs = columns["price_prec"]
+            uint8_t[:] size_precs = columns["size_prec"]
+            int64_t[:] prices_0 = columns["price_0"]
+            int64_t[:] prices_1 = columns.get("price_1")
+            int64_t[:] prices_2 = columns.get("price_2")
+            int64_t[:] prices_3 = columns.get("price_3")
+            uint64_t[:] sizes_0 = columns["size_0"]
+            uint64_t[:] sizes_1 = columns.get("size_1")
+            uint8_t[:] sides = columns.get("side")
+            list trade_ids = [b""] * length if has_trades else None
+
+        # Instrument IDs and bar types are indexed separately as they do not compare
+        cdef list keys = []
+        cdef dict instrument_keys = {}
+        cdef dict bar_keys = {}
+
+        cdef:
+            uint64_t i
+            Data x_data
+            QuoteTick quote
+            TradeTick trade
+            Bar bar
+        for i in range(length):
+            x_data = data[i]
+            ts_events[i] = x_data.ts_event
+            ts_inits[i] = x_data.ts_init
+            if isinstance(x_data, QuoteTick):
+                quote = x_data
+                Condition.equal(
+                    quote._mem.bid.precision,
+                    quote._mem.ask.precision,
+                    "bid.precision",
+                    "ask.precision",
+                )
+                Condition.equal(
+                    quote._mem.bid_size.precision,
+                    quote._mem.ask_size.precision,
+                    "bid_size.precision",
+                    "ask_size.precision",
+                )
+                kinds[i] = ColumnarDataKind.QUOTE_TICK
+                key_indexes[i] = _key_index(quote.instrument_id, instrument_keys, keys)
+                prices_0[i] = quote._mem.bid.raw
+                prices_1[i] = quote._mem.ask.raw
+                sizes_0[i] = quote._mem.bid_size.raw
+                sizes_1[i] = quote._mem.ask_size.raw
+                price_precs[i] = quote._mem.bid.precision
+                size_precs[i] = quote._mem.bid_size.precision
+            elif isinstance(x_data, TradeTick):
+                trade = x_data
+                kinds[i] = ColumnarDataKind.TRADE_TICK
+                key_indexes[i] = _key_index(trade.instrument_id, instrument_keys, keys)
+                prices_0[i] = trade._mem.price.raw
+                sizes_0[i] = trade._mem.size.raw
+                price_precs[i] = trade._mem.price.precision
+                size_precs[i] = trade._mem.size.precision
+                sides[i] = <uint8_t>trade._mem.aggressor_side
+                trade_ids[i] = trade.trade_id.value.encode()
+            else:
+                bar = x_data
+                kinds[i] = ColumnarDataKind.BAR
+                key_indexes[i] = _key_index(bar.bar_type, bar_keys, keys)
+                prices_0[i] = bar._mem.open.raw
+                prices_1[i] = bar._mem.high.raw
+                prices_2[i] = bar._mem.low.raw
+                prices_3[i] = bar._mem.close.raw
+                sizes_0[i] = bar._mem.volume.raw
+                price_precs[i] = bar._mem.close.precision
+                size_precs[i] = bar._mem.volume.precision
+
+        if has_trades:
+            columns["trade_id"] = np.array(trade_ids, dtype=np.bytes_)
+
+        return ColumnarDataStream(keys, columns)
+
+
+cdef uint32_t _key_index(object key, dict key_indexes, list keys) except *:
+    cdef object index = key_indexes.get(key)
+    if index is None:
+        index = len(keys)
+        key_indexes[key] = index
+        keys.append(key)
+    return index
+
+
+cdef dict _read_file_header(path):
+    with open(path, "rb") as f:
+        prefix = f.read(len(_FILE_MAGIC) + 8)
+        Condition.equal(prefix[:len(_FILE_MAGIC)], _FILE_MAGIC, "magic", "_FILE_MAGIC")
+        header_len = int.from_bytes(prefix[len(_FILE_MAGIC):], "little")
+        header = json.loads(f.read(header_len))
+        Condition.equal(header.get("version"), _FILE_VERSION, "version", "_FILE_VERSION")
+
+        data_start = len(_FILE_MAGIC) + 8 + header_len
+        header["data_start"] = data_start + (-data_start % _FILE_ALIGNMENT)
+        return header
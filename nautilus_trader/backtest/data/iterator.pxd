@@ -0,0 +1,43 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.data cimport Data
+
+
+cdef class IteratorDataStream:
+    cdef readonly uint64_t position
+    """The number of elements consumed since the last reset.\n\n:returns: `uint64`"""
+
+    cdef object _source
+    cdef bint _chunked
+    cdef int _buffer_size
+    cdef bint _is_source_consumed
+    cdef bint _has_source_data
+    cdef uint64_t _first_ts_init
+    cdef object _iterator
+    cdef list _buffer
+    cdef uint64_t _offset
+    cdef uint64_t _last_ts_init
+
+    cpdef void reset(self) except *
+    cdef bint has_next_c(self) except *
+    cdef uint64_t peek_ts_init_c(self) except *
+    cdef Data next_c(self)
+    cdef uint64_t seek_c(self, uint64_t ts_init) except *
+    cdef object _new_iterator(self)
+    cdef void _check_pass_start(self, Data first) except *
+    cdef void _fill_buffer(self) except *
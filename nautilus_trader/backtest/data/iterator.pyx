@@ -0,0 +1,194 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from itertools import chain
+from itertools import islice
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.data cimport Data
+
+
+cdef class IteratorDataStream:
+    """
+    Provides a forward-only stream of data pulled lazily from an iterable source.
+
+    Only a single buffer of data is held in memory at a time, so the size of the
+    source is not limited by available memory. The source must yield data sorted
+    by `ts_init`.
+
+    Parameters
+    ----------
+    source : Iterable[Data] or Callable[[], Iterable[Data]]
+        The data source. If callable, then it is called to obtain a new iterable
+        each time the stream is reset (required to re-run a backtest over sources
+        which can only be iterated once, such as a `ParquetReader`). A generator
+        or `ParquetReader` passed directly can only be iterated once, and another
+        pass over it raises a `RuntimeError`.
+    chunked : bool, default False
+        If the source yields lists of data (such as a `ParquetReader`) rather than
+        individual data elements. Each chunk is then used as the buffer.
+    buffer_size : int, default 10_000
+        The number of data elements to buffer from a source which is not chunked.
+
+    Raises
+    ------
+    ValueError
+        If `buffer_size` is not positive (> 0).
+    """
+
+    def __init__(
+        self,
+        source not None,
+        bint chunked = False,
+        int buffer_size = 10_000,
+    ):
+        Condition.positive_int(buffer_size, "buffer_size")
+
+        self.position = 0
+
+        self._source = source
+        self._chunked = chunked
+        self._buffer_size = buffer_size
+        self._is_source_consumed = False
+        self._has_source_data = False
+        self._first_ts_init = 0
+        self._iterator = None
+        self._buffer = []
+        self._offset = 0
+        self._last_ts_init = 0
+
+    def __iter__(self):
+        # A separate pass over the source, independent of the stream position
+        cdef object iterator = self._new_iterator()
+        if self._chunked:
+            iterator = chain.from_iterable(iterator)
+
+        cdef object first = next(iterator, None)
+        self._check_pass_start(first)
+        if first is None:
+            return
+
+        yield first
+        yield from iterator
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"source={self._source!r}, "
+            f"chunked={self._chunked}, "
+            f"position={self.position})"
+        )
+
+    cpdef void reset(self) except *:
+        """
+        Reset the stream to the start of a new pass over the source.
+
+        Raises
+        ------
+        RuntimeError
+            If the source is an iterator which has already been consumed.
+        RuntimeError
+            If the source does not start again from the beginning of its data.
+
+        """
+        self._iterator = self._new_iterator()
+        self._buffer = []
+        self._offset = 0
+        self._last_ts_init = 0
+        self.position = 0
+        self._fill_buffer()
+        self._check_pass_start(self._buffer[0] if self._buffer else None)
+
+    cdef bint has_next_c(self) except *:
+        return self._offset < len(self._buffer)
+
+    cdef uint64_t peek_ts_init_c(self) except *:
+        # Assumes `has_next_c()`
+        return (<Data>self._buffer[self._offset]).ts_init
+
+    cdef Data next_c(self):
+        # Assumes `has_next_c()`
+        cdef Data data = self._buffer[self._offset]
+        if data.ts_init < self._last_ts_init:
+            raise ValueError(
+                f"data source not sorted by `ts_init`, "
+                f"{data.ts_init} was after {self._last_ts_init}",
+            )
+        self._last_ts_init = data.ts_init
+
+        self._offset += 1
+        self.position += 1
+        if self._offset == len(self._buffer):
+            self._fill_buffer()
+
+        return data
+
+    cdef uint64_t seek_c(self, uint64_t ts_init) except *:
+        # Consume all data before `ts_init`, returning the stream position
+        while self.has_next_c() and self.peek_ts_init_c() < ts_init:
+            self.next_c()
+        return self.position
+
+    cdef object _new_iterator(self):
+        if callable(self._source):
+            return iter(self._source())
+
+        cdef object iterator = iter(self._source)
+        if iterator is self._source:  # Source is itself an iterator
+            if self._is_source_consumed:
+                raise RuntimeError(
+                    "cannot iterate the data source again, "
+                    "provide a callable which returns a new iterable",
+                )
+            self._is_source_consumed = True
+        return iterator
+
+    cdef void _check_pass_start(self, Data first) except *:
+        # A re-iterable source (such as a `ParquetReader`) may continue from where
+        # the previous pass finished, rather than starting again
+        if callable(self._source):
+            return  # New iterable for each pass
+        if not self._has_source_data:
+            if first is not None:
+                self._has_source_data = True
+                self._first_ts_init = first.ts_init
+            return
+        if first is None or first.ts_init != self._first_ts_init:
+            raise RuntimeError(
+                "data source did not start again from the beginning, "
+                "provide a callable which returns a new iterable",
+            )
+
+    cdef void _fill_buffer(self) except *:
+        # Pull the next non-empty buffer from the source (empty when exhausted)
+        self._buffer = []
+        self._offset = 0
+        if self._iterator is None:
+            return
+
+        cdef object chunk
+        if self._chunked:
+            for chunk in self._iterator:
+                if chunk:
+                    self._buffer = chunk if type(chunk) is list else list(chunk)
+                    return
+        else:
+            self._buffer = list(islice(self._iterator, self._buffer_size))
+            if self._buffer:
+                return
+
+        self._iterator = None  # Exhausted
@@ -0,0 +1,148 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+from nautilus_trader.backtest.data.columnar import ColumnarDataStream
+from nautilus_trader.core.correctness import PyCondition
+
+
+_ALIGNMENT = 8  # Column offsets are aligned to 8 bytes
+
+
+class SharedColumnarDataStream:
+    """
+    Provides a columnar data stream held in a single shared memory block.
+
+    The creating process owns the block, and is responsible for calling
+    `unlink()` once all runs are complete. Instances are picklable as a small
+    handle (block name, keys and column layout), and other processes call
+    `attach()` to obtain a `ColumnarDataStream` reading the block zero-copy.
+
+    Parameters
+    ----------
+    stream : ColumnarDataStream
+        The stream to copy into shared memory.
+
+    Raises
+    ------
+    ValueError
+        If `stream` is empty.
+    """
+
+    def __init__(self, stream: ColumnarDataStream):
+        PyCondition.not_none(stream, "stream")
+        PyCondition.positive_int(len(stream), "len(stream)")
+
+        layout: list[tuple[str, str, tuple[int, ...], int]] = []
+        size = 0
+        for name, values in stream.columns.items():
+            size += -size % _ALIGNMENT
+            layout.append((name, values.dtype.str, values.shape, size))
+            size += values.nbytes
+
+        self._shm: Optional[SharedMemory] = SharedMemory(create=True, size=max(size, 1))
+        self._name: str = self._shm.name
+        self._keys: list = stream.keys
+        self._layout = layout
+        self._is_owner = True
+
+        for name, dtype, shape, offset in layout:
+            view = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+            view[:] = stream.columns[name]
+
+    def __getstate__(self):
+        return self._name, self._keys, self._layout
+
+    def __setstate__(self, state):
+        self._name, self._keys, self._layout = state
+        self._shm = None
+        self._is_owner = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self._name}, keys={len(self._keys)})"
+
+    @property
+    def name(self) -> str:
+        """
+        Return the name of the shared memory block.
+
+        Returns
+        -------
+        str
+
+        """
+        return self._name
+
+    def attach(self) -> ColumnarDataStream:
+        """
+        Return a columnar data stream reading directly from the shared memory block.
+
+        The block must not be unlinked while the returned stream is in use.
+
+        Returns
+        -------
+        ColumnarDataStream
+
+        """
+        if self._shm is None:
+            self._shm = SharedMemory(name=self._name)
+
+        columns: dict[str, np.ndarray] = {}
+        for name, dtype, shape, offset in self._layout:
+            values = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+            values.flags.writeable = False
+            columns[name] = values
+
+        return ColumnarDataStream(self._keys, columns)
+
+    def close(self) -> None:
+        """
+        Close access to the shared memory block from an attached process.
+
+        Streams previously returned by `attach()` in this process must no longer
+        be in use. Does nothing for the creating process (see `unlink()`).
+
+        """
+        if self._is_owner or self._shm is None:
+            return
+
+        self._shm.close()
+        self._shm = None
+
+    def unlink(self) -> None:
+        """
+        Release the shared memory block (only valid for the creating process).
+
+        Streams previously returned by `attach()` in this process must no longer
+        be in use.
+
+        Raises
+        ------
+        RuntimeError
+            If called from a process other than the creator.
+
+        """
+        if not self._is_owner:
+            raise RuntimeError("cannot unlink shared memory not created by this process")
+        if self._shm is None:
+            return  # Already unlinked
+
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
@@ -16,12 +16,18 @@
 from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.backtest.matching_engine cimport OrderMatchingEngine
+from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.clock cimport TimerScheduler
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.portfolio.portfolio cimport Portfolio
 
 
 cdef class BacktestEngine:
@@ -33,6 +39,10 @@ cdef class BacktestEngine:
 
     cdef object _kernel
     cdef DataEngine _data_engine
+    cdef Cache _cache
+    cdef Portfolio _portfolio
+    cdef TimerScheduler _scheduler
+    cdef Profiler _profiler
     cdef str _run_config_id
     cdef UUID4 _run_id
     cdef datetime _run_started
@@ -41,13 +51,34 @@ cdef class BacktestEngine:
     cdef datetime _backtest_end
 
     cdef dict _venues
-    cdef list _data
+    cdef list _data_streams
+    cdef list _data_cursors
+    cdef list _data_tags
+    cdef list _data_series
+    cdef list _data_routes
+    cdef list _data_heap
     cdef uint64_t _data_len
     cdef uint64_t _index
     cdef uint64_t _iteration
+    cdef int _next_tag
+    cdef OrderMatchingEngine _next_route
+    cdef bint _filter_unsubscribed
+    cdef dict _subscribed
+    cdef int _subscribed_command_count
 
     cpdef list list_actors(self)
     cpdef list list_strategies(self)
 
+    cdef list _merged_data(self)
+    cdef void _check_no_lazy_streams(self) except *
+    cdef void _add_stream(self, object stream) except *
+    cdef OrderMatchingEngine _get_matching_engine(self, InstrumentId instrument_id)
+    cdef void _init_data_heap(self, uint64_t start_ns) except *
     cdef Data _next(self)
     cdef list _advance_time(self, uint64_t now_ns)
+    cdef void _process_venues(self, uint64_t now_ns) except *
+    cdef void _process_venue_data(self, Data data) except *
+    cdef void _process_engine_data(self, Data data) except *
+    cdef bint _is_subscribed(self, Data data) except *
+    cdef void _process_unsubscribed_data(self, Data data) except *
+    cdef void _process_profiled(self, Data data) except *
@@ -13,9 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import multiprocessing
 import pickle
+import traceback
 from decimal import Decimal
-from typing import Optional, Union
+from heapq import heapify
+from heapq import heappop
+from heapq import heapreplace
+from heapq import merge
+from multiprocessing.connection import wait
+from time import perf_counter_ns
+from typing import Callable, Optional, Union
 
 import pandas as pd
 
@@ -31,22 +39,29 @@ from nautilus_trader.config.error import InvalidConfiguration
 from nautilus_trader.system.kernel import NautilusKernel
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.backtest.data.columnar cimport ColumnarDataStream
+from nautilus_trader.backtest.data.iterator cimport IteratorDataStream
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
 from nautilus_trader.backtest.data_client cimport BacktestMarketDataClient
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
+from nautilus_trader.backtest.matching_engine cimport OrderMatchingEngine
 from nautilus_trader.backtest.execution_client cimport BacktestExecClient
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.backtest.modules cimport SimulationModule
 from nautilus_trader.cache.base cimport CacheFacade
+from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.common.clock cimport LiveClock
+from nautilus_trader.common.clock cimport TimerScheduler
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.logging cimport LogLevelParser
 from nautilus_trader.common.logging cimport log_memory
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
@@ -58,10 +73,12 @@ from nautilus_trader.model.c_enums.aggregation_source cimport AggregationSource
 from nautilus_trader.model.c_enums.book_type cimport BookType
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
 from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
 from nautilus_trader.model.data.base cimport GenericData
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.identifiers cimport ClientId
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
@@ -69,6 +86,7 @@ from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.orderbook.data cimport OrderBookData
 from nautilus_trader.portfolio.base cimport PortfolioFacade
+from nautilus_trader.portfolio.portfolio cimport Portfolio
 from nautilus_trader.trading.strategy cimport Strategy
 from nautilus_trader.trading.trader cimport Trader
 
@@ -98,6 +116,7 @@ cdef class BacktestEngine:
 
         # Setup components
         self._clock: Clock = LiveClock()  # Real-time for the engine
+        self._scheduler = TimerScheduler()  # Tracks next time event across all test clocks
 
         # Run IDs
         self._run_config_id: Optional[str] = None
@@ -105,11 +124,21 @@ cdef class BacktestEngine:
 
         # Venues and data
         self._venues: dict[Venue, SimulatedExchange] = {}
-        self._data: list[Data] = []
+        self._data_streams: list = []  # Each stream (list or columnar) sorted by `ts_init`
+        self._data_cursors: list[int] = []
+        self._data_tags: list[int] = []  # Data type tag per stream
+        self._data_series: list = []  # Instrument ID(s) per stream (for routing)
+        self._data_routes: list = []  # Matching engine(s) per stream (resolved per run)
+        self._data_heap: list[tuple[int, int]] = []  # (ts_init, stream index)
         self._data_len: uint64_t = 0
         self._index: uint64_t = 0
         self._iteration: uint64_t = 0
 
+        # Subscription filtering (optional)
+        self._filter_unsubscribed = config.filter_unsubscribed_data
+        self._subscribed: dict = {}  # Data key -> if subscribed via the data engine
+        self._subscribed_command_count = 0  # Data engine command count at last check
+
         # Timing
         self._run_started: Optional[datetime] = None
         self._run_finished: Optional[datetime] = None
@@ -135,6 +164,14 @@ cdef class BacktestEngine:
 
         cdef Trader trader = self._kernel.trader
         self._data_engine: DataEngine = self._kernel.data_engine
+        self._cache: Cache = self._kernel.cache
+        self._portfolio: Portfolio = self._kernel.portfolio
+
+        # Setup profiling (optional)
+        self._profiler: Optional[Profiler] = None
+        if config.profile:
+            self._profiler = Profiler()
+            self._kernel.msgbus.set_profiler(self._profiler)
 
         # Setup engine logging
         self._logger = Logger(
@@ -313,12 +350,27 @@ cdef class BacktestEngine:
         """
         Return the engines internal data stream.
 
+        Data from lazily iterated sources added through `add_data_iterator()`
+        is not included, as it is only available while running.
+
         Returns
         -------
         list[Data]
 
         """
-        return self._data.copy()
+        return self._merged_data()
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        """
+        Return the engines profiler (if profiling is enabled).
+
+        Returns
+        -------
+        Profiler or ``None``
+
+        """
+        return self._profiler
 
     @property
     def portfolio(self) -> PortfolioFacade:
@@ -359,6 +411,8 @@ cdef class BacktestEngine:
         bint routing: bool = False,
         bint frozen_account = False,
         bint reject_stop_orders: bool = True,
+        bint bar_single_pass: bool = False,
+        bint bar_low_first: bool = False,
     ) -> None:
         """
         Add a `SimulatedExchange` with the given parameters to the backtest engine.
@@ -394,6 +448,13 @@ cdef class BacktestEngine:
             If the account for this exchange is frozen (balances will not change).
         reject_stop_orders : bool, default True
             If stop orders are rejected on submission if trigger price is in the market.
+        bar_single_pass : bool, default False
+            If idle bars are skipped, where an idle bar is one within whose range no
+            order can match or trigger (and no trailing or expiring orders need
+            managing). Idle bars are processed at their close only, other bars are
+            still sampled as open, high, low and close prices (fills are unchanged).
+        bar_low_first : bool, default False
+            If bar prices are sampled in O-L-H-C order (rather than O-H-L-C).
 
         Raises
         ------
@@ -437,6 +498,8 @@ cdef class BacktestEngine:
             logger=self.kernel.logger,
             frozen_account=frozen_account,
             reject_stop_orders=reject_stop_orders,
+            bar_single_pass=bar_single_pass,
+            bar_low_first=bar_low_first,
         )
 
         self._venues[venue] = exchange
@@ -543,6 +606,12 @@ cdef class BacktestEngine:
         Assumes all data elements are of the same type. Adding lists of varying
         data types could result in incorrect backtest logic.
 
+        Notes
+        -----
+        Each call adds `data` as a separate stream which is sorted once on insert
+        (if not already sorted). Streams are lazily merged by `ts_init` during
+        the run, with ties resolved in the order the streams were added.
+
         """
         Condition.not_empty(data, "data")
         Condition.list_type(data, Data, "data")
@@ -579,14 +648,132 @@ cdef class BacktestEngine:
             if isinstance(first, GenericData):
                 data_prepend_str = f"{type(data[0].data).__name__} "
 
-        # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
+        # Add a copy of data as a separate stream (sorting only if required), so
+        # later changes to the given list cannot affect the cached stream types
+        data = list(data)
+        cdef uint64_t i
+        for i in range(1, len(data)):
+            if data[i].ts_init < data[i - 1].ts_init:
+                data.sort(key=lambda x: x.ts_init)
+                break
+        self._add_stream(data)
 
         self._log.info(
             f"Added {len(data):,} {data_prepend_str}"
             f"{type(first).__name__} element{'' if len(data) == 1 else 's'}.",
         )
 
+    def add_columnar_data(self, ColumnarDataStream data) -> None:
+        """
+        Add the given columnar data stream to the backtest engine.
+
+        Data objects are only materialized from the stream as the run reaches
+        each row, which keeps memory usage proportional to the raw column data.
+
+        Parameters
+        ----------
+        data : ColumnarDataStream
+            The columnar data to add.
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+        ValueError
+            If `instrument_id` for any stream key is not found in the cache.
+        ValueError
+            If a bar type stream key is not externally aggregated.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.positive_int(len(data), "len(data)")
+
+        cdef list instrument_ids = self.kernel.cache.instrument_ids()
+        for key in data.keys:
+            if isinstance(key, BarType):
+                Condition.equal(
+                    key.aggregation_source,
+                    AggregationSource.EXTERNAL,
+                    "bar_type.aggregation_source",
+                    "required source",
+                )
+                instrument_id = key.instrument_id
+            else:
+                instrument_id = key
+            Condition.true(
+                instrument_id in instrument_ids,
+                f"`Instrument` {instrument_id} for the given data not found in the cache. "
+                "Please add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            # Check client has been registered
+            self._add_market_data_client_if_not_exists(instrument_id.venue)
+
+        self._add_stream(data)
+
+        self._log.info(
+            f"Added {len(data):,} columnar data "
+            f"element{'' if len(data) == 1 else 's'} "
+            f"({data.nbytes:,} bytes).",
+        )
+
+    def add_data_iterator(
+        self,
+        source not None,
+        ClientId client_id = None,
+        bint chunked = False,
+        int buffer_size = 10_000,
+    ) -> None:
+        """
+        Add the given data source to the backtest engine, to be iterated lazily
+        during the run.
+
+        Only a single buffer of data from the source is held in memory at a time,
+        allowing backtests over datasets larger than available memory.
+
+        Parameters
+        ----------
+        source : Iterable[Data] or Callable[[], Iterable[Data]]
+            The data source, which must yield data sorted by `ts_init`. If callable,
+            then it is called to obtain a new iterable at the start of each run.
+        client_id : ClientId, optional
+            The data client ID to associate with generic data.
+        chunked : bool, default False
+            If the source yields lists of data (such as a `ParquetReader`) rather
+            than individual data elements.
+        buffer_size : int, default 10_000
+            The number of data elements to buffer from a source which is not chunked.
+
+        Raises
+        ------
+        ValueError
+            If `buffer_size` is not positive (> 0).
+
+        Warnings
+        --------
+        The data is not validated on add. All instruments for the data must have
+        been added through `add_instrument()` prior to running.
+
+        Notes
+        -----
+        A generator (or other iterator) source can only be iterated once, so
+        provide a callable which returns a new iterable to re-run the engine
+        after a reset.
+
+        """
+        cdef IteratorDataStream stream = IteratorDataStream(
+            source=source,
+            chunked=chunked,
+            buffer_size=buffer_size,
+        )
+
+        if client_id is not None:
+            # Check client has been registered
+            self._add_data_client_if_not_exists(client_id)
+
+        self._add_stream(stream)
+
+        self._log.info(f"Added lazy data source {source!r}.")
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -595,8 +782,15 @@ cdef class BacktestEngine:
         -------
         bytes
 
+        Raises
+        ------
+        RuntimeError
+            If data was added through `add_data_iterator()`.
+
         """
-        return pickle.dumps(self._data)
+        self._check_no_lazy_streams()
+
+        return pickle.dumps(self._merged_data())
 
     def load_pickled_data(self, bytes data) -> None:
         """
@@ -616,13 +810,76 @@ cdef class BacktestEngine:
         """
         Condition.not_none(data, "data")
 
-        self._data = pickle.loads(data)
+        cdef list loaded = pickle.loads(data)
+        self.clear_data()
+        self._add_stream(loaded)
 
         self._log.info(
-            f"Loaded {len(self._data):,} data "
-            f"element{'' if len(data) == 1 else 's'} from pickle.",
+            f"Loaded {len(loaded):,} data "
+            f"element{'' if len(loaded) == 1 else 's'} from pickle.",
         )
 
+    def dump_data(self, path) -> None:
+        """
+        Write the internal data stream to the given path in a compact binary
+        columnar format.
+
+        Much faster to write and load than `dump_pickled_data()`, and the file
+        can be memory-mapped on load.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file path to write to.
+
+        Raises
+        ------
+        ValueError
+            If no data has been added to the engine.
+        TypeError
+            If the data contains types other than `QuoteTick`, `TradeTick` or `Bar`.
+        RuntimeError
+            If data was added through `add_data_iterator()`.
+
+        """
+        Condition.not_empty(self._data_streams, "data")
+        self._check_no_lazy_streams()
+
+        cdef list streams = self._data_streams
+        if len(streams) == 1 and isinstance(streams[0], ColumnarDataStream):
+            stream = streams[0]  # Already columnar
+        else:
+            stream = ColumnarDataStream.from_data(self._merged_data())
+
+        stream.to_file(path)
+
+    def load_data(self, path, bint mmap = True) -> None:
+        """
+        Load data written by `dump_data()` into the internal data stream.
+
+        Any existing data is cleared. Data objects are built from the columnar
+        data as the run reaches each row.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file path to read from.
+        mmap : bool, default True
+            If the file should be memory-mapped (read-only), rather than read
+            into memory.
+
+        Raises
+        ------
+        ValueError
+            If `instrument_id` for the data is not found in the cache.
+
+        """
+        Condition.not_none(path, "path")
+
+        cdef ColumnarDataStream stream = ColumnarDataStream.from_file(path, mmap=mmap)
+        self.clear_data()
+        self.add_columnar_data(stream)
+
     def add_actor(self, actor: Actor) -> None:
         """
         Add the given actor to the backtest engine.
@@ -738,6 +995,9 @@ cdef class BacktestEngine:
         self._run_config_id = None
         self._run_id = None
 
+        if self._profiler is not None:
+            self._profiler.reset()
+
         # Reset timing
         self._iteration = 0
         self._index = 0
@@ -755,7 +1015,12 @@ cdef class BacktestEngine:
         Does not clear added instruments.
 
         """
-        self._data.clear()
+        self._data_streams.clear()
+        self._data_cursors.clear()
+        self._data_tags.clear()
+        self._data_series.clear()
+        self._data_routes.clear()
+        self._data_heap.clear()
         self._data_len = 0
         self._index = 0
 
@@ -856,6 +1121,161 @@ cdef class BacktestEngine:
         """
         self._end()
 
+    def run_windows(
+        self,
+        windows: list[tuple],
+        run_config_id: Optional[str] = None,
+    ) -> list[BacktestResult]:
+        """
+        Run a backtest for each of the given time windows over the loaded data.
+
+        The engine is reset before each window (as per `reset()`), so every
+        window starts from the same initial state. The data is not reloaded or
+        re-sorted between windows, the start of each window is located by a
+        binary search over `ts_init` for each data stream. Windows may overlap,
+        such as for a walk-forward study.
+
+        Parameters
+        ----------
+        windows : list[tuple[Union[datetime, str, int], Union[datetime, str, int]]]
+            The (start, end) datetimes (UTC) for each run. A ``None`` start or end
+            runs from the start or to the end of the data respectively.
+        run_config_id : str, optional
+            The tokenized `BacktestRunConfig` ID.
+
+        Returns
+        -------
+        list[BacktestResult]
+            The results of the runs (in windows order).
+
+        Raises
+        ------
+        ValueError
+            If `windows` is empty.
+        ValueError
+            If no data has been added to the engine.
+        ValueError
+            If any window `start` is >= its `end` datetime.
+
+        """
+        Condition.not_empty(windows, "windows")
+
+        cdef list results = []
+        for start, end in windows:
+            if self._run_id is not None:
+                self.reset()
+            self.run(start, end, run_config_id)
+            results.append(self.get_result())
+
+        return results
+
+    def fork_runs(
+        self,
+        variants: list[Callable[["BacktestEngine"], None]],
+        end: Optional[Union[datetime, str, int]] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[BacktestResult]:
+        """
+        Run variants of the backtest from the engines current state (checkpoint).
+
+        Each variant executes in a freshly forked process holding a copy of the
+        engine state at the checkpoint (cache, portfolio, accounts, matching
+        engines, clocks, actor, strategy and indicator state, and data cursors).
+        The variant callable is passed the forked engine to apply its changes
+        (such as strategy parameters), then the run continues to `end` and the
+        backtest result is returned. The state of this engine is not modified.
+
+        The expected sequence is as follows:
+        - Add data and strategies.
+        - Call `run_streaming(end=...)` to run the warm-up period.
+        - Call `fork_runs()` with the variants for the evaluation period.
+
+        Parameters
+        ----------
+        variants : list[Callable[[BacktestEngine], None]]
+            The variant callables to apply to each forked engine.
+        end : Union[datetime, str, int], optional
+            The end datetime (UTC) for the variant runs. If ``None`` runs to the
+            end of the data.
+        max_workers : int, optional
+            The maximum number of concurrent forked processes. If ``None`` then
+            the CPU count is used.
+
+        Returns
+        -------
+        list[BacktestResult]
+            The results of the variant runs (in variants order).
+
+        Raises
+        ------
+        ValueError
+            If `variants` is empty.
+        ValueError
+            If the engine has not yet run (no checkpoint).
+        RuntimeError
+            If any variant run fails (after all variants have completed).
+
+        Warnings
+        --------
+        Requires the 'fork' process start method (not available on Windows).
+
+        """
+        Condition.not_empty(variants, "variants")
+        Condition.true(self._iteration > 0, "engine has not run to a checkpoint")
+        if max_workers is None:
+            max_workers = multiprocessing.cpu_count()
+        Condition.positive_int(max_workers, "max_workers")
+
+        ctx = multiprocessing.get_context("fork")
+        cdef dict results = {}
+        cdef dict failures = {}
+        cdef dict running = {}  # Connection -> (variant index, process)
+        cdef int next_index = 0
+        while next_index < len(variants) or running:
+            while next_index < len(variants) and len(running) < max_workers:
+                receiver, sender = ctx.Pipe(duplex=False)
+                process = ctx.Process(
+                    target=self._fork_run,
+                    args=(sender, variants[next_index], end),
+                    daemon=True,
+                )
+                process.start()
+                sender.close()  # Only the child holds the sending end
+                running[receiver] = (next_index, process)
+                next_index += 1
+            for receiver in wait(list(running.keys())):
+                i, process = running.pop(receiver)
+                try:
+                    success, value = receiver.recv()
+                except EOFError:
+                    success, value = False, "forked process exited without a result"
+                receiver.close()
+                process.join()
+                if success:
+                    results[i] = value
+                else:
+                    failures[i] = value
+
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)} of {len(variants)} forked variant runs failed:\n"
+                + "\n".join([failures[i] for i in sorted(failures)]),
+            )
+
+        return [results[i] for i in range(len(variants))]
+
+    def _fork_run(self, sender, variant, end) -> None:
+        # Executes within the forked process
+        try:
+            variant(self)
+            self._run(end=end, run_config_id=self._run_config_id, resume=True)
+            self._end()
+            sender.send((True, self.get_result()))
+        except Exception as e:
+            sender.send((False, "".join(traceback.format_exception(type(e), e, e.__traceback__))))
+        finally:
+            sender.close()
+
     def get_result(self):
         """
         Return the backtest result from the last run.
@@ -887,6 +1307,7 @@ cdef class BacktestEngine:
             total_positions=self._kernel.cache.positions_total_count(),
             stats_pnls=stats_pnls,
             stats_returns=self._kernel.portfolio.analyzer.get_performance_stats_returns(),
+            stats_profile=self._profiler.stats() if self._profiler is not None else None,
         )
 
     def _run(
@@ -894,31 +1315,51 @@ cdef class BacktestEngine:
         start: Optional[Union[datetime, str, int]] = None,
         end: Optional[Union[datetime, str, int]] = None,
         run_config_id: Optional[str] = None,
+        bint resume = False,
     ):
+        Condition.not_empty(self._data_streams, "data")
+
         cdef uint64_t start_ns
         cdef uint64_t end_ns
         # Time range check and set
-        if start is None:
-            # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+        if resume:
+            # Continue from the current clock time and data cursors
+            start_ns = self.kernel.clock.timestamp_ns()
             start = unix_nanos_to_dt(start_ns)
         else:
-            start = pd.to_datetime(start, utc=True)
-            start_ns = int(start.to_datetime64())
-        if end is None:
+            # Begin a new pass over any lazily iterated data sources
+            for stream in self._data_streams:
+                if type(stream) is IteratorDataStream:
+                    (<IteratorDataStream>stream).reset()
+            if start is None:
+                # Set `start` to start of data
+                streams = [s for s in self._data_streams if _stream_has(s, 0)]
+                Condition.not_empty(streams, "data")
+                start_ns = min([_stream_ts_init(stream, 0) for stream in streams])
+                start = unix_nanos_to_dt(start_ns)
+            else:
+                start = pd.to_datetime(start, utc=True)
+                start_ns = int(start.to_datetime64())
+        if end is None and any(type(s) is IteratorDataStream for s in self._data_streams):
+            # End of lazily iterated data is unknown until reached
+            end_ns = UINT64_MAX
+        elif end is None:
             # Set `end` to end of data
-            end_ns = self._data[-1].ts_init
+            end_ns = max([_stream_ts_init(stream, len(stream) - 1) for stream in self._data_streams])
             end = unix_nanos_to_dt(end_ns)
         else:
             end = pd.to_datetime(end, utc=True)
             end_ns = int(end.to_datetime64())
         Condition.true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
 
-        # Set clocks
-        self.kernel.clock.set_time(start_ns)
-        for actor in self._kernel.trader.actors() + self._kernel.trader.strategies():
-            actor.clock.set_time(start_ns)
+        if not resume:
+            # Set clocks
+            self._scheduler.clear()
+            self.kernel.clock.set_time(start_ns)
+            for actor in self._kernel.trader.actors() + self._kernel.trader.strategies():
+                actor.clock.set_time(start_ns)
+                self._scheduler.register_clock(actor.clock)
+            self._scheduler.register_clock(self.kernel.clock)
 
         cdef SimulatedExchange exchange
         if self._iteration == 0:
@@ -940,44 +1381,132 @@ cdef class BacktestEngine:
 
         self._log_run(start, end)
 
-        # Set data stream length
-        self._data_len = len(self._data)
-
-        # Set starting index
-        cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        if not resume:
+            # Set starting cursors for each data stream
+            self._init_data_heap(start_ns)
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef list now_events
-        cdef Data data = self._next()
-        while data is not None:
-            if data.ts_init > end_ns:
-                break
+        cdef Data data
+        while self._data_heap:
+            if self._data_heap[0][0] > end_ns:
+                break  # Leave the cursors at the next unprocessed data
+            data = self._next()
+            if self._profiler is not None:
+                self._process_profiled(data)
+                self._iteration += 1
+                continue
             now_events = self._advance_time(data.ts_init)
-            if isinstance(data, OrderBookData):
-                self._venues[data.instrument_id.venue].process_order_book(data)
-            elif isinstance(data, QuoteTick):
-                self._venues[data.instrument_id.venue].process_quote_tick(data)
-            elif isinstance(data, TradeTick):
-                self._venues[data.instrument_id.venue].process_trade_tick(data)
-            elif isinstance(data, Bar):
-                self._venues[data.bar_type.instrument_id.venue].process_bar(data)
-            self._data_engine.process(data)
+            self._process_venue_data(data)
+            self._process_engine_data(data)
             for event_handler in now_events:
                 event_handler.handle()
-            for exchange in self._venues.values():
-                exchange.process(data.ts_init)
+            self._process_venues(data.ts_init)
             self._iteration += 1
-            data = self._next()
         # ---------------------------------------------------------------------#
         # Process remaining messages
         for exchange in self._venues.values():
             exchange.process(self.kernel.clock.timestamp_ns())
         # ---------------------------------------------------------------------#
 
+    cdef void _process_profiled(self, Data data) except *:
+        # Equivalent to the main loop body, with each stage timed
+        cdef uint64_t ts_start = perf_counter_ns()
+        cdef list now_events = self._advance_time(data.ts_init)
+        cdef uint64_t ts_timers = perf_counter_ns() - ts_start
+
+        ts_start = perf_counter_ns()
+        self._process_venue_data(data)
+        self._profiler.record("SimulatedExchange.process_data", perf_counter_ns() - ts_start)
+
+        ts_start = perf_counter_ns()
+        self._process_engine_data(data)
+        self._profiler.record("DataEngine.process", perf_counter_ns() - ts_start)
+
+        ts_start = perf_counter_ns()
+        for event_handler in now_events:
+            event_handler.handle()
+        self._profiler.record("Timer events", ts_timers + perf_counter_ns() - ts_start)
+
+        ts_start = perf_counter_ns()
+        self._process_venues(data.ts_init)
+        self._profiler.record("SimulatedExchange.process", perf_counter_ns() - ts_start)
+
+    cdef void _process_venues(self, uint64_t now_ns) except *:
+        # Only venues with queued or due commands (or modules) need processing
+        cdef SimulatedExchange exchange
+        for exchange in self._venues.values():
+            if exchange.has_pending_work(now_ns):
+                exchange.process(now_ns)
+
+    cdef void _process_venue_data(self, Data data) except *:
+        # Dispatch on the tag resolved by `_next` straight to the matching engine
+        cdef int tag = self._next_tag
+        if tag == _TAG_QUOTE_TICK:
+            self._next_route.process_quote_tick(<QuoteTick>data)
+        elif tag == _TAG_TRADE_TICK:
+            self._next_route.process_trade_tick(<TradeTick>data)
+        elif tag == _TAG_BAR:
+            self._next_route.process_bar(<Bar>data)
+        elif tag == _TAG_ORDER_BOOK:
+            self._next_route.process_order_book(<OrderBookData>data)
+
+    cdef void _process_engine_data(self, Data data) except *:
+        # Dispatch on the tag resolved by `_next` straight to the data handler
+        cdef int tag = self._next_tag
+        if self._filter_unsubscribed and tag <= _TAG_BAR and not self._is_subscribed(data):
+            self._process_unsubscribed_data(data)
+            return
+
+        if tag == _TAG_QUOTE_TICK:
+            self._data_engine.process_quote_tick_c(<QuoteTick>data)
+        elif tag == _TAG_TRADE_TICK:
+            self._data_engine.process_trade_tick_c(<TradeTick>data)
+        elif tag == _TAG_BAR:
+            self._data_engine.process_bar_c(<Bar>data)
+        elif tag == _TAG_ORDER_BOOK:
+            self._data_engine.process_order_book_c(<OrderBookData>data)
+        else:
+            self._data_engine.process(data)
+
+    cdef bint _is_subscribed(self, Data data) except *:
+        # Return whether any component subscribed to the tick or bar data through
+        # the data engine (subscriptions can only change with a data command)
+        if self._data_engine.command_count != self._subscribed_command_count:
+            self._subscribed.clear()
+            self._subscribed_command_count = self._data_engine.command_count
+
+        cdef int tag = self._next_tag
+        cdef object key
+        if tag == _TAG_BAR:
+            key = (<Bar>data).bar_type
+        else:
+            key = (tag, self._next_route.instrument.id)
+
+        cdef object subscribed = self._subscribed.get(key)
+        if subscribed is None:
+            if tag == _TAG_QUOTE_TICK:
+                subscribed = key[1] in self._data_engine.subscribed_quote_ticks()
+            elif tag == _TAG_TRADE_TICK:
+                subscribed = key[1] in self._data_engine.subscribed_trade_ticks()
+            else:
+                subscribed = key in self._data_engine.subscribed_bars()
+            self._subscribed[key] = subscribed
+
+        return subscribed
+
+    cdef void _process_unsubscribed_data(self, Data data) except *:
+        # Keep the latest data in the cache (as the data engine would), and the
+        # latest prices available to the portfolio and risk engine
+        cdef int tag = self._next_tag
+        if tag == _TAG_QUOTE_TICK:
+            self._cache.add_quote_tick(<QuoteTick>data)
+            self._portfolio.update_quote_tick(<QuoteTick>data)
+        elif tag == _TAG_TRADE_TICK:
+            self._cache.add_trade_tick(<TradeTick>data)
+        elif tag == _TAG_BAR:
+            self._cache.add_bar(<Bar>data)
+
     def _end(self):
         if self.kernel.trader.is_running:
             self.kernel.trader.stop()
@@ -999,29 +1528,138 @@ cdef class BacktestEngine:
 
         self._log_post_run()
 
+    cdef list _merged_data(self):
+        # Lazily iterated streams are excluded, they would be read in full
+        cdef list streams = [s for s in self._data_streams if type(s) is not IteratorDataStream]
+        if len(streams) == 1:
+            return list(streams[0])
+        return list(merge(*streams, key=lambda x: x.ts_init))
+
+    cdef void _check_no_lazy_streams(self) except *:
+        if any(type(s) is IteratorDataStream for s in self._data_streams):
+            raise RuntimeError(
+                "cannot dump data from lazily iterated sources, "
+                "add the data with `add_data()` instead",
+            )
+
+    cdef void _add_stream(self, object stream) except *:
+        # Precompute the type tag and routing series once for the whole stream
+        cdef int tag
+        cdef object series
+        if type(stream) is list:
+            tag, series = _list_stream_series(stream)
+        elif type(stream) is IteratorDataStream:
+            tag, series = _TAG_MIXED, None  # Unknown until iterated
+        else:
+            tag = _TAG_COLUMNAR
+            series = [
+                key.instrument_id if isinstance(key, BarType) else key
+                for key in (<ColumnarDataStream>stream).keys
+            ]
+
+        self._data_streams.append(stream)
+        self._data_tags.append(tag)
+        self._data_series.append(series)
+        if type(stream) is not IteratorDataStream:
+            self._data_len += len(stream)
+
+    cdef OrderMatchingEngine _get_matching_engine(self, InstrumentId instrument_id):
+        cdef SimulatedExchange exchange = self._venues.get(instrument_id.venue)
+        if exchange is None:
+            return None
+        return exchange.get_matching_engine(instrument_id)
+
+    cdef void _init_data_heap(self, uint64_t start_ns) except *:
+        self._data_cursors.clear()
+        self._data_heap.clear()
+        self._index = 0
+        self._subscribed.clear()
+
+        # Resolve the matching engine(s) for each stream once per run
+        self._data_routes.clear()
+        cdef int tag
+        cdef object series
+        for tag, series in zip(self._data_tags, self._data_series):
+            if tag == _TAG_COLUMNAR:
+                self._data_routes.append([self._get_matching_engine(x) for x in series])
+            elif series is not None:
+                self._data_routes.append(self._get_matching_engine(series))
+            else:
+                self._data_routes.append(None)
+
+        cdef:
+            int i
+            object stream
+            uint64_t lo
+            uint64_t hi
+            uint64_t mid
+        for i, stream in enumerate(self._data_streams):
+            if type(stream) is IteratorDataStream:
+                # Forward-only, so skip over data before `start_ns`
+                lo = (<IteratorDataStream>stream).seek_c(start_ns)
+            else:
+                # Binary search for the first element at or after `start_ns`
+                lo = 0
+                hi = len(stream)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if _stream_ts_init(stream, mid) < start_ns:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+            self._data_cursors.append(lo)
+            self._index += lo
+            if _stream_has(stream, lo):
+                self._data_heap.append((_stream_ts_init(stream, lo), i))
+
+        heapify(self._data_heap)
+
     cdef Data _next(self):
-        cdef uint64_t cursor = self._index
+        if not self._data_heap:
+            return None
+
+        cdef int i = self._data_heap[0][1]
+        cdef object stream = self._data_streams[i]
+        cdef uint64_t cursor = self._data_cursors[i]
+        cdef Data data = _stream_get(stream, cursor)
+
+        # Resolve the type tag and matching engine for dispatch
+        cdef int tag = self._data_tags[i]
+        cdef object route = self._data_routes[i]
+        if tag == _TAG_COLUMNAR:
+            tag = (<ColumnarDataStream>stream).kind_c(cursor)
+            route = (<list>route)[(<ColumnarDataStream>stream).key_c(cursor)]
+        elif tag == _TAG_MIXED:
+            tag = _data_tag(data)
+        if route is None and tag != _TAG_OTHER:
+            instrument_id = _data_instrument_id(data, tag)
+            route = self._get_matching_engine(instrument_id)
+            if route is None:
+                raise RuntimeError(f"No matching engine found for {instrument_id}")
+        self._next_tag = tag
+        self._next_route = <OrderMatchingEngine>route
+
+        cursor += 1
+        self._data_cursors[i] = cursor
+        if _stream_has(stream, cursor):
+            heapreplace(self._data_heap, (_stream_ts_init(stream, cursor), i))
+        else:
+            heappop(self._data_heap)
+
         self._index += 1
-        if cursor < self._data_len:
-            return self._data[cursor]
+        return data
 
     cdef list _advance_time(self, uint64_t now_ns):
-        cdef list all_events = []  # type: list[TimeEventHandler]
-        cdef list now_events = []  # type: list[TimeEventHandler]
-
-        cdef Actor actor
-        for actor in self._kernel.trader.actors():
-            all_events += actor.clock.advance_time(now_ns)
-
-        cdef Strategy strategy
-        for strategy in self._kernel.trader.strategies():
-            all_events += strategy.clock.advance_time(now_ns)
+        # Clocks are only advanced once `now_ns` reaches the next time event
+        cdef list all_events = self._scheduler.advance_time(now_ns)  # type: list[TimeEventHandler]
+        if not all_events:
+            return all_events
 
-        all_events += self.kernel.clock.advance_time(now_ns)
+        cdef list now_events = []  # type: list[TimeEventHandler]
 
         # Handle all events prior to the `now_ns`
         cdef TimeEventHandler event_handler
-        for event_handler in sorted(all_events):
+        for event_handler in all_events:
             if event_handler.event.ts_event == now_ns:
                 now_events.append(event_handler)
                 continue
@@ -1047,7 +1685,7 @@ cdef class BacktestEngine:
                 for b in account.starting_balances().values():
                     self._log.info(b.to_str())
 
-    def _log_run(self, start: pd.Timestamp, end: pd.Timestamp):
+    def _log_run(self, start: pd.Timestamp, end: Optional[pd.Timestamp]):
         self._log.info("\033[36m=================================================================")
         self._log.info("\033[36m BACKTEST RUN")
         self._log.info("\033[36m=================================================================")
@@ -1056,7 +1694,7 @@ cdef class BacktestEngine:
         self._log.info(f"Run started:    {self._run_started}")
         self._log.info(f"Backtest start: {self._backtest_start}")
         self._log.info(f"Batch start:    {start}")
-        self._log.info(f"Batch end:      {end}")
+        self._log.info(f"Batch end:      {end if end is not None else 'end of data'}")
         self._log.info("\033[36m-----------------------------------------------------------------")
 
     def _log_post_run(self):
@@ -1082,6 +1720,13 @@ cdef class BacktestEngine:
 
         self._log.info(f"Total positions: {len(positions):,}")
 
+        if self._profiler is not None:
+            self._log.info("\033[36m=================================================================")
+            self._log.info("\033[36m PROFILE (inclusive wall time per stage)")
+            self._log.info("\033[36m=================================================================")
+            for line in self._profiler.format_table():
+                self._log.info(line)
+
         if not self._config.run_analysis:
             return
 
@@ -1176,3 +1821,78 @@ cdef class BacktestEngine:
                 logger=self._kernel.logger,
             )
             self._kernel.data_engine.register_client(client)
+
+
+# Data type tags for dispatch in the main loop (tick and bar values match `ColumnarDataKind`)
+cdef enum:
+    _TAG_QUOTE_TICK = 0
+    _TAG_TRADE_TICK = 1
+    _TAG_BAR = 2
+    _TAG_ORDER_BOOK = 3
+    _TAG_OTHER = 4
+    _TAG_MIXED = 5  # List stream of varying types (tagged per element)
+    _TAG_COLUMNAR = 6  # Columnar stream (tagged per row)
+
+
+cdef int _data_tag(Data data) except -1:
+    if isinstance(data, OrderBookData):
+        return _TAG_ORDER_BOOK
+    elif isinstance(data, QuoteTick):
+        return _TAG_QUOTE_TICK
+    elif isinstance(data, TradeTick):
+        return _TAG_TRADE_TICK
+    elif isinstance(data, Bar):
+        return _TAG_BAR
+    return _TAG_OTHER
+
+
+cdef InstrumentId _data_instrument_id(Data data, int tag):
+    if tag == _TAG_QUOTE_TICK:
+        return (<QuoteTick>data).instrument_id
+    elif tag == _TAG_TRADE_TICK:
+        return (<TradeTick>data).instrument_id
+    elif tag == _TAG_BAR:
+        return (<Bar>data).bar_type.instrument_id
+    elif tag == _TAG_ORDER_BOOK:
+        return (<OrderBookData>data).instrument_id
+    return None
+
+
+cdef tuple _list_stream_series(list data):
+    # Return the type tag and instrument ID shared by every element of the
+    # stream, or `_TAG_MIXED` / ``None`` where they vary
+    cdef Data first = data[0]
+    cdef type cls = type(first)
+    cdef int tag = _data_tag(first)
+    cdef InstrumentId instrument_id = _data_instrument_id(first, tag)
+
+    cdef Data x
+    for x in data:
+        if type(x) is not cls:
+            return _TAG_MIXED, None
+        if instrument_id is not None and _data_instrument_id(x, tag) != instrument_id:
+            instrument_id = None
+
+    return tag, instrument_id
+
+
+cdef inline bint _stream_has(object stream, uint64_t index) except *:
+    if type(stream) is IteratorDataStream:
+        return (<IteratorDataStream>stream).has_next_c()  # Forward-only
+    return index < len(stream)
+
+
+cdef inline uint64_t _stream_ts_init(object stream, uint64_t index) except *:
+    if type(stream) is list:
+        return (<Data>(<list>stream)[index]).ts_init
+    elif type(stream) is IteratorDataStream:
+        return (<IteratorDataStream>stream).peek_ts_init_c()  # Forward-only
+    return (<ColumnarDataStream>stream).ts_init_c(index)
+
+
+cdef inline Data _stream_get(object stream, uint64_t index):
+    if type(stream) is list:
+        return (<list>stream)[index]
+    elif type(stream) is IteratorDataStream:
+        return (<IteratorDataStream>stream).next_c()  # Forward-only
+    return (<ColumnarDataStream>stream).get_c(index)
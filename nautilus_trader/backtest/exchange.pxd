@@ -17,6 +17,7 @@ from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.backtest.execution_client cimport BacktestExecClient
+from nautilus_trader.backtest.matching_engine cimport OrderMatchingEngine
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.cache.cache cimport Cache
@@ -76,6 +77,10 @@ cdef class SimulatedExchange:
     """The fill model for the exchange.\n\n:returns: `FillModel`"""
     cdef readonly bint reject_stop_orders
     """If stop orders are rejected on submission if in the market.\n\n:returns: `bool`"""
+    cdef readonly bint bar_single_pass
+    """If bars are processed in a single pass when nothing is crossed within their range.\n\n:returns: `bool`"""
+    cdef readonly bint bar_low_first
+    """If bar prices are sampled in O-L-H-C order (rather than O-H-L-C).\n\n:returns: `bool`"""
     cdef readonly list modules
     """The simulation modules registered with the exchange.\n\n:returns: `list[SimulationModule]`"""
     cdef readonly dict instruments
@@ -84,7 +89,7 @@ cdef class SimulatedExchange:
     cdef dict _matching_engines
     cdef Queue _message_queue
     cdef list _inflight_queue
-    cdef dict _inflight_counter
+    cdef uint64_t _inflight_seq
 
 # -- REGISTRATION ---------------------------------------------------------------------------------
 
@@ -99,6 +104,7 @@ cdef class SimulatedExchange:
     cpdef Price best_bid_price(self, InstrumentId instrument_id)
     cpdef Price best_ask_price(self, InstrumentId instrument_id)
     cpdef OrderBook get_book(self, InstrumentId instrument_id)
+    cpdef OrderMatchingEngine get_matching_engine(self, InstrumentId instrument_id)
     cpdef dict get_matching_engines(self)
     cpdef dict get_books(self)
     cpdef list get_open_orders(self, InstrumentId instrument_id=*)
@@ -115,6 +121,7 @@ cdef class SimulatedExchange:
     cpdef void process_quote_tick(self, QuoteTick tick) except *
     cpdef void process_trade_tick(self, TradeTick tick) except *
     cpdef void process_bar(self, Bar bar) except *
+    cpdef bint has_pending_work(self, uint64_t now_ns) except *
     cpdef void process(self, uint64_t now_ns) except *
     cpdef void reset(self) except *
 
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
+from heapq import heappop
 from heapq import heappush
 from typing import Optional
 
@@ -95,6 +96,13 @@ cdef class SimulatedExchange:
         If the account for this exchange is frozen (balances will not change).
     reject_stop_orders : bool, default True
         If stop orders are rejected on submission if in the market.
+    bar_single_pass : bool, default False
+        If idle bars are skipped, where an idle bar is one within whose range no
+        order can match or trigger (and no trailing or expiring orders need
+        managing). Idle bars are processed at their close only, other bars are
+        still sampled as open, high, low and close prices (fills are unchanged).
+    bar_low_first : bool, default False
+        If bar prices are sampled in O-L-H-C order (rather than O-H-L-C).
 
     Raises
     ------
@@ -132,6 +140,8 @@ cdef class SimulatedExchange:
         BookType book_type = BookType.L1_TBBO,
         bint frozen_account = False,
         bint reject_stop_orders = True,
+        bint bar_single_pass = False,
+        bint bar_low_first = False,
     ):
         Condition.list_type(instruments, Instrument, "instruments", "Instrument")
         Condition.not_empty(starting_balances, "starting_balances")
@@ -167,6 +177,8 @@ cdef class SimulatedExchange:
 
         # Execution
         self.reject_stop_orders = reject_stop_orders
+        self.bar_single_pass = bar_single_pass
+        self.bar_low_first = bar_low_first
         self.fill_model = fill_model
         self.latency_model = latency_model
 
@@ -187,8 +199,8 @@ cdef class SimulatedExchange:
             self.add_instrument(instrument)
 
         self._message_queue = Queue()
-        self._inflight_queue: list[tuple[(uint64_t, uint64_t), TradingCommand]] = []
-        self._inflight_counter: dict[uint64_t, int] = {}
+        self._inflight_queue: list[tuple[int, int, TradingCommand]] = []  # Heap of (ts, seq, command)
+        self._inflight_seq = 0  # Monotonic tie-breaker for commands due at the same time
 
     def __repr__(self) -> str:
         return (
@@ -306,6 +318,8 @@ cdef class SimulatedExchange:
             cache=self.cache,
             clock=self._clock,
             logger=self._log.get_logger(),
+            bar_single_pass=self.bar_single_pass,
+            bar_low_first=self.bar_low_first,
         )
 
         self._matching_engines[instrument.id] = matching_engine
@@ -380,6 +394,24 @@ cdef class SimulatedExchange:
 
         return matching_engine.get_book()
 
+    cpdef OrderMatchingEngine get_matching_engine(self, InstrumentId instrument_id):
+        """
+        Return the matching engine for the given instrument ID (if found).
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the matching engine.
+
+        Returns
+        -------
+        OrderMatchingEngine or ``None``
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        return self._matching_engines.get(instrument_id)
+
     cpdef dict get_matching_engines(self):
         return self._matching_engines.copy()
 
@@ -561,6 +593,7 @@ cdef class SimulatedExchange:
             heappush(self._inflight_queue, self.generate_inflight_command(command))
 
     cdef tuple generate_inflight_command(self, TradingCommand command):
+        # Return the heap entry for the command, ordered by arrival time then send order
         cdef uint64_t ts
         if isinstance(command, (SubmitOrder, SubmitOrderList)):
             ts = command.ts_init + self.latency_model.insert_latency_nanos
@@ -570,11 +603,8 @@ cdef class SimulatedExchange:
             ts = command.ts_init + self.latency_model.cancel_latency_nanos
         else:
             raise ValueError(f"invalid `TradingCommand`, was {command}")  # pragma: no cover (design-time error)
-        if ts not in self._inflight_counter:
-            self._inflight_counter[ts] = 0
-        self._inflight_counter[ts] += 1
-        cdef (uint64_t, uint64_t) key = (ts, self._inflight_counter[ts])
-        return key, command
+        self._inflight_seq += 1
+        return ts, self._inflight_seq, command
 
     cpdef void process_order_book(self, OrderBookData data) except *:
         """
@@ -654,6 +684,30 @@ cdef class SimulatedExchange:
 
         matching_engine.process_bar(bar)
 
+    cpdef bint has_pending_work(self, uint64_t now_ns) except *:
+        """
+        Return a value indicating whether processing the exchange at the given
+        time would do any work.
+
+        This is the case when there are queued commands, in-flight commands
+        due at or before `now_ns`, or simulation modules to tick.
+
+        Parameters
+        ----------
+        now_ns : uint64_t
+            The UNIX timestamp (nanoseconds) now.
+
+        Returns
+        -------
+        bool
+
+        """
+        if self._message_queue.count > 0 or self.modules:
+            return True
+        if not self._inflight_queue:
+            return False
+        return self._inflight_queue[0][0] <= now_ns
+
     cpdef void process(self, uint64_t now_ns) except *:
         """
         Process the exchange to the gives time.
@@ -668,17 +722,9 @@ cdef class SimulatedExchange:
         """
         self._clock.set_time(now_ns)
 
-        cdef:
-            uint64_t ts
-        while self._inflight_queue:
-            # Peek at timestamp of next in-flight message
-            ts = self._inflight_queue[0][0][0]
-            if ts <= now_ns:
-                # Place message on queue to be processed
-                self._message_queue.put_nowait(self._inflight_queue.pop(0)[1])
-                self._inflight_counter.pop(ts, None)
-            else:
-                break
+        # Place all in-flight messages which have arrived on the queue to be processed
+        while self._inflight_queue and self._inflight_queue[0][0] <= now_ns:
+            self._message_queue.put_nowait(heappop(self._inflight_queue)[2])
 
         cdef:
             TradingCommand command
@@ -721,7 +767,7 @@ cdef class SimulatedExchange:
 
         self._message_queue = Queue()
         self._inflight_queue.clear()
-        self._inflight_counter.clear()
+        self._inflight_seq = 0
 
         self._log.info("Reset.")
 
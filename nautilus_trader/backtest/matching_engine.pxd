@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.models cimport FillModel
@@ -62,6 +63,8 @@ cdef class OrderMatchingEngine:
     cdef OrderBook _book
     cdef FillModel _fill_model
     cdef bint _reject_stop_orders
+    cdef bint _bar_single_pass
+    cdef bint _bar_low_first
     cdef dict _account_ids
 
     cdef readonly Venue venue
@@ -109,7 +112,19 @@ cdef class OrderMatchingEngine:
     cpdef void process_trade_tick(self, TradeTick tick) except *
     cpdef void process_bar(self, Bar bar) except *
     cdef void _process_trade_ticks_from_bar(self, Bar bar) except *
+    cdef void _process_trade_tick_from_bar_high(self, Bar bar, TradeTick tick) except *
+    cdef void _process_trade_tick_from_bar_low(self, Bar bar, TradeTick tick) except *
+    cdef void _process_trade_bar_single_pass(self, Bar bar) except *
     cdef void _process_quote_ticks_from_bar(self) except *
+    cdef void _process_quote_tick_from_bar_high(self, QuoteTick tick) except *
+    cdef void _process_quote_tick_from_bar_low(self, QuoteTick tick) except *
+    cdef bint _is_bar_single_pass(
+        self,
+        int64_t bid_low_raw,
+        int64_t bid_high_raw,
+        int64_t ask_low_raw,
+        int64_t ask_high_raw,
+    ) except *
 
 # -- TRADING COMMANDS -----------------------------------------------------------------------------
 
@@ -17,6 +17,7 @@ from typing import Optional
 
 from libc.limits cimport INT_MAX
 from libc.limits cimport INT_MIN
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.models cimport FillModel
@@ -100,6 +101,14 @@ cdef class OrderMatchingEngine:
         The clock for the matching engine.
     logger : Logger
         The logger for the matching engine.
+    bar_single_pass : bool, default False
+        If idle bars are skipped, where an idle bar is one within whose range no
+        order can match or trigger (and no trailing or expiring orders need
+        managing). Idle bars are processed at their close only, other bars are
+        still sampled as open, high, low and close prices (fills are identical
+        to sampling each of the bars prices as ticks).
+    bar_low_first : bool, default False
+        If bar prices are sampled in O-L-H-C order (rather than O-H-L-C).
     """
 
     def __init__(
@@ -114,6 +123,8 @@ cdef class OrderMatchingEngine:
         CacheFacade cache not None,
         TestClock clock not None,
         Logger logger not None,
+        bint bar_single_pass = False,
+        bint bar_low_first = False,
     ):
         self._clock = clock
         self._log = LoggerAdapter(
@@ -130,6 +141,8 @@ cdef class OrderMatchingEngine:
         self.oms_type = oms_type
 
         self._reject_stop_orders = reject_stop_orders
+        self._bar_single_pass = bar_single_pass
+        self._bar_low_first = bar_low_first
         self._fill_model = fill_model
         self._book = OrderBook.create(
             instrument=instrument,
@@ -378,6 +391,12 @@ cdef class OrderMatchingEngine:
             )
 
     cdef void _process_trade_ticks_from_bar(self, Bar bar) except *:
+        cdef int64_t low_raw = min(bar._mem.open.raw, bar._mem.high.raw, bar._mem.low.raw, bar._mem.close.raw)
+        cdef int64_t high_raw = max(bar._mem.open.raw, bar._mem.high.raw, bar._mem.low.raw, bar._mem.close.raw)
+        if self._is_bar_single_pass(low_raw, high_raw, low_raw, high_raw):
+            self._process_trade_bar_single_pass(bar)
+            return
+
         cdef Quantity size = Quantity(bar.volume.as_double() / 4.0, bar._mem.volume.precision)
 
         # Create reusable tick
@@ -397,7 +416,23 @@ cdef class OrderMatchingEngine:
             self.iterate(tick.ts_init)
             self._core.set_last(bar._mem.open)
 
-        # High
+        if self._bar_low_first:
+            self._process_trade_tick_from_bar_low(bar, tick)
+            self._process_trade_tick_from_bar_high(bar, tick)
+        else:
+            self._process_trade_tick_from_bar_high(bar, tick)
+            self._process_trade_tick_from_bar_low(bar, tick)
+
+        # Close
+        if bar._mem.close.raw != self._core.last_raw:  # Direct memory comparison
+            tick._mem.price = bar._mem.close  # Direct memory assignment
+            tick._mem.aggressor_side = <OrderSide>AggressorSide.BUY if bar._mem.close.raw > self._core.last_raw else <OrderSide>AggressorSide.SELL
+            tick._mem.trade_id = self._generate_trade_id()._mem
+            self._book.update_trade_tick(tick)
+            self.iterate(tick.ts_init)
+            self._core.set_last(bar._mem.close)
+
+    cdef void _process_trade_tick_from_bar_high(self, Bar bar, TradeTick tick) except *:
         if bar._mem.high.raw > self._core.last_raw:  # Direct memory comparison
             tick._mem.price = bar._mem.high  # Direct memory assignment
             tick._mem.aggressor_side = <OrderSide>AggressorSide.BUY  # Direct memory assignment
@@ -406,7 +441,7 @@ cdef class OrderMatchingEngine:
             self.iterate(tick.ts_init)
             self._core.set_last(bar._mem.high)
 
-        # Low
+    cdef void _process_trade_tick_from_bar_low(self, Bar bar, TradeTick tick) except *:
         if bar._mem.low.raw < self._core.last_raw:  # Direct memory comparison
             tick._mem.price = bar._mem.low  # Direct memory assignment
             tick._mem.aggressor_side = <OrderSide>AggressorSide.SELL
@@ -415,14 +450,47 @@ cdef class OrderMatchingEngine:
             self.iterate(tick.ts_init)
             self._core.set_last(bar._mem.low)
 
-        # Close
-        if bar._mem.close.raw != self._core.last_raw:  # Direct memory comparison
-            tick._mem.price = bar._mem.close  # Direct memory assignment
-            tick._mem.aggressor_side = <OrderSide>AggressorSide.BUY if bar._mem.close.raw > self._core.last_raw else <OrderSide>AggressorSide.SELL
-            tick._mem.trade_id = self._generate_trade_id()._mem
-            self._book.update_trade_tick(tick)
-            self.iterate(tick.ts_init)
-            self._core.set_last(bar._mem.close)
+    cdef void _process_trade_bar_single_pass(self, Bar bar) except *:
+        # Equivalent to `_process_trade_ticks_from_bar` when nothing is crossed
+        # along the path, where only the final state is observable. Walks the
+        # path on raw prices to count the ticks which would have been generated.
+        cdef bint is_open_moved = not self._core.is_last_initialized or bar._mem.open.raw != self._core.last_raw
+        cdef int64_t last_raw = bar._mem.open.raw
+        cdef int moves = 0
+        if self._bar_low_first:
+            if bar._mem.low.raw < last_raw:
+                last_raw = bar._mem.low.raw
+                moves += 1
+            if bar._mem.high.raw > last_raw:
+                last_raw = bar._mem.high.raw
+                moves += 1
+        else:
+            if bar._mem.high.raw > last_raw:
+                last_raw = bar._mem.high.raw
+                moves += 1
+            if bar._mem.low.raw < last_raw:
+                last_raw = bar._mem.low.raw
+                moves += 1
+        if bar._mem.close.raw != last_raw:
+            moves += 1
+
+        cdef TradeId trade_id = self._generate_trade_id()
+        self._execution_count += moves  # Keep trade IDs aligned with the tick path
+        if not is_open_moved and moves == 0:
+            return  # No tick would have been processed
+
+        cdef TradeTick tick = TradeTick(
+            bar.bar_type.instrument_id,
+            bar.close,
+            Quantity(bar.volume.as_double() / 4.0, bar._mem.volume.precision),
+            <OrderSide>AggressorSide.BUY if bar._mem.close.raw >= bar._mem.open.raw else <OrderSide>AggressorSide.SELL,
+            trade_id,
+            bar.ts_event,
+            bar.ts_event,
+        )
+        self._book.update_trade_tick(tick)
+        self.iterate(tick.ts_init)
+        self._core.set_last(bar._mem.close)
 
     cdef void _process_quote_ticks_from_bar(self) except *:
         if self._last_bid_bar is None or self._last_ask_bar is None:
@@ -431,41 +499,79 @@ cdef class OrderMatchingEngine:
         if self._last_bid_bar.ts_event != self._last_ask_bar.ts_event:
             return  # Wait for next bar
 
-        cdef Quantity bid_size = Quantity(self._last_bid_bar.volume.as_double() / 4.0, self._last_bid_bar._mem.volume.precision)
-        cdef Quantity ask_size = Quantity(self._last_ask_bar.volume.as_double() / 4.0, self._last_ask_bar._mem.volume.precision)
+        cdef Bar bid_bar = self._last_bid_bar
+        cdef Bar ask_bar = self._last_ask_bar
+        cdef Quantity bid_size = Quantity(bid_bar.volume.as_double() / 4.0, bid_bar._mem.volume.precision)
+        cdef Quantity ask_size = Quantity(ask_bar.volume.as_double() / 4.0, ask_bar._mem.volume.precision)
 
         # Create reusable tick
         cdef QuoteTick tick = QuoteTick(
             self._book.instrument_id,
-            self._last_bid_bar.open,
-            self._last_ask_bar.open,
+            bid_bar.open,
+            ask_bar.open,
             bid_size,
             ask_size,
-            self._last_bid_bar.ts_event,
-            self._last_ask_bar.ts_init,
+            bid_bar.ts_event,
+            ask_bar.ts_init,
         )
 
+        if self._is_bar_single_pass(
+            min(bid_bar._mem.open.raw, bid_bar._mem.high.raw, bid_bar._mem.low.raw, bid_bar._mem.close.raw),
+            max(bid_bar._mem.open.raw, bid_bar._mem.high.raw, bid_bar._mem.low.raw, bid_bar._mem.close.raw),
+            min(ask_bar._mem.open.raw, ask_bar._mem.high.raw, ask_bar._mem.low.raw, ask_bar._mem.close.raw),
+            max(ask_bar._mem.open.raw, ask_bar._mem.high.raw, ask_bar._mem.low.raw, ask_bar._mem.close.raw),
+        ):
+            # Nothing is crossed along the path, so only the close is observable
+            tick._mem.bid = bid_bar._mem.close  # Direct memory assignment
+            tick._mem.ask = ask_bar._mem.close  # Direct memory assignment
+            self._book.update_quote_tick(tick)
+            self.iterate(tick.ts_init)
+            return
+
         # Open
         self._book.update_quote_tick(tick)
         self.iterate(tick.ts_init)
 
-        # High
+        if self._bar_low_first:
+            self._process_quote_tick_from_bar_low(tick)
+            self._process_quote_tick_from_bar_high(tick)
+        else:
+            self._process_quote_tick_from_bar_high(tick)
+            self._process_quote_tick_from_bar_low(tick)
+
+        # Close
+        tick._mem.bid = bid_bar._mem.close  # Assigning memory directly
+        tick._mem.ask = ask_bar._mem.close  # Assigning memory directly
+        self._book.update_quote_tick(tick)
+        self.iterate(tick.ts_init)
+
+    cdef void _process_quote_tick_from_bar_high(self, QuoteTick tick) except *:
         tick._mem.bid = self._last_bid_bar._mem.high  # Direct memory assignment
         tick._mem.ask = self._last_ask_bar._mem.high  # Direct memory assignment
         self._book.update_quote_tick(tick)
         self.iterate(tick.ts_init)
 
-        # Low
+    cdef void _process_quote_tick_from_bar_low(self, QuoteTick tick) except *:
         tick._mem.bid = self._last_bid_bar._mem.low  # Assigning memory directly
         tick._mem.ask = self._last_ask_bar._mem.low  # Assigning memory directly
         self._book.update_quote_tick(tick)
         self.iterate(tick.ts_init)
 
-        # Close
-        tick._mem.bid = self._last_bid_bar._mem.close  # Assigning memory directly
-        tick._mem.ask = self._last_ask_bar._mem.close  # Assigning memory directly
-        self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+    cdef bint _is_bar_single_pass(
+        self,
+        int64_t bid_low_raw,
+        int64_t bid_high_raw,
+        int64_t ask_low_raw,
+        int64_t ask_high_raw,
+    ) except *:
+        # A bar can be processed at its close alone when no order can match or
+        # trigger anywhere along its path, and no trailing or expiring orders
+        # need managing at each price.
+        return (
+            self._bar_single_pass
+            and not self._core.has_orders_managed()
+            and not self._core.is_crossed_within(bid_low_raw, bid_high_raw, ask_low_raw, ask_high_raw)
+        )
 
 # -- TRADING COMMANDS -----------------------------------------------------------------------------
 
@@ -829,9 +935,12 @@ cdef class OrderMatchingEngine:
         if ask_levels:
             self._core.set_ask(price_new(ask_levels[0].price, self.instrument.price_precision))
 
+        if not self._core.has_orders():
+            return  # Nothing to match or manage
+
         self._core.iterate(timestamp_ns)
 
-        cdef list orders = self._core.get_orders()
+        cdef list orders = self._core.get_orders_managed()  # Trailing or expiring
         cdef Order order
         for order in orders:
             if order.is_closed_c():
@@ -1479,6 +1588,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Re-index the order at its updated price(s)
+        self._core.update_order(order)
+
     cdef void _generate_order_canceled(self, Order order) except *:
         # Generate event
         cdef uint64_t timestamp = self._clock.timestamp_ns()
@@ -1511,6 +1623,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Re-index the order at its limit price
+        self._core.update_order(order)
+
     cdef void _generate_order_expired(self, Order order) except *:
         # Generate event
         cdef uint64_t timestamp = self._clock.timestamp_ns()
@@ -37,5 +37,6 @@ cdef class FXRolloverInterestModule(SimulationModule):
     cdef bint _rollover_applied
     cdef dict _rollover_totals
     cdef int _day_number
+    cdef uint64_t _next_check_ns
 
     cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day) except *
@@ -22,6 +22,7 @@ import pytz
 from nautilus_trader.accounting.calculators cimport RolloverInterestCalculator
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.model.c_enums.asset_class cimport AssetClass
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.currency cimport Currency
@@ -76,6 +77,7 @@ cdef class SimulationModule:
 
 
 _TZ_US_EAST = pytz.timezone("US/Eastern")
+_NANOSECONDS_IN_DAY = 86_400_000_000_000
 
 cdef class FXRolloverInterestModule(SimulationModule):
     """
@@ -95,6 +97,7 @@ cdef class FXRolloverInterestModule(SimulationModule):
         self._rollover_applied = False
         self._rollover_totals = {}
         self._day_number = 0
+        self._next_check_ns = 0  # Next UTC day start or pending rollover time
 
     cpdef void process(self, uint64_t now_ns) except *:
         """
@@ -106,6 +109,9 @@ cdef class FXRolloverInterestModule(SimulationModule):
             The current time in the simulated exchange.
 
         """
+        if now_ns < self._next_check_ns:
+            return  # No new day and no rollover due
+
         cdef datetime now = pd.Timestamp(now_ns, tz="UTC")
         cdef datetime rollover_local
         if self._day_number != now.day:
@@ -126,6 +132,13 @@ cdef class FXRolloverInterestModule(SimulationModule):
             self._apply_rollover_interest(now, self._rollover_time.isoweekday())
             self._rollover_applied = True
 
+        # Nothing can change until the next UTC day, or the pending rollover
+        cdef uint64_t next_day_ns = now_ns - now_ns % _NANOSECONDS_IN_DAY + _NANOSECONDS_IN_DAY
+        if self._rollover_applied:
+            self._next_check_ns = next_day_ns
+        else:
+            self._next_check_ns = min(next_day_ns, dt_to_unix_nanos(self._rollover_time))
+
     cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day) except *:
         cdef list open_positions = self._exchange.cache.positions_open()
 
@@ -204,3 +217,4 @@ cdef class FXRolloverInterestModule(SimulationModule):
         self._rollover_applied = False
         self._rollover_totals = {}
         self._day_number = 0
+        self._next_check_ns = 0
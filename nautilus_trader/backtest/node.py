@@ -13,11 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 from decimal import Decimal
 from typing import Optional
 
 import pandas as pd
 
+from nautilus_trader.backtest.data.columnar import ColumnarDataStream
+from nautilus_trader.backtest.data.shared import SharedColumnarDataStream
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.results import BacktestResult
@@ -28,17 +33,22 @@ from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.inspect import is_nautilus_class
 from nautilus_trader.model.currency import Currency
 from nautilus_trader.model.data.base import DataType
+from nautilus_trader.model.data.bar import Bar
 from nautilus_trader.model.data.base import GenericData
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import BookTypeParser
 from nautilus_trader.model.enums import OMSType
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.batching import batch_files
 from nautilus_trader.persistence.batching import extract_generic_data_client_ids
 from nautilus_trader.persistence.batching import groupby_datatype
+from nautilus_trader.persistence.batching import prefetch
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 
 
@@ -69,6 +79,7 @@ class BacktestNode:
         # Configuration
         self._configs: list[BacktestRunConfig] = configs
         self._engines: dict[str, BacktestEngine] = {}
+        self._failures: dict[str, str] = {}
 
     @property
     def configs(self) -> list[BacktestRunConfig]:
@@ -82,6 +93,19 @@ class BacktestNode:
         """
         return self._configs
 
+    @property
+    def failures(self) -> dict[str, str]:
+        """
+        Return the formatted tracebacks of any failed parallel runs.
+
+        Returns
+        -------
+        dict[str, str]
+            The tracebacks keyed by run config ID.
+
+        """
+        return self._failures.copy()
+
     def get_engine(self, run_config_id: str) -> Optional[BacktestEngine]:
         """
         Return the backtest engine associated with the given run config ID
@@ -110,16 +134,55 @@ class BacktestNode:
         """
         return list(self._engines.values())
 
-    def run(self) -> list[BacktestResult]:  # noqa (kwargs for extensibility)
+    def run(  # noqa (kwargs for extensibility)
+        self,
+        max_workers: Optional[int] = None,
+        share_data: bool = False,
+    ) -> list[BacktestResult]:
         """
-        Execute a group of backtest run configs synchronously.
+        Execute a group of backtest run configs.
+
+        If `max_workers` is ``None`` then runs execute synchronously in this
+        process, otherwise each run config is executed by a worker from a pool
+        of processes (each worker building its own engine from the config).
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of worker processes for the run configs.
+        share_data : bool, default False
+            If the data should be loaded once by this process into shared memory,
+            with workers attaching to it zero-copy (for parameter sweeps).
+            Requires `max_workers`, and all run configs to have identical data
+            configs and no `batch_size_bytes`.
 
         Returns
         -------
         list[BacktestResult]
-            The results of the backtest runs.
+            The results of the backtest runs (in config order).
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is not ``None`` and not positive.
+        ValueError
+            If `share_data` and `max_workers` is ``None``.
+        ValueError
+            If `share_data` and the run configs data differ or are streaming.
+
+        Warnings
+        --------
+        When running with a process pool the engines are not retained by the
+        node, and a failing run does not stop the others. Failed runs are
+        excluded from the results and their tracebacks available from `failures`.
 
         """
+        if share_data:
+            PyCondition.not_none(max_workers, "max_workers")
+        if max_workers is not None:
+            PyCondition.positive_int(max_workers, "max_workers")
+            return self._run_parallel(max_workers=max_workers, share_data=share_data)
+
         results: list[BacktestResult] = []
         for config in self._configs:
             config.check()  # Check all values set
@@ -129,11 +192,92 @@ class BacktestNode:
                 venue_configs=config.venues,
                 data_configs=config.data,
                 batch_size_bytes=config.batch_size_bytes,
+                prefetch_batches=config.prefetch_batches,
             )
             results.append(result)
 
         return results
 
+    def _run_parallel(self, max_workers: int, share_data: bool) -> list[BacktestResult]:
+        self._failures.clear()
+        for config in self._configs:
+            config.check()  # Check all values set (prior to spawning any workers)
+
+        sweep_data: Optional[_SweepData] = None
+        if share_data:
+            sweep_data = self._load_sweep_data()
+
+        total: int = len(self._configs)
+        results: dict[int, BacktestResult] = {}
+        try:
+            # Shared data is sent once to each worker, rather than with every run config
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, total),
+                initializer=None if sweep_data is None else _init_sweep_worker,
+                initargs=() if sweep_data is None else (sweep_data,),
+            ) as executor:
+                run = _run_config if sweep_data is None else _run_sweep_config
+                futures = {
+                    executor.submit(run, config): i for i, config in enumerate(self._configs)
+                }
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    i = futures[future]
+                    run_config_id = self._configs[i].id
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        self._failures[run_config_id] = "".join(
+                            traceback.format_exception(type(e), e, e.__traceback__),
+                        )
+                        print(f"Backtest run {run_config_id} failed ({completed}/{total}): {e!r}")
+                    else:
+                        print(f"Backtest run {run_config_id} completed ({completed}/{total}).")
+        finally:
+            if sweep_data is not None:
+                sweep_data.unlink()
+
+        return [results[i] for i in sorted(results)]
+
+    def _load_sweep_data(self) -> "_SweepData":
+        data_configs: list[BacktestDataConfig] = self._configs[0].data
+        for config in self._configs:
+            if config.data != data_configs:
+                raise ValueError("cannot share data between run configs with differing `data`")
+            if config.batch_size_bytes is not None:
+                raise ValueError("cannot share data for streaming run configs")
+
+        instruments: dict[InstrumentId, Instrument] = {}
+        market_data: list = []
+        other_data: list[dict] = []
+        for config in data_configs:
+            if is_nautilus_class(config.data_type):
+                for instrument in (
+                    config.catalog().instruments(
+                        instrument_ids=config.instrument_id,
+                        as_nautilus=True,
+                    )
+                    or []
+                ):
+                    instruments[instrument.id] = instrument
+            d = config.load()
+            if not d["data"]:
+                print(f"No data found for {config}")
+                continue
+            if d["type"] in (QuoteTick, TradeTick, Bar):
+                market_data += d["data"]
+            else:
+                other_data.append(d)
+
+        stream: Optional[SharedColumnarDataStream] = None
+        if market_data:
+            stream = SharedColumnarDataStream(ColumnarDataStream.from_data(market_data))
+
+        return _SweepData(
+            instruments=list(instruments.values()),
+            stream=stream,
+            other_data=other_data,
+        )
+
     def _validate_configs(self, configs: list[BacktestRunConfig]):
         venue_ids: list[Venue] = []
         for config in configs:
@@ -180,6 +324,8 @@ class BacktestNode:
                 routing=config.routing,
                 frozen_account=config.frozen_account,
                 reject_stop_orders=config.reject_stop_orders,
+                bar_single_pass=config.bar_single_pass,
+                bar_low_first=config.bar_low_first,
             )
 
         # Add instruments
@@ -212,6 +358,7 @@ class BacktestNode:
         venue_configs: list[BacktestVenueConfig],
         data_configs: list[BacktestDataConfig],
         batch_size_bytes: Optional[int] = None,
+        prefetch_batches: int = 0,
     ) -> BacktestResult:
         engine: BacktestEngine = self._create_engine(
             run_config_id=run_config_id,
@@ -227,6 +374,7 @@ class BacktestNode:
                 engine=engine,
                 data_configs=data_configs,
                 batch_size_bytes=batch_size_bytes,
+                prefetch_batches=prefetch_batches,
             )
         else:
             self._run_oneshot(
@@ -246,26 +394,34 @@ class BacktestNode:
         engine: BacktestEngine,
         data_configs: list[BacktestDataConfig],
         batch_size_bytes: int,
+        prefetch_batches: int = 0,
     ) -> None:
         config = data_configs[0]
         catalog: ParquetDataCatalog = config.catalog()
 
         data_client_ids = extract_generic_data_client_ids(data_configs=data_configs)
 
-        for batch in batch_files(
-            catalog=catalog,
-            data_configs=data_configs,
-            target_batch_size_bytes=batch_size_bytes,
-        ):
+        def _load_batches():
+            # Reads and deserializes batches (on a background thread if prefetching)
+            for batch in batch_files(
+                catalog=catalog,
+                data_configs=data_configs,
+                target_batch_size_bytes=batch_size_bytes,
+            ):
+                grouped = groupby_datatype(batch)
+                for data in grouped:
+                    if data["type"] in data_client_ids:
+                        # Generic data - manually re-add client_id (lost in the streaming join)
+                        data.update({"client_id": ClientId(data_client_ids[data["type"]])})
+                        data["data"] = [
+                            GenericData(data_type=DataType(data["type"]), data=d)
+                            for d in data["data"]
+                        ]
+                yield grouped
+
+        for grouped in prefetch(_load_batches(), maxsize=prefetch_batches):
             engine.clear_data()
-            grouped = groupby_datatype(batch)
             for data in grouped:
-                if data["type"] in data_client_ids:
-                    # Generic data - manually re-add client_id as it gets lost in the streaming join
-                    data.update({"client_id": ClientId(data_client_ids[data["type"]])})
-                    data["data"] = [
-                        GenericData(data_type=DataType(data["type"]), data=d) for d in data["data"]
-                    ]
                 self._load_engine_data(engine=engine, data=data)
             engine.run_streaming(run_config_id=run_config_id)
 
@@ -309,3 +465,65 @@ class BacktestNode:
         for engine in self.get_engines():
             if not engine.trader.is_disposed:
                 engine.dispose()
+
+
+def _run_config(config: BacktestRunConfig) -> BacktestResult:
+    # Executes a single run config within a worker process
+    node = BacktestNode(configs=[config])
+    try:
+        return node.run()[0]
+    finally:
+        node.dispose()
+
+
+class _SweepData:
+    # The data for a parameter sweep, loaded once and shared with all workers
+    def __init__(
+        self,
+        instruments: list[Instrument],
+        stream: Optional[SharedColumnarDataStream],
+        other_data: list[dict],
+    ):
+        self.instruments = instruments
+        self.stream = stream
+        self.other_data = other_data
+
+    def unlink(self) -> None:
+        if self.stream is not None:
+            self.stream.unlink()
+
+
+_SWEEP_DATA: Optional[_SweepData] = None  # Set once for each worker process
+
+
+def _init_sweep_worker(data: _SweepData) -> None:
+    global _SWEEP_DATA
+    _SWEEP_DATA = data
+
+
+def _run_sweep_config(config: BacktestRunConfig) -> BacktestResult:
+    # Executes a single run config within a worker process, against the shared data
+    data: _SweepData = _SWEEP_DATA
+    node = BacktestNode(configs=[config])
+    try:
+        engine: BacktestEngine = node._create_engine(
+            run_config_id=config.id,
+            config=config.engine,
+            venue_configs=config.venues,
+            data_configs=[],  # Instruments were loaded once by the parent process
+        )
+        for instrument in data.instruments:
+            engine.add_instrument(instrument)
+        if data.stream is not None:
+            engine.add_columnar_data(data.stream.attach())
+        for d in data.other_data:
+            node._load_engine_data(engine=engine, data=d)
+
+        engine.run(run_config_id=config.id)
+        engine.dispose()
+
+        return engine.get_result()
+    finally:
+        node.dispose()
+        if data.stream is not None:
+            data.stream.close()  # Engine data (reading the block) released on dispose
@@ -39,6 +39,7 @@ class BacktestResult:
     total_positions: int
     stats_pnls: dict[str, dict[str, float]]
     stats_returns: dict[str, float]
+    stats_profile: Optional[dict[str, dict[str, int]]] = None
 
     # account_balances: pd.DataFrame
     # fills_report: pd.DataFrame
@@ -71,9 +71,26 @@ cdef class Clock:
 
 cdef class TestClock(Clock):
     cdef CTestClock _mem
+    cdef TimerScheduler _scheduler
 
     cpdef void set_time(self, uint64_t to_time_ns) except *
     cpdef list advance_time(self, uint64_t to_time_ns)
+    cdef uint64_t next_event_time_ns(self) except *
+    cdef void _sync_time(self) except *
+
+
+cdef class TimerScheduler:
+    cdef list _clocks
+
+    cdef readonly uint64_t time_ns
+    """The current time of the scheduler (nanoseconds).\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t next_time_ns
+    """The earliest next time event across all registered clocks.\n\n:returns: `uint64_t`"""
+
+    cpdef void register_clock(self, TestClock clock) except *
+    cpdef void clear(self) except *
+    cdef void update_next_time(self, uint64_t time_ns) except *
+    cpdef list advance_time(self, uint64_t to_time_ns)
 
 
 cdef class LiveClock(Clock):
@@ -24,6 +24,7 @@ from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
 from cpython.object cimport PyObject
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.common.timer cimport LoopTimer
@@ -38,6 +39,7 @@ from nautilus_trader.core.rust.common cimport test_clock_cancel_timer
 from nautilus_trader.core.rust.common cimport test_clock_cancel_timers
 from nautilus_trader.core.rust.common cimport test_clock_free
 from nautilus_trader.core.rust.common cimport test_clock_new
+from nautilus_trader.core.rust.common cimport test_clock_next_event_time_ns
 from nautilus_trader.core.rust.common cimport test_clock_next_time_ns
 from nautilus_trader.core.rust.common cimport test_clock_set_time
 from nautilus_trader.core.rust.common cimport test_clock_set_time_alert_ns
@@ -420,6 +422,7 @@ cdef class TestClock(Clock):
         super().__init__()
 
         self._mem = test_clock_new()
+        self._scheduler = None  # Optionally registered
 
     def __del__(self) -> None:
         test_clock_free(self._mem)
@@ -433,12 +436,15 @@ cdef class TestClock(Clock):
         return test_clock_timer_count(&self._mem)
 
     cpdef double timestamp(self) except *:
+        self._sync_time()
         return nanos_to_secs(test_clock_time_ns(&self._mem))
 
     cpdef uint64_t timestamp_ms(self) except *:
+        self._sync_time()
         return nanos_to_millis(test_clock_time_ns(&self._mem))
 
     cpdef uint64_t timestamp_ns(self) except *:
+        self._sync_time()
         return test_clock_time_ns(&self._mem)
 
     cpdef void set_time_alert_ns(
@@ -453,8 +459,12 @@ cdef class TestClock(Clock):
 
         self._handlers[name] = callback
 
+        self._sync_time()
         test_clock_set_time_alert_ns(&self._mem, <PyObject *>name, alert_time_ns)
 
+        if self._scheduler is not None:
+            self._scheduler.update_next_time(alert_time_ns)
+
     cpdef void set_timer_ns(
         self,
         str name,
@@ -484,6 +494,9 @@ cdef class TestClock(Clock):
             stop_time_ns,
         )
 
+        if self._scheduler is not None:
+            self._scheduler.update_next_time(start_time_ns + interval_ns)
+
     cpdef uint64_t next_time_ns(self, str name) except*:
         return test_clock_next_time_ns(&self._mem, <PyObject *>name)
 
@@ -526,6 +539,7 @@ cdef class TestClock(Clock):
 
         """
         # Ensure monotonic
+        self._sync_time()
         Condition.true(to_time_ns >= test_clock_time_ns(&self._mem), "to_time_ns was < time_ns")
 
         cdef Vec_TimeEvent raw_events = test_clock_advance_time(&self._mem, to_time_ns)
@@ -547,6 +561,126 @@ cdef class TestClock(Clock):
 
         return sorted(event_handlers)
 
+    cdef uint64_t next_event_time_ns(self) except *:
+        return test_clock_next_event_time_ns(&self._mem)
+
+    cdef void _sync_time(self) except *:
+        # Catch up with the time of a registered scheduler, which is set lazily
+        if self._scheduler is not None and self._scheduler.time_ns > test_clock_time_ns(&self._mem):
+            test_clock_set_time(&self._mem, self._scheduler.time_ns)
+
+
+cdef class TimerScheduler:
+    """
+    Provides a scheduler which tracks the earliest next time event across a
+    group of test clocks.
+
+    Registered clocks are only advanced once a given time reaches the earliest
+    next time event. Otherwise only the scheduler time is set, with each clock
+    catching up to it when next read, so the cost does not grow with the
+    number of registered clocks.
+    """
+
+    def __init__(self):
+        self._clocks: list[TestClock] = []
+
+        self.time_ns = 0
+        self.next_time_ns = UINT64_MAX
+
+    @property
+    def clock_count(self) -> int:
+        """
+        Return the count of clocks registered with the scheduler.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._clocks)
+
+    cpdef void register_clock(self, TestClock clock) except *:
+        """
+        Register the given clock with the scheduler.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to register.
+
+        """
+        Condition.not_none(clock, "clock")
+        Condition.not_in(clock, self._clocks, "clock", "_clocks")
+
+        clock._scheduler = self
+        self._clocks.append(clock)
+
+        cdef uint64_t next_event_time_ns = clock.next_event_time_ns()
+        if next_event_time_ns > 0:
+            self.update_next_time(next_event_time_ns)
+
+    cpdef void clear(self) except *:
+        """
+        Deregister all clocks from the scheduler.
+        """
+        cdef TestClock clock
+        for clock in self._clocks:
+            clock._sync_time()  # Keep the latest time once deregistered
+            clock._scheduler = None
+
+        self._clocks.clear()
+        self.time_ns = 0
+        self.next_time_ns = UINT64_MAX
+
+    cdef void update_next_time(self, uint64_t time_ns) except *:
+        if time_ns < self.next_time_ns:
+            self.next_time_ns = time_ns
+
+    cpdef list advance_time(self, uint64_t to_time_ns):
+        """
+        Advance all registered clocks to the given `to_time_ns`.
+
+        Parameters
+        ----------
+        to_time_ns : uint64_t
+            The UNIX time (nanoseconds) to advance the clocks to.
+
+        Returns
+        -------
+        list[TimeEventHandler]
+            Sorted chronologically (ties in clock registration order).
+
+        Raises
+        ------
+        ValueError
+            If `to_time_ns` is < the schedulers current time.
+
+        """
+        # Ensure monotonic
+        Condition.true(to_time_ns >= self.time_ns, "to_time_ns was < time_ns")
+
+        if to_time_ns < self.next_time_ns:
+            # No timers due, clocks catch up with the time when next read
+            self.time_ns = to_time_ns
+            return []
+
+        cdef list event_handlers = []
+        cdef uint64_t next_time_ns = UINT64_MAX
+        cdef uint64_t next_event_time_ns
+        cdef TestClock clock
+        for clock in self._clocks:
+            event_handlers += clock.advance_time(to_time_ns)
+            next_event_time_ns = clock.next_event_time_ns()
+            if 0 < next_event_time_ns < next_time_ns:
+                next_time_ns = next_event_time_ns
+
+        # Set after advancing, so clocks do not skip the events now due
+        self.time_ns = to_time_ns
+        self.next_time_ns = next_time_ns
+
+        event_handlers.sort()
+        return event_handlers
+
 
 cdef class LiveClock(Clock):
     """
@@ -0,0 +1,31 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef class Profiler:
+    cdef dict _total_ns
+    cdef dict _counts
+    cdef dict _handler_stages
+
+    cpdef void record(self, str stage, uint64_t elapsed_ns) except *
+    cpdef void record_handler(self, handler, uint64_t elapsed_ns) except *
+    cpdef dict stats(self)
+    cpdef list format_table(self)
+    cpdef void reset(self) except *
+
+
+cdef str format_handler_name(handler, bint use_owner_id=*)
@@ -0,0 +1,142 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class Profiler:
+    """
+    Provides a profiler which accumulates wall time and call counts per stage.
+
+    Stages are arbitrary names, and timings are inclusive of any nested stages
+    (for instance a message bus publish includes the time of its handlers).
+    Timings are recorded by the instrumented components, which only pay the
+    timing cost when a profiler has been set.
+    """
+
+    def __init__(self):
+        self._total_ns: dict[str, int] = {}
+        self._counts: dict[str, int] = {}
+        self._handler_stages: dict[object, str] = {}
+
+    cpdef void record(self, str stage, uint64_t elapsed_ns) except *:
+        """
+        Record a call of the given stage.
+
+        Parameters
+        ----------
+        stage : str
+            The stage name.
+        elapsed_ns : uint64_t
+            The elapsed wall time for the call (nanoseconds).
+
+        """
+        Condition.not_none(stage, "stage")
+
+        self._total_ns[stage] = self._total_ns.get(stage, 0) + elapsed_ns
+        self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    cpdef void record_handler(self, handler, uint64_t elapsed_ns) except *:
+        """
+        Record a call of the given handler.
+
+        The stage is named from the handlers owner type and name, for instance
+        Handler EMACross.handle_bar.
+
+        Parameters
+        ----------
+        handler : Callable
+            The handler which was called.
+        elapsed_ns : uint64_t
+            The elapsed wall time for the call (nanoseconds).
+
+        """
+        cdef str stage = self._handler_stages.get(handler)
+        if stage is None:
+            # Aggregated by owner type, across component instances
+            stage = f"Handler {format_handler_name(handler, use_owner_id=False)}"
+            self._handler_stages[handler] = stage
+
+        self.record(stage, elapsed_ns)
+
+    cpdef dict stats(self):
+        """
+        Return the recorded statistics per stage.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            The total_ns and count keyed by stage, sorted by total
+            time (descending).
+
+        """
+        cdef list stages = sorted(self._total_ns, key=self._total_ns.get, reverse=True)
+        return {
+            stage: {"total_ns": self._total_ns[stage], "count": self._counts[stage]}
+            for stage in stages
+        }
+
+    cpdef list format_table(self):
+        """
+        Return the recorded statistics formatted as table lines.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        cdef dict stats = self.stats()
+        cdef int width = max([len(stage) for stage in stats] + [len("Stage")])
+        cdef list lines = [
+            f"{'Stage':<{width}} {'Calls':>12} {'Total (ms)':>12} {'Mean (us)':>10}",
+        ]
+
+        cdef str stage
+        cdef dict stat
+        for stage, stat in stats.items():
+            lines.append(
+                f"{stage:<{width}} "
+                f"{stat['count']:>12,} "
+                f"{stat['total_ns'] / 1e6:>12,.1f} "
+                f"{stat['total_ns'] / stat['count'] / 1e3:>10,.2f}",
+            )
+
+        return lines
+
+    cpdef void reset(self) except *:
+        """
+        Reset the profiler.
+
+        All recorded statistics are cleared.
+
+        """
+        self._total_ns.clear()
+        self._counts.clear()
+        self._handler_stages.clear()
+
+
+cdef str format_handler_name(handler, bint use_owner_id = True):
+    # Name a handler from its owning component ID where available (otherwise
+    # the owner type), for instance EMACross-000.handle_bar
+    owner = getattr(handler, "__self__", None)
+    cdef str name = getattr(handler, "__name__", type(handler).__name__)
+    if owner is None:
+        return name
+    owner_id = getattr(owner, "id", None) if use_owner_id else None
+    if owner_id is not None and not callable(owner_id):
+        return f"{owner_id}.{name}"
+    return f"{type(owner).__name__}.{name}"
@@ -106,6 +106,8 @@ class BacktestVenueConfig(Partialable):
     routing: bool = False
     frozen_account: bool = False
     reject_stop_orders: bool = True
+    bar_single_pass: bool = False  # Skip idle bars, see `BacktestEngine.add_venue`
+    bar_low_first: bool = False
     # fill_model: Optional[FillModel] = None  # TODO(cs): Implement
     # modules: Optional[list[SimulationModule]] = None  # TODO(cs): Implement
 
@@ -123,6 +125,8 @@ class BacktestVenueConfig(Partialable):
             self.routing,
             self.frozen_account,
             self.reject_stop_orders,
+            self.bar_single_pass,
+            self.bar_low_first,
             # self.modules,  # TODO(cs): Implement
         ]
         return tuple(values)
@@ -259,6 +263,14 @@ class BacktestEngineConfig(NautilusKernelConfig):
         If logging should be bypassed.
     run_analysis : bool, default True
         If post backtest performance analysis should be run.
+    profile : bool, default False
+        If wall time and call counts should be recorded per component stage
+        (exchange, data engine, message bus topics and handlers, timer events).
+    filter_unsubscribed_data : bool, default False
+        If quote ticks, trade ticks and bars which no component has subscribed to
+        through the data engine are only processed by the simulated exchanges (the
+        cache still receives ticks for portfolio and risk calculations). Handlers
+        subscribed directly on the message bus will not receive this data.
 
     """
 
@@ -268,6 +280,8 @@ class BacktestEngineConfig(NautilusKernelConfig):
     risk_engine: RiskEngineConfig = RiskEngineConfig()
     exec_engine: ExecEngineConfig = ExecEngineConfig()
     run_analysis: bool = True
+    profile: bool = False
+    filter_unsubscribed_data: bool = False
 
     def __tokenize__(self):
         return tuple(self.dict().items())
@@ -291,12 +305,17 @@ class BacktestRunConfig(Partialable):
         The data configurations for the backtest run.
     batch_size_bytes : optional
         The batch block size in bytes (will then run in streaming mode).
+    prefetch_batches : int, default 0
+        The maximum number of batches read ahead on a background thread while
+        the engine runs (streaming mode only). If zero then batches are read
+        synchronously, without a background thread.
     """
 
     engine: Optional[BacktestEngineConfig] = None
     venues: Optional[list[BacktestVenueConfig]] = None
     data: Optional[list[BacktestDataConfig]] = None
     batch_size_bytes: Optional[int] = None
+    prefetch_batches: int = 0
 
     @property
     def id(self):
@@ -89,6 +89,8 @@ void test_clock_set_time(struct CTestClock *clock, uint64_t to_time_ns);
 
 uint64_t test_clock_time_ns(const struct CTestClock *clock);
 
+uint64_t test_clock_next_event_time_ns(const struct CTestClock *clock);
+
 PyObject *test_clock_timer_names(const struct CTestClock *clock);
 
 uintptr_t test_clock_timer_count(struct CTestClock *clock);
@@ -72,6 +72,8 @@ cdef extern from "../includes/common.h":
 
     uint64_t test_clock_time_ns(const CTestClock *clock);
 
+    uint64_t test_clock_next_event_time_ns(const CTestClock *clock);
+
     PyObject *test_clock_timer_names(const CTestClock *clock);
 
     uintptr_t test_clock_timer_count(CTestClock *clock);
@@ -47,6 +47,11 @@ cdef class DataEngine(Component):
     cdef dict _routing_map
     cdef dict _order_book_intervals
     cdef dict _bar_aggregators
+    cdef dict _topics_book_deltas
+    cdef dict _topics_tickers
+    cdef dict _topics_quotes
+    cdef dict _topics_trades
+    cdef dict _topics_bars
 
     cdef readonly bint debug
     """If debug mode is active (will provide extra debug logging).\n\n:returns: `bool`"""
@@ -91,6 +96,10 @@ cdef class DataEngine(Component):
 
     cpdef void execute(self, DataCommand command) except *
     cpdef void process(self, Data data) except *
+    cdef void process_order_book_c(self, OrderBookData data) except *
+    cdef void process_quote_tick_c(self, QuoteTick tick) except *
+    cdef void process_trade_tick_c(self, TradeTick tick) except *
+    cdef void process_bar_c(self, Bar bar) except *
     cpdef void request(self, DataRequest request) except *
     cpdef void response(self, DataResponse response) except *
 
@@ -140,6 +149,14 @@ cdef class DataEngine(Component):
     cdef void _handle_trade_ticks(self, list ticks) except *
     cdef void _handle_bars(self, list bars, Bar partial) except *
 
+# -- TOPICS ---------------------------------------------------------------------------------------
+
+    cdef str _book_deltas_topic(self, InstrumentId instrument_id)
+    cdef str _tickers_topic(self, InstrumentId instrument_id)
+    cdef str _quotes_topic(self, InstrumentId instrument_id)
+    cdef str _trades_topic(self, InstrumentId instrument_id)
+    cdef str _bars_topic(self, BarType bar_type)
+
 # -- INTERNAL -------------------------------------------------------------------------------------
 
     cpdef void _internal_update_instruments(self, list instruments) except *
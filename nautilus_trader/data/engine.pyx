@@ -124,6 +124,13 @@ cdef class DataEngine(Component):
         self._order_book_intervals: dict[(InstrumentId, int), list[Callable[[Bar], None]]] = {}
         self._bar_aggregators: dict[BarType, BarAggregator] = {}
 
+        # Topic caches (avoids building topic strings on every publish)
+        self._topics_book_deltas: dict[InstrumentId, str] = {}
+        self._topics_tickers: dict[InstrumentId, str] = {}
+        self._topics_quotes: dict[InstrumentId, str] = {}
+        self._topics_trades: dict[InstrumentId, str] = {}
+        self._topics_bars: dict[BarType, str] = {}
+
         # Settings
         self.debug = config.debug
 
@@ -518,6 +525,26 @@ cdef class DataEngine(Component):
 
         self._handle_data(data)
 
+    cdef void process_order_book_c(self, OrderBookData data) except *:
+        # Typed entry point for callers which have already resolved the data type
+        self.data_count += 1
+        self._handle_order_book_data(data)
+
+    cdef void process_quote_tick_c(self, QuoteTick tick) except *:
+        # Typed entry point for callers which have already resolved the data type
+        self.data_count += 1
+        self._handle_quote_tick(tick)
+
+    cdef void process_trade_tick_c(self, TradeTick tick) except *:
+        # Typed entry point for callers which have already resolved the data type
+        self.data_count += 1
+        self._handle_trade_tick(tick)
+
+    cdef void process_bar_c(self, Bar bar) except *:
+        # Typed entry point for callers which have already resolved the data type
+        self.data_count += 1
+        self._handle_bar(bar)
+
     cpdef void request(self, DataRequest request) except *:
         """
         Handle the given request.
@@ -712,9 +739,7 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._book_deltas_topic(instrument_id),
             handler=self._maintain_order_book,
             priority=10,
         )
@@ -781,9 +806,7 @@ cdef class DataEngine(Component):
                 )
 
         self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._book_deltas_topic(instrument_id),
             handler=self._maintain_order_book,
             priority=10,
         )
@@ -796,6 +819,7 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(instrument_id, "instrument_id")
 
+        self._tickers_topic(instrument_id)  # Build topic ahead of data
         if instrument_id not in client.subscribed_tickers():
             client.subscribe_ticker(instrument_id)
 
@@ -807,6 +831,7 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(instrument_id, "instrument_id")
 
+        self._quotes_topic(instrument_id)  # Build topic ahead of data
         if instrument_id not in client.subscribed_quote_ticks():
             client.subscribe_quote_ticks(instrument_id)
 
@@ -818,6 +843,7 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(instrument_id, "instrument_id")
 
+        self._trades_topic(instrument_id)  # Build topic ahead of data
         if instrument_id not in client.subscribed_trade_ticks():
             client.subscribe_trade_ticks(instrument_id)
 
@@ -829,6 +855,7 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(bar_type, "bar_type")
 
+        self._bars_topic(bar_type)  # Build topic ahead of data
         if bar_type.is_internally_aggregated() and bar_type not in self._bar_aggregators:
             # Internal aggregation
             self._start_bar_aggregator(client, bar_type)
@@ -907,9 +934,7 @@ cdef class DataEngine(Component):
         Condition.not_none(metadata, "metadata")
 
         if not self._msgbus.has_subscribers(
-            f"data.book.deltas"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._book_deltas_topic(instrument_id),
         ):
             client.unsubscribe_order_book_deltas(instrument_id)
 
@@ -939,9 +964,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.tickers"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._tickers_topic(instrument_id),
         ):
             client.unsubscribe_ticker(instrument_id)
 
@@ -954,9 +977,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.quotes"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._quotes_topic(instrument_id),
         ):
             client.unsubscribe_quote_ticks(instrument_id)
 
@@ -969,9 +990,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.trades"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._trades_topic(instrument_id),
         ):
             client.unsubscribe_trade_ticks(instrument_id)
 
@@ -987,7 +1006,7 @@ cdef class DataEngine(Component):
             # Internal aggregation
             self._stop_bar_aggregator(client, bar_type)
         else:
-            if not self._msgbus.has_subscribers(f"data.bars.{bar_type}"):
+            if not self._msgbus.has_subscribers(self._bars_topic(bar_type)):
                 # External aggregation
                 client.unsubscribe_bars(bar_type)
 
@@ -1104,43 +1123,35 @@ cdef class DataEngine(Component):
 
     cdef void _handle_order_book_data(self, OrderBookData data) except *:
         self._msgbus.publish_c(
-            topic=f"data.book.deltas"
-                  f".{data.instrument_id.venue}"
-                  f".{data.instrument_id.symbol}",
+            topic=self._book_deltas_topic(data.instrument_id),
             msg=data,
         )
 
     cdef void _handle_ticker(self, Ticker ticker) except *:
         self._cache.add_ticker(ticker)
         self._msgbus.publish_c(
-            topic=f"data.tickers"
-                  f".{ticker.instrument_id.venue}"
-                  f".{ticker.instrument_id.symbol}",
+            topic=self._tickers_topic(ticker.instrument_id),
             msg=ticker,
         )
 
     cdef void _handle_quote_tick(self, QuoteTick tick) except *:
         self._cache.add_quote_tick(tick)
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._quotes_topic(tick.instrument_id),
             msg=tick,
         )
 
     cdef void _handle_trade_tick(self, TradeTick tick) except *:
         self._cache.add_trade_tick(tick)
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._trades_topic(tick.instrument_id),
             msg=tick,
         )
 
     cdef void _handle_bar(self, Bar bar) except *:
         self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar.bar_type}", msg=bar)
+        self._msgbus.publish_c(topic=self._bars_topic(bar.bar_type), msg=bar)
 
     cdef void _handle_status_update(self, StatusUpdate data) except *:
         self._msgbus.publish_c(topic=f"data.venue.status", msg=data)
@@ -1197,6 +1208,43 @@ cdef class DataEngine(Component):
                     # - with the partial bar being for a now removed aggregator.
                     self._log.error("No aggregator for partial bar update.")
 
+# -- TOPICS ---------------------------------------------------------------------------------------
+
+    cdef str _book_deltas_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topics_book_deltas.get(instrument_id)
+        if topic is None:
+            topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topics_book_deltas[instrument_id] = topic
+        return topic
+
+    cdef str _tickers_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topics_tickers.get(instrument_id)
+        if topic is None:
+            topic = f"data.tickers.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topics_tickers[instrument_id] = topic
+        return topic
+
+    cdef str _quotes_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topics_quotes.get(instrument_id)
+        if topic is None:
+            topic = f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topics_quotes[instrument_id] = topic
+        return topic
+
+    cdef str _trades_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topics_trades.get(instrument_id)
+        if topic is None:
+            topic = f"data.trades.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topics_trades[instrument_id] = topic
+        return topic
+
+    cdef str _bars_topic(self, BarType bar_type):
+        cdef str topic = self._topics_bars.get(bar_type)
+        if topic is None:
+            topic = f"data.bars.{bar_type}"
+            self._topics_bars[bar_type] = topic
+        return topic
+
 # -- INTERNAL -------------------------------------------------------------------------------------
 
     # Python wrapper to enable callbacks
@@ -1294,18 +1342,14 @@ cdef class DataEngine(Component):
         # Subscribe to required data
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.subscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
                 priority=5,
             )
             self._handle_subscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.subscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
                 priority=5,
             )
@@ -1326,17 +1370,13 @@ cdef class DataEngine(Component):
         # Unsubscribe from update ticks
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.unsubscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
             )
             self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.unsubscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
             )
             self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id)
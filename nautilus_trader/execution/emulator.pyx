@@ -29,6 +29,7 @@ from nautilus_trader.common.logging cimport SENT
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.execution.matching_core cimport MatchingCore
 from nautilus_trader.execution.messages cimport CancelAllOrders
@@ -93,6 +94,9 @@ cdef class OrderEmulator(Actor):
         # Register endpoints
         self._msgbus.register(endpoint="OrderEmulator.execute", handler=self.execute)
 
+        # Subscribe to order events (to re-index modified emulated orders)
+        self._msgbus.subscribe(topic="events.order*", handler=self.handle_event)
+
 # -- ACTION IMPLEMENTATIONS -----------------------------------------------------------------------
 
     cpdef void _start(self) except *:
@@ -473,6 +477,19 @@ cdef class OrderEmulator(Actor):
 
         self._send_exec_command(command)
 
+    cpdef void on_event(self, Event event) except *:
+        if not isinstance(event, OrderUpdated):
+            return
+
+        cdef MatchingCore matching_core = self._matching_cores.get(event.instrument_id)
+        if matching_core is None:
+            return
+
+        cdef Order order = self.cache.order(event.client_order_id)
+        if order is not None:
+            # Modified prices are only applied once the event is processed
+            matching_core.update_order(order)
+
     cpdef void on_quote_tick(self, QuoteTick tick) except *:
         if not self._log.is_bypassed:
             self._log.debug(f"Processing {repr(tick)}...")
@@ -506,7 +523,7 @@ cdef class OrderEmulator(Actor):
     cdef void _iterate_orders(self, MatchingCore matching_core) except *:
         matching_core.iterate(self._clock.timestamp_ns())
 
-        cdef list orders = matching_core.get_orders()
+        cdef list orders = matching_core.get_orders_managed()  # Trailing or expiring
         cdef Order order
         for order in orders:
             if order.is_closed_c():
@@ -580,6 +597,7 @@ cdef class OrderEmulator(Actor):
             ts_init=timestamp,
         )
         order.apply(event)
+        matching_core.update_order(order)
 
         self._send_risk_event(event)
 
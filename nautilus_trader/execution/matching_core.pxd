@@ -38,8 +38,16 @@ cdef class MatchingCore:
     cdef object _fill_limit_order
 
     cdef dict _orders
-    cdef list _orders_bid
-    cdef list _orders_ask
+    cdef dict _orders_managed
+    cdef dict _index
+    cdef uint64_t _seq
+    cdef bint _is_idle
+    cdef int64_t _idle_bid_raw
+    cdef int64_t _idle_ask_raw
+    cdef list _bid_limits
+    cdef list _bid_stops
+    cdef list _ask_limits
+    cdef list _ask_stops
 
 # -- QUERIES --------------------------------------------------------------------------------------
 
@@ -48,6 +56,16 @@ cdef class MatchingCore:
     cpdef list get_orders(self)
     cpdef list get_orders_bid(self)
     cpdef list get_orders_ask(self)
+    cpdef list get_orders_managed(self)
+    cpdef bint has_orders(self) except *
+    cpdef bint has_orders_managed(self) except *
+    cpdef bint is_crossed_within(
+        self,
+        int64_t bid_low_raw,
+        int64_t bid_high_raw,
+        int64_t ask_low_raw,
+        int64_t ask_high_raw,
+    ) except *
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -58,8 +76,12 @@ cdef class MatchingCore:
     cpdef void reset(self) except *
     cpdef void add_order(self, Order order) except *
     cdef void _add_order(self, Order order) except *
+    cpdef void update_order(self, Order order) except *
     cpdef void delete_order(self, Order order) except *
+    cdef void _index_order(self, Order order, uint64_t seq) except *
+    cdef void _unindex_order(self, Order order) except *
     cpdef void iterate(self, uint64_t timestamp_ns) except *
+    cdef void _match_crossed(self, list crossed) except *
 
 # -- MATCHING -------------------------------------------------------------------------------------
 
@@ -13,10 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from bisect import bisect_left
+from bisect import insort
 from typing import Callable, Optional
 
-from libc.limits cimport INT_MAX
-from libc.limits cimport INT_MIN
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.rust.model cimport Price_t
@@ -31,6 +32,17 @@ from nautilus_trader.model.orders.base cimport Order
 cdef class MatchingCore:
     """
     Provides an order matching core.
+
+    Resting orders are indexed by the price at which they match (the limit
+    price, or the trigger price for untriggered stop orders), so each iteration
+    only visits orders whose price has been crossed by the market.
+
+    Orders must be re-indexed with `update_order` when their price, trigger
+    price or triggered state changes.
+
+    Matching is skipped when the bid and ask are unchanged since an iteration
+    which found no crossed orders (such as size-only quote updates), and no
+    orders have been indexed since.
     """
 
     def __init__(
@@ -57,8 +69,20 @@ cdef class MatchingCore:
 
         # Orders
         self._orders: dict[ClientOrderId, Order] = {}
-        self._orders_bid: list[Order] = []
-        self._orders_ask: list[Order] = []
+        self._orders_managed: dict[ClientOrderId, Order] = {}  # Trailing or expiring
+        self._index: dict[ClientOrderId, tuple] = {}  # (indexed list, entry)
+        self._seq = 0  # Tie-breaker preserving the order in which orders were added
+        self._is_idle = False  # If nothing was crossed at the idle bid/ask
+        self._idle_bid_raw = 0
+        self._idle_ask_raw = 0
+
+        # Price indexes, each sorted so crossed orders form a prefix of entries
+        # (key, seq, order) where `key` is the raw matching price (negated for
+        # buy limits and sell stops).
+        self._bid_limits: list[tuple] = []
+        self._bid_stops: list[tuple] = []
+        self._ask_limits: list[tuple] = []
+        self._ask_stops: list[tuple] = []
 
     @property
     def bid(self) -> Optional[Price]:
@@ -114,21 +138,70 @@ cdef class MatchingCore:
         return client_order_id in self._orders
 
     cpdef list get_orders(self):
-        return self._orders_bid + self._orders_ask
+        return self.get_orders_bid() + self.get_orders_ask()
 
     cpdef list get_orders_bid(self):
-        return self._orders_bid
+        # Highest matching price first
+        return _orders_by_priority(self._bid_limits, self._bid_stops)
 
     cpdef list get_orders_ask(self):
-        return self._orders_ask
+        # Lowest matching price first
+        return _orders_by_priority(self._ask_limits, self._ask_stops)
+
+    cpdef list get_orders_managed(self):
+        return list(self._orders_managed.values())
+
+    cpdef bint has_orders(self) except *:
+        return len(self._orders) > 0
+
+    cpdef bint has_orders_managed(self) except *:
+        return len(self._orders_managed) > 0
+
+    cpdef bint is_crossed_within(
+        self,
+        int64_t bid_low_raw,
+        int64_t bid_high_raw,
+        int64_t ask_low_raw,
+        int64_t ask_high_raw,
+    ) except *:
+        """
+        Return whether any order would match or trigger at some bid and ask
+        within the given raw price ranges.
+
+        Parameters
+        ----------
+        bid_low_raw : int64_t
+            The lowest raw bid price.
+        bid_high_raw : int64_t
+            The highest raw bid price.
+        ask_low_raw : int64_t
+            The lowest raw ask price.
+        ask_high_raw : int64_t
+            The highest raw ask price.
+
+        Returns
+        -------
+        bool
+
+        """
+        return (
+            _any_crossed(self._bid_limits, -ask_low_raw)
+            or _any_crossed(self._bid_stops, ask_high_raw)
+            or _any_crossed(self._ask_limits, bid_high_raw)
+            or _any_crossed(self._ask_stops, -bid_low_raw)
+        )
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cdef void set_bid(self, Price_t bid) except *:
+        if not self.is_bid_initialized:
+            self._is_idle = False
         self.is_bid_initialized = True
         self.bid_raw = bid.raw
 
     cdef void set_ask(self, Price_t ask) except *:
+        if not self.is_ask_initialized:
+            self._is_idle = False
         self.is_ask_initialized = True
         self.ask_raw = ask.raw
 
@@ -138,8 +211,16 @@ cdef class MatchingCore:
 
     cpdef void reset(self) except *:
         self._orders.clear()
-        self._orders_bid.clear()
-        self._orders_ask.clear()
+        self._orders_managed.clear()
+        self._index.clear()
+        self._bid_limits.clear()
+        self._bid_stops.clear()
+        self._ask_limits.clear()
+        self._ask_stops.clear()
+        self._seq = 0
+        self._is_idle = False
+        self._idle_bid_raw = 0
+        self._idle_ask_raw = 0
         self.bid_raw = 0
         self.ask_raw = 0
         self.last_raw = 0
@@ -152,33 +233,98 @@ cdef class MatchingCore:
         self._add_order(order)
 
     cdef void _add_order(self, Order order) except *:
-        # Index order
+        if order.side != OrderSide.BUY and order.side != OrderSide.SELL:
+            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+
         self._orders[order.client_order_id] = order
+        if (
+            order.expire_time_ns > 0
+            or order.order_type == OrderType.TRAILING_STOP_MARKET
+            or order.order_type == OrderType.TRAILING_STOP_LIMIT
+        ):
+            self._orders_managed[order.client_order_id] = order
+
+        self._seq += 1
+        self._index_order(order, self._seq)
+
+    cpdef void update_order(self, Order order) except *:
+        if order.client_order_id not in self._orders:
+            return  # Not held by the core
 
-        if order.side == OrderSide.BUY:
-            self._orders_bid.append(order)
-            self._orders_bid.sort(key=lambda o: o.price if (o.order_type == OrderType.LIMIT or o.order_type == OrderType.MARKET_TO_LIMIT) or (o.order_type == OrderType.STOP_LIMIT and o.is_triggered) else o.trigger_price or INT_MIN, reverse=True)  # noqa  TODO(cs): Will refactor!
-        elif order.side == OrderSide.SELL:
-            self._orders_ask.append(order)
-            self._orders_ask.sort(key=lambda o: o.price if (o.order_type == OrderType.LIMIT or o.order_type == OrderType.MARKET_TO_LIMIT) or (o.order_type == OrderType.STOP_LIMIT and o.is_triggered) else o.trigger_price or INT_MAX)  # noqa  TODO(cs): Will refactor!
+        cdef tuple indexed = self._index.get(order.client_order_id)
+        cdef uint64_t seq
+        if indexed is not None:
+            seq = indexed[1][1]  # Keep original priority for ties
+            self._unindex_order(order)
         else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+            self._seq += 1  # Price now set for the first time
+            seq = self._seq
+        self._index_order(order, seq)
 
     cpdef void delete_order(self, Order order) except *:
         self._orders.pop(order.client_order_id, None)
-
-        if order.side == OrderSide.BUY:
-            if order in self._orders_bid:
-                self._orders_bid.remove(order)
-        elif order.side == OrderSide.SELL:
-            if order in self._orders_ask:
-                self._orders_ask.remove(order)
+        self._orders_managed.pop(order.client_order_id, None)
+        self._unindex_order(order)
+
+    cdef void _index_order(self, Order order, uint64_t seq) except *:
+        cdef bint is_buy = order.side == OrderSide.BUY
+        cdef list orders
+        cdef Price price
+        if _is_limit_matched(order):
+            price = order.price
+            orders = self._bid_limits if is_buy else self._ask_limits
         else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+            price = order.trigger_price
+            orders = self._bid_stops if is_buy else self._ask_stops
+            is_buy = not is_buy  # Stops trigger in the opposite direction to limits
+        if price is None:
+            return  # Cannot match until a price is set (see `update_order`)
+
+        cdef tuple entry = (-price._mem.raw if is_buy else price._mem.raw, seq, order)
+        insort(orders, entry)
+        self._index[order.client_order_id] = (orders, entry)
+        self._is_idle = False  # Order may already be crossed
+
+    cdef void _unindex_order(self, Order order) except *:
+        cdef tuple indexed = self._index.pop(order.client_order_id, None)
+        if indexed is None:
+            return  # Not indexed
+        cdef list orders = indexed[0]
+        del orders[bisect_left(orders, indexed[1])]
 
     cpdef void iterate(self, uint64_t timestamp_ns) except *:
+        if (
+            self._is_idle
+            and self.bid_raw == self._idle_bid_raw
+            and self.ask_raw == self._idle_ask_raw
+        ):
+            return  # Top of book unchanged and nothing was crossed
+
+        self._is_idle = True
+        self._idle_bid_raw = self.bid_raw
+        self._idle_ask_raw = self.ask_raw
+
+        cdef list crossed
+        if self.is_ask_initialized:
+            crossed = _crossed(self._bid_limits, -self.ask_raw, False)
+            crossed += _crossed(self._bid_stops, self.ask_raw, True)
+            if crossed:
+                self._is_idle = False  # Unfilled orders may match on the next iteration
+                self._match_crossed(crossed)
+        if self.is_bid_initialized:
+            crossed = _crossed(self._ask_limits, self.bid_raw, False)
+            crossed += _crossed(self._ask_stops, -self.bid_raw, True)
+            if crossed:
+                self._is_idle = False
+                self._match_crossed(crossed)
+
+    cdef void _match_crossed(self, list crossed) except *:
+        crossed.sort()  # Priority order (see `get_orders_bid` and `get_orders_ask`)
+
+        cdef tuple entry
         cdef Order order
-        for order in self._orders_bid + self._orders_ask:  # Lists implicitly copied
+        for entry in crossed:
+            order = entry[2]
             if order.is_closed_c():
                 continue  # Orders state has changed since the loop started
             self.match_order(order)
@@ -244,3 +390,32 @@ cdef class MatchingCore:
             return self.bid_raw <= price._mem.raw
         else:
             raise ValueError(f"invalid `OrderSide`, was {side}")  # pragma: no cover (design-time error)
+
+
+cdef inline bint _is_limit_matched(Order order) except *:
+    # Return whether the order matches on its limit price (rather than trigger price)
+    return (
+        order.order_type == OrderType.LIMIT
+        or order.order_type == OrderType.MARKET_TO_LIMIT
+        or (order.has_trigger_price_c() and order.has_price_c() and order.is_triggered)
+    )
+
+
+cdef inline bint _any_crossed(list orders, int64_t key) except *:
+    # Return whether any index entry is at or below `key`
+    return len(orders) > 0 and orders[0][0] <= key
+
+
+cdef list _crossed(list orders, int64_t key, bint flip):
+    # Return the prefix of index entries at or below `key`, in priority order
+    # for the side (keys are flipped back for stop entries)
+    cdef list crossed = orders[:bisect_left(orders, (key + 1,))]
+    if flip:
+        return [(-entry[0], entry[1], entry[2]) for entry in crossed]
+    return crossed
+
+
+cdef list _orders_by_priority(list limits, list stops):
+    cdef list entries = limits + [(-entry[0], entry[1], entry[2]) for entry in stops]
+    entries.sort()
+    return [entry[2] for entry in entries]
@@ -17,6 +17,8 @@ from nautilus_trader.model.c_enums.bar_aggregation import BarAggregationParser
 from nautilus_trader.model.c_enums.price_type import PriceTypeParser
 
 from cpython.object cimport PyObject
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -692,6 +694,37 @@ cdef class Bar(Data):
     cdef str to_str(self):
         return <str>bar_to_pystr(&self._mem)
 
+    @staticmethod
+    cdef Bar from_raw_c(
+        BarType bar_type,
+        int64_t raw_open,
+        int64_t raw_high,
+        int64_t raw_low,
+        int64_t raw_close,
+        uint8_t price_prec,
+        uint64_t raw_volume,
+        uint8_t size_prec,
+        uint64_t ts_event,
+        uint64_t ts_init,
+    ):
+        cdef Bar bar = Bar.__new__(Bar)
+        bar.ts_event = ts_event
+        bar.ts_init = ts_init
+        bar._mem = bar_new_from_raw(
+            bar_type._mem,
+            raw_open,
+            raw_high,
+            raw_low,
+            raw_close,
+            price_prec,
+            raw_volume,
+            size_prec,
+            ts_event,
+            ts_init,
+        )
+
+        return bar
+
     def __str__(self) -> str:
         return self.to_str()
 
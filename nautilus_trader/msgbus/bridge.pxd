@@ -0,0 +1,57 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.msgbus.bus cimport MessageBus
+from nautilus_trader.msgbus.codec cimport MessageCodec
+from nautilus_trader.msgbus.codec cimport MessageKind
+
+
+cdef class MessageBusBridge:
+    cdef object _loop
+    cdef LoggerAdapter _log
+    cdef MessageBus _msgbus
+    cdef MessageCodec _codec
+    cdef list _topics
+    cdef list _endpoints
+    cdef dict _handlers
+    cdef dict _forwarding
+    cdef list _writers
+    cdef set _tasks
+    cdef int _max_buffer_size
+    cdef object _inbound
+    cdef object _inbound_source
+    cdef bint _is_attached
+
+    cdef readonly str path
+    """The Unix domain socket path for the bridge.\n\n:returns: `str`"""
+    cdef readonly int sent_count
+    """The count of messages written to peers.\n\n:returns: `int`"""
+    cdef readonly int recv_count
+    """The count of messages received from peers.\n\n:returns: `int`"""
+
+    cdef void _attach(self) except *
+    cdef void _detach(self) except *
+    cdef void _write(self, MessageKind kind, str name, msg) except *
+    cdef void _handle_frame(self, MessageKind kind, str name, msg, writer) except *
+    cdef void _close_writer(self, writer) except *
+
+
+cdef class MessageBusBridgeServer(MessageBusBridge):
+    cdef object _server
+
+
+cdef class MessageBusBridgeClient(MessageBusBridge):
+    pass
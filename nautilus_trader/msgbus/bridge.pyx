@@ -0,0 +1,485 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import functools
+import os
+import stat
+import struct
+from typing import Any
+
+from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.msgbus.bus cimport MessageBus
+from nautilus_trader.msgbus.codec cimport MessageCodec
+from nautilus_trader.msgbus.codec cimport MessageKind
+from nautilus_trader.msgbus.wildcard cimport is_matching
+from nautilus_trader.serialization.base cimport Serializer
+
+from nautilus_trader.msgbus.codec import FRAME_PREFIX_SIZE
+
+
+cdef class MessageBusBridge:
+    """
+    The abstract base class for all message bus bridges.
+
+    A bridge forwards message bus traffic between local processes, so that
+    components can run on their own cores while still communicating over the
+    bus. Peers are connected over a Unix domain socket, with messages encoded
+    by a `MessageCodec`.
+
+    Messages published on the local bus for any of the `topics` are forwarded
+    to all connected peers. Each of the `endpoints` is registered on the local
+    bus, with messages sent to it forwarded to all connected peers. Messages
+    received from a peer are published or sent on the local bus (and are not
+    forwarded back to that peer).
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop for the bridge.
+    msgbus : MessageBus
+        The local message bus for the bridge.
+    logger : Logger
+        The logger for the bridge.
+    path : str
+        The Unix domain socket path for the bridge.
+    topics : list[str], optional
+        The topics to forward publishes for. May include wildcard characters
+        `*` and `?`.
+    endpoints : list[str], optional
+        The endpoints to forward sends for (must not already be registered on
+        the local bus).
+    serializer : Serializer, optional
+        The serializer for message payloads. If ``None`` then a
+        `MsgPackSerializer` is used.
+    max_buffer_size : int, default 10_000_000
+        The maximum bytes buffered for a peer before it is disconnected as a
+        slow consumer.
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a valid string.
+    ValueError
+        If `max_buffer_size` is not positive (> 0).
+
+    Warnings
+    --------
+    This class should not be used directly, but through a concrete subclass.
+
+    Messages sent to the `endpoints` are forwarded to **every** connected peer,
+    so each endpoint must be registered in only one peer process, otherwise
+    the message is handled once by each process with the endpoint registered.
+    """
+
+    def __init__(
+        self,
+        loop not None: asyncio.AbstractEventLoop,
+        MessageBus msgbus not None,
+        Logger logger not None,
+        str path,
+        list topics = None,
+        list endpoints = None,
+        Serializer serializer = None,
+        int max_buffer_size = 10_000_000,
+    ):
+        if topics is None:
+            topics = []
+        if endpoints is None:
+            endpoints = []
+        Condition.valid_string(path, "path")
+        Condition.list_type(topics, str, "topics")
+        Condition.list_type(endpoints, str, "endpoints")
+        Condition.positive_int(max_buffer_size, "max_buffer_size")
+
+        self.path = path
+        self.sent_count = 0
+        self.recv_count = 0
+
+        self._loop = loop
+        self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
+        self._msgbus = msgbus
+        self._codec = MessageCodec(serializer)
+        self._topics = topics
+        self._endpoints = endpoints
+        self._handlers: dict[str, functools.partial] = {}
+        self._forwarding: dict[str, bool] = {}  # Cached topic filter
+        self._writers: list[asyncio.StreamWriter] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._max_buffer_size = max_buffer_size
+        self._inbound = None  # Message currently being dispatched from a peer
+        self._inbound_source = None  # Writer for the peer of the inbound message
+        self._is_attached = False
+
+    @property
+    def peer_count(self) -> int:
+        """
+        The count of connected peers.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._writers)
+
+    def _on_publish(self, str topic, msg: Any) -> None:
+        forward = self._forwarding.get(topic)
+        if forward is None:
+            forward = any(is_matching(topic, pattern) for pattern in self._topics)
+            self._forwarding[topic] = forward
+
+        if forward and self._writers:
+            self._write(MessageKind.PUBLISH, topic, msg)
+
+    def _on_send(self, str endpoint, msg: Any) -> None:
+        if not self._writers:
+            self._log.error(f"Cannot send message to '{endpoint}': no peers connected.")
+            return
+
+        self._write(MessageKind.SEND, endpoint, msg)
+
+    async def _read(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                prefix = await reader.readexactly(FRAME_PREFIX_SIZE)
+                frame = await reader.readexactly(MessageCodec.frame_length(prefix))
+                try:
+                    kind, name, msg = self._codec.decode(frame)
+                except (struct.error, UnicodeDecodeError, ValueError, RuntimeError) as e:
+                    self._log.error(
+                        f"Cannot decode frame of {len(frame):,} bytes "
+                        f"from {_peer_name(writer)}: {e!r}.",
+                    )
+                    continue
+                try:
+                    self._handle_frame(kind, name, msg, writer)
+                except Exception as e:
+                    self._log.exception("Error handling frame", e)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Peer disconnected
+        finally:
+            self._close_writer(writer)
+
+    cdef void _attach(self) except *:
+        if self._is_attached:
+            return
+
+        cdef str endpoint
+        for endpoint in self._endpoints:
+            handler = functools.partial(self._on_send, endpoint)
+            self._msgbus.register(endpoint, handler)
+            self._handlers[endpoint] = handler
+
+        if self._topics:
+            self._msgbus.add_listener(self._on_publish)
+
+        self._is_attached = True
+
+    cdef void _detach(self) except *:
+        if not self._is_attached:
+            return
+
+        cdef str endpoint
+        for endpoint, handler in self._handlers.items():
+            self._msgbus.deregister(endpoint, handler)
+        self._handlers.clear()
+
+        if self._topics:
+            self._msgbus.remove_listener(self._on_publish)
+
+        self._is_attached = False
+
+    cdef void _write(self, MessageKind kind, str name, msg) except *:
+        cdef bytes frame
+        try:
+            frame = self._codec.encode(kind, name, msg)
+        except RuntimeError:
+            self._log.error(f"Cannot forward {type(msg).__name__} for '{name}': not serializable.")
+            return
+
+        for writer in list(self._writers):
+            if writer is self._inbound_source and msg is self._inbound:
+                continue  # Do not echo back to the peer
+            if writer.transport.get_write_buffer_size() > self._max_buffer_size:
+                self._log.error("Disconnecting slow peer: write buffer full.")
+                self._close_writer(writer)
+                continue
+            writer.write(frame)
+            self.sent_count += 1
+
+    cdef void _handle_frame(self, MessageKind kind, str name, msg, writer) except *:
+        self.recv_count += 1
+
+        self._inbound = msg
+        self._inbound_source = writer
+        try:
+            if kind == MessageKind.PUBLISH:
+                self._msgbus.publish_c(name, msg)
+            elif kind == MessageKind.SEND:
+                self._msgbus.send(name, msg)
+            else:
+                self._log.error(f"Cannot handle frame: unrecognized message kind {kind}.")
+        finally:
+            self._inbound = None
+            self._inbound_source = None
+
+    cdef void _close_writer(self, writer) except *:
+        if writer not in self._writers:
+            return
+
+        self._writers.remove(writer)
+        writer.close()
+        self._log.info("Peer disconnected.")
+
+    async def _cancel_tasks(self):
+        cdef list tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for writer in list(self._writers):
+            self._close_writer(writer)
+
+
+cdef class MessageBusBridgeServer(MessageBusBridge):
+    """
+    Provides a message bus bridge which listens for local peer processes.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop for the bridge.
+    msgbus : MessageBus
+        The local message bus for the bridge.
+    logger : Logger
+        The logger for the bridge.
+    path : str
+        The Unix domain socket path to listen on.
+    topics : list[str], optional
+        The topics to forward publishes for. May include wildcard characters
+        `*` and `?`.
+    endpoints : list[str], optional
+        The endpoints to forward sends for (must not already be registered on
+        the local bus).
+    serializer : Serializer, optional
+        The serializer for message payloads. If ``None`` then a
+        `MsgPackSerializer` is used.
+    max_buffer_size : int, default 10_000_000
+        The maximum bytes buffered for a peer before it is disconnected as a
+        slow consumer.
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a valid string.
+    ValueError
+        If `max_buffer_size` is not positive (> 0).
+    """
+
+    def __init__(
+        self,
+        loop not None: asyncio.AbstractEventLoop,
+        MessageBus msgbus not None,
+        Logger logger not None,
+        str path,
+        list topics = None,
+        list endpoints = None,
+        Serializer serializer = None,
+        int max_buffer_size = 10_000_000,
+    ):
+        super().__init__(
+            loop=loop,
+            msgbus=msgbus,
+            logger=logger,
+            path=path,
+            topics=topics,
+            endpoints=endpoints,
+            serializer=serializer,
+            max_buffer_size=max_buffer_size,
+        )
+
+        self._server = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        If the server is listening for peers.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._server is not None
+
+    async def start(self):
+        """
+        Start listening for peers and forwarding messages.
+
+        A socket file left at the path by a server which did not shut down
+        cleanly is removed first.
+        """
+        if self._server is not None:
+            self._log.warning("Already running.")
+            return
+
+        await _remove_stale_socket(self.path)
+        self._server = await asyncio.start_unix_server(self._on_connection, path=self.path)
+        self._attach()
+        self._log.info(f"Listening on {self.path}.")
+
+    async def stop(self):
+        """
+        Stop forwarding messages and disconnect all peers.
+        """
+        if self._server is None:
+            self._log.warning("Not running.")
+            return
+
+        self._detach()
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        await _remove_stale_socket(self.path)
+        await self._cancel_tasks()
+        self._log.info("Stopped.")
+
+    def _on_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.append(writer)
+        task = self._loop.create_task(self._read(reader, writer))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self._log.info("Peer connected.")
+
+
+cdef class MessageBusBridgeClient(MessageBusBridge):
+    """
+    Provides a message bus bridge which connects to a `MessageBusBridgeServer`.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop for the bridge.
+    msgbus : MessageBus
+        The local message bus for the bridge.
+    logger : Logger
+        The logger for the bridge.
+    path : str
+        The Unix domain socket path of the server.
+    topics : list[str], optional
+        The topics to forward publishes for. May include wildcard characters
+        `*` and `?`.
+    endpoints : list[str], optional
+        The endpoints to forward sends for (must not already be registered on
+        the local bus).
+    serializer : Serializer, optional
+        The serializer for message payloads. If ``None`` then a
+        `MsgPackSerializer` is used.
+    max_buffer_size : int, default 10_000_000
+        The maximum bytes buffered before the server is disconnected as a
+        slow consumer.
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a valid string.
+    ValueError
+        If `max_buffer_size` is not positive (> 0).
+    """
+
+    def __init__(
+        self,
+        loop not None: asyncio.AbstractEventLoop,
+        MessageBus msgbus not None,
+        Logger logger not None,
+        str path,
+        list topics = None,
+        list endpoints = None,
+        Serializer serializer = None,
+        int max_buffer_size = 10_000_000,
+    ):
+        super().__init__(
+            loop=loop,
+            msgbus=msgbus,
+            logger=logger,
+            path=path,
+            topics=topics,
+            endpoints=endpoints,
+            serializer=serializer,
+            max_buffer_size=max_buffer_size,
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        """
+        If the client is connected to the server.
+
+        Returns
+        -------
+        bool
+
+        """
+        return len(self._writers) > 0
+
+    async def connect(self):
+        """
+        Connect to the server and start forwarding messages.
+        """
+        if self._writers:
+            self._log.warning("Already connected.")
+            return
+
+        reader, writer = await asyncio.open_unix_connection(path=self.path)
+        self._writers.append(writer)
+        task = self._loop.create_task(self._read(reader, writer))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self._attach()
+        self._log.info(f"Connected to {self.path}.")
+
+    async def disconnect(self):
+        """
+        Stop forwarding messages and disconnect from the server.
+        """
+        self._detach()
+        await self._cancel_tasks()
+        self._log.info("Disconnected.")
+
+
+cdef str _peer_name(writer):
+    peer = writer.get_extra_info("peername")
+    if peer:
+        return repr(peer)
+    sock = writer.get_extra_info("socket")
+    return f"peer fd {sock.fileno()}" if sock is not None else "unknown peer"
+
+
+async def _remove_stale_socket(str path):
+    # Remove a Unix domain socket file at the path which no server is listening on
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return
+    except FileNotFoundError:
+        return
+
+    try:
+        _, writer = await asyncio.open_unix_connection(path=path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+    else:
+        writer.close()  # A server is listening, so leave the socket for bind to fail
@@ -15,10 +15,13 @@
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.message cimport Request
 from nautilus_trader.core.message cimport Response
 from nautilus_trader.model.identifiers cimport TraderId
+from nautilus_trader.msgbus.metrics cimport MessageBusMetrics
 from nautilus_trader.msgbus.subscription cimport Subscription
+from nautilus_trader.msgbus.trie cimport TopicTrie
 
 
 cdef class MessageBus:
@@ -26,8 +29,15 @@ cdef class MessageBus:
     cdef LoggerAdapter _log
     cdef dict _subscriptions
     cdef dict _patterns
+    cdef dict _subscription_index
+    cdef int _subscription_seq
+    cdef TopicTrie _subscription_trie
+    cdef TopicTrie _pattern_trie
     cdef dict _endpoints
     cdef dict _correlation_index
+    cdef Profiler _profiler
+    cdef MessageBusMetrics _metrics
+    cdef list _listeners
 
     cdef readonly TraderId trader_id
     """The trader ID associated with the bus.\n\n:returns: `TraderId`"""
@@ -44,6 +54,10 @@ cdef class MessageBus:
     cpdef list topics(self)
     cpdef list subscriptions(self, str pattern=*)
     cpdef bint has_subscribers(self, str pattern=*)
+    cpdef void set_profiler(self, Profiler profiler) except *
+    cpdef void set_metrics(self, MessageBusMetrics metrics) except *
+    cpdef void add_listener(self, listener) except *
+    cpdef void remove_listener(self, listener) except *
 
     cpdef void register(self, str endpoint, handler) except *
     cpdef void deregister(self, str endpoint, handler) except *
@@ -54,4 +68,6 @@ cdef class MessageBus:
     cpdef void unsubscribe(self, str topic, handler) except *
     cpdef void publish(self, str topic, msg) except *
     cdef void publish_c(self, str topic, msg) except *
+    cdef void _publish_profiled(self, str topic, Subscription[:] subs, msg) except *
     cdef Subscription[:] _resolve_subscriptions(self, str topic)
+    cdef list _sorted_subscriptions(self, list subs)
@@ -13,17 +13,22 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from typing import Any, Callable
+from time import perf_counter_ns
+from typing import Any, Callable, Optional
 
 import cython
 import numpy as np
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.model.identifiers cimport TraderId
-from nautilus_trader.msgbus.wildcard cimport is_matching
+from nautilus_trader.msgbus.metrics cimport MessageBusMetrics
+from nautilus_trader.msgbus.trie cimport TopicTrie
 
 
 cdef class MessageBus:
@@ -86,7 +91,14 @@ cdef class MessageBus:
         self._endpoints: dict[str, Callable[[Any], None]] = {}
         self._patterns: dict[str, Subscription[:]] = {}
         self._subscriptions: dict[Subscription, list[str]] = {}
+        self._subscription_index: dict[Subscription, int] = {}  # Insertion sequence
+        self._subscription_seq = 0
+        self._subscription_trie = TopicTrie()  # Subscriptions by topic (pattern)
+        self._pattern_trie = TopicTrie()  # Resolved publish topics
         self._correlation_index: dict[UUID4, Callable[[Any], None]] = {}
+        self._profiler: Optional[Profiler] = None
+        self._metrics: Optional[MessageBusMetrics] = None
+        self._listeners: list[Callable[[str, Any], None]] = []
 
         # Counters
         self.sent_count = 0
@@ -132,10 +144,12 @@ cdef class MessageBus:
 
         """
         if pattern is None:
-            pattern = "*"  # Wildcard
+            return list(self._subscriptions)  # All topics
         Condition.valid_string(pattern, "pattern")
 
-        return [s for s in self._subscriptions if is_matching(s.topic, pattern)]
+        cdef list subs = self._subscription_trie.find_matching(pattern)
+        subs.sort(key=self._subscription_index.__getitem__)
+        return subs
 
     cpdef bint has_subscribers(self, str pattern = None):
         """
@@ -154,6 +168,79 @@ cdef class MessageBus:
         """
         return len(self.subscriptions(pattern)) > 0
 
+    cpdef void set_profiler(self, Profiler profiler) except *:
+        """
+        Set the profiler to record sends, publishes and handler calls with.
+
+        Parameters
+        ----------
+        profiler : Profiler, optional
+            The profiler (``None`` to disable profiling).
+
+        """
+        self._profiler = profiler
+
+    cpdef void set_metrics(self, MessageBusMetrics metrics) except *:
+        """
+        Set the metrics to record published topics and handler latencies with.
+
+        Parameters
+        ----------
+        metrics : MessageBusMetrics, optional
+            The metrics (``None`` to disable metrics).
+
+        """
+        self._metrics = metrics
+
+    cpdef void add_listener(self, listener: Callable[[str, Any], None]) except *:
+        """
+        Add the given `listener` to receive every message published on the bus.
+
+        The listener is called with the topic and message of each publish, prior
+        to the subscription handlers. This is intended for forwarding and
+        recording bus traffic rather than for normal message handling.
+
+        Parameters
+        ----------
+        listener : Callable[[str, Any], None]
+            The listener to add.
+
+        Raises
+        ------
+        ValueError
+            If `listener` is not of type `Callable`.
+        KeyError
+            If `listener` has already been added.
+
+        """
+        Condition.callable(listener, "listener")
+        Condition.not_in(listener, self._listeners, "listener", "_listeners")
+
+        self._listeners.append(listener)
+
+        self._log.debug(f"Added listener {listener}.")
+
+    cpdef void remove_listener(self, listener: Callable[[str, Any], None]) except *:
+        """
+        Remove the given `listener` from the bus.
+
+        Parameters
+        ----------
+        listener : Callable[[str, Any], None]
+            The listener to remove.
+
+        Raises
+        ------
+        KeyError
+            If `listener` has not been added.
+
+        """
+        Condition.is_in(listener, self._listeners, "listener", "_listeners")
+
+        self._listeners.remove(listener)
+
+        self._log.debug(f"Removed listener {listener}.")
+
     cpdef void register(self, str endpoint, handler: Callable[[Any], None]) except *:
         """
         Register the given `handler` to receive messages at the `endpoint` address.
@@ -237,7 +324,13 @@ cdef class MessageBus:
             )
             return  # Cannot send
 
-        handler(msg)
+        cdef uint64_t ts_start
+        if self._profiler is None:
+            handler(msg)
+        else:
+            ts_start = perf_counter_ns()
+            handler(msg)
+            self._profiler.record(f"MessageBus.send {endpoint}", perf_counter_ns() - ts_start)
         self.sent_count += 1
 
     cpdef void request(self, str endpoint, Request request) except *:
@@ -354,18 +447,20 @@ cdef class MessageBus:
             self._log.warning(f"{sub} already exists.")
             return
 
-        cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
+        self._subscription_index[sub] = self._subscription_seq
+        self._subscription_seq += 1
+        self._subscription_trie.add(topic, sub)
+
+        # Add to the subscribers of all resolved topic patterns which match
+        cdef list matches = self._pattern_trie.find_matching(topic)
 
         cdef str pattern
         cdef list subs
-        for pattern in patterns:
-            if is_matching(topic, pattern):
-                subs = list(self._patterns[pattern])
-                subs.append(sub)
-                subs = sorted(subs, reverse=True)
-                self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
-                matches.append(pattern)
+        for pattern in matches:
+            subs = list(self._patterns[pattern])
+            subs.append(sub)
+            subs = sorted(subs, reverse=True)
+            self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
 
         self._subscriptions[sub] = sorted(matches)
 
@@ -411,6 +506,8 @@ cdef class MessageBus:
             self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
 
         del self._subscriptions[sub]
+        del self._subscription_index[sub]
+        self._subscription_trie.remove(topic, sub)
 
         self._log.debug(f"Removed {sub}.")
 
@@ -443,23 +540,48 @@ cdef class MessageBus:
             # Add the topic pattern and get matching subscribers
             subs = self._resolve_subscriptions(topic)
 
+        cdef int i
+        if self._listeners:
+            for i in range(len(self._listeners)):
+                self._listeners[i](topic, msg)
+
+        if self._profiler is not None or self._metrics is not None:
+            self._publish_profiled(topic, subs, msg)
+            return
+
         # Send message to all matched subscribers
+        for i in range(len(subs)):
+            subs[i].handler(msg)
+
+        self.pub_count += 1
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _publish_profiled(self, str topic, Subscription[:] subs, msg: Any) except *:
+        cdef uint64_t ts_publish = perf_counter_ns()
+        cdef uint64_t ts_handler
+        cdef uint64_t elapsed_ns
         cdef int i
         for i in range(len(subs)):
+            ts_handler = perf_counter_ns()
             subs[i].handler(msg)
+            elapsed_ns = perf_counter_ns() - ts_handler
+            if self._profiler is not None:
+                self._profiler.record_handler(subs[i].handler, elapsed_ns)
+            if self._metrics is not None:
+                self._metrics.record_handler(topic, subs[i].handler, elapsed_ns)
 
         self.pub_count += 1
+        if self._metrics is not None:
+            self._metrics.record_publish(topic)
+        if self._profiler is not None:
+            self._profiler.record(f"MessageBus.publish {topic}", perf_counter_ns() - ts_publish)
 
     cdef Subscription[:] _resolve_subscriptions(self, str topic):
-        cdef list subs_list = []
-        cdef Subscription existing_sub
-        for existing_sub in self._subscriptions:
-            if is_matching(topic, existing_sub.topic):
-                subs_list.append(existing_sub)
-
-        subs_list = sorted(subs_list, reverse=True)
+        cdef list subs_list = self._sorted_subscriptions(self._subscription_trie.match(topic))
         cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
         self._patterns[topic] = subs_array
+        self._pattern_trie.add(topic, topic)
 
         cdef list matches
         for sub in subs_array:
@@ -469,3 +591,9 @@ cdef class MessageBus:
             self._subscriptions[sub] = sorted(matches)
 
         return subs_array
+
+    cdef list _sorted_subscriptions(self, list subs):
+        # Highest priority first, then in subscription order
+        subs.sort(key=self._subscription_index.__getitem__)
+        subs.sort(reverse=True)  # Stable
+        return subs
@@ -0,0 +1,28 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.serialization.base cimport Serializer
+
+
+cpdef enum MessageKind:
+    PUBLISH = 1,
+    SEND = 2,
+
+
+cdef class MessageCodec:
+    cdef Serializer _serializer
+
+    cpdef bytes encode(self, MessageKind kind, str name, msg)
+    cpdef tuple decode(self, bytes frame)
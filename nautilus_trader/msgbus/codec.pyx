@@ -0,0 +1,132 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import struct
+from typing import Any
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.serialization.base cimport Serializer
+from nautilus_trader.serialization.msgpack.serializer cimport MsgPackSerializer
+
+
+# Frame length prefix, followed by the message kind and the name length
+_LENGTH = struct.Struct("<I")
+_HEADER = struct.Struct("<BH")
+
+FRAME_PREFIX_SIZE = _LENGTH.size
+
+
+cdef class MessageCodec:
+    """
+    Provides a compact binary encoding of message bus messages.
+
+    Each message is encoded as a frame of:
+     - the length of the rest of the frame (`uint32`, little-endian).
+     - the message kind (`uint8`).
+     - the length of the topic or endpoint name (`uint16`), then its UTF-8 bytes.
+     - the serialized message payload.
+
+    Parameters
+    ----------
+    serializer : Serializer, optional
+        The serializer for message payloads. If ``None`` then a
+        `MsgPackSerializer` is used.
+    """
+
+    def __init__(self, Serializer serializer = None):
+        if serializer is None:
+            serializer = MsgPackSerializer()
+        self._serializer = serializer
+
+    cpdef bytes encode(self, MessageKind kind, str name, msg: Any):
+        """
+        Encode the given message to a frame.
+
+        Parameters
+        ----------
+        kind : MessageKind
+            The message kind.
+        name : str
+            The topic (publish) or endpoint (send) of the message.
+        msg : object
+            The message to encode.
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        ValueError
+            If `name` is not a valid string.
+        RuntimeError
+            If `msg` cannot be serialized.
+
+        """
+        Condition.valid_string(name, "name")
+
+        cdef bytes name_bytes = name.encode()
+        cdef bytes payload = self._serializer.serialize(msg)
+        cdef bytes header = _HEADER.pack(kind, len(name_bytes))
+        return b"".join((
+            _LENGTH.pack(len(header) + len(name_bytes) + len(payload)),
+            header,
+            name_bytes,
+            payload,
+        ))
+
+    cpdef tuple decode(self, bytes frame):
+        """
+        Decode the given frame (without its length prefix) to a message.
+
+        Parameters
+        ----------
+        frame : bytes
+            The frame to decode, following the length prefix.
+
+        Returns
+        -------
+        tuple[MessageKind, str, object]
+            The message kind, the topic or endpoint name, and the message.
+
+        Raises
+        ------
+        RuntimeError
+            If the payload cannot be deserialized.
+
+        """
+        Condition.not_none(frame, "frame")
+
+        kind, name_length = _HEADER.unpack_from(frame)
+        cdef int offset = _HEADER.size + name_length
+        cdef str name = frame[_HEADER.size:offset].decode()
+        return MessageKind(kind), name, self._serializer.deserialize(frame[offset:])
+
+    @staticmethod
+    def frame_length(bytes prefix) -> int:
+        """
+        Return the length of the frame following the given length `prefix`.
+
+        Parameters
+        ----------
+        prefix : bytes
+            The frame length prefix (`FRAME_PREFIX_SIZE` bytes).
+
+        Returns
+        -------
+        int
+
+        """
+        return _LENGTH.unpack(prefix)[0]
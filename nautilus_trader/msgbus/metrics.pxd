@@ -0,0 +1,49 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef class LatencyHistogram:
+    cdef dict _buckets
+
+    cdef readonly uint64_t count
+    """The count of recorded values.\n\n:returns: `uint64`"""
+    cdef readonly uint64_t total_ns
+    """The total of recorded values (nanoseconds).\n\n:returns: `uint64`"""
+    cdef readonly uint64_t min_ns
+    """The minimum recorded value (nanoseconds).\n\n:returns: `uint64`"""
+    cdef readonly uint64_t max_ns
+    """The maximum recorded value (nanoseconds).\n\n:returns: `uint64`"""
+
+    cpdef void record(self, uint64_t value_ns) except *
+    cpdef uint64_t percentile(self, double q) except *
+    cpdef dict buckets(self)
+    cpdef dict to_dict(self)
+
+
+cdef class MessageBusMetrics:
+    cdef dict _publish_counts
+    cdef dict _histograms
+    cdef dict _handler_names
+
+    cpdef void record_publish(self, str topic) except *
+    cpdef void record_handler(self, str topic, handler, uint64_t elapsed_ns) except *
+    cpdef dict publish_counts(self)
+    cpdef LatencyHistogram histogram(self, str topic, str handler_name)
+    cpdef dict stats(self)
+    cpdef list slowest_handlers(self, int n=*)
+    cpdef void dump(self, str path) except *
+    cpdef void reset(self) except *
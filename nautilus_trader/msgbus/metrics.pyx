@@ -0,0 +1,347 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import json
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.common.profiler cimport format_handler_name
+from nautilus_trader.core.correctness cimport Condition
+
+
+# Histogram precision (16 sub-buckets per power of two, ~6% relative error)
+cdef int _SUB_BITS = 4
+cdef uint64_t _SUB_COUNT = 1 << _SUB_BITS
+
+
+cdef class LatencyHistogram:
+    """
+    Provides a latency histogram with HDR-style log-linear buckets.
+
+    Values below 16ns are recorded exactly, larger values are recorded into one
+    of 16 linear sub-buckets for each power of two, bounding the relative error
+    of reported percentiles to ~6% over the full range, with fixed memory per
+    bucket recorded.
+    """
+
+    def __init__(self):
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    cpdef void record(self, uint64_t value_ns) except *:
+        """
+        Record the given value.
+
+        Parameters
+        ----------
+        value_ns : uint64_t
+            The value to record (nanoseconds).
+
+        """
+        cdef int index = _bucket_index(value_ns)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    cpdef uint64_t percentile(self, double q) except *:
+        """
+        Return the value at the given percentile.
+
+        The value is the highest value equivalent to the bucket containing the
+        percentile (capped at the maximum recorded value).
+
+        Parameters
+        ----------
+        q : double
+            The percentile in the range [0, 100].
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        ValueError
+            If `q` is not in range [0, 100].
+
+        """
+        Condition.in_range(q, 0.0, 100.0, "q")
+
+        if self.count == 0:
+            return 0
+
+        cdef double target = q / 100.0 * self.count
+        cdef uint64_t seen = 0
+        cdef int index
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= target:
+                return min(_bucket_upper(index), self.max_ns)
+
+        return self.max_ns  # pragma: no cover (design-time error)
+
+    cpdef dict buckets(self):
+        """
+        Return the recorded counts by bucket lower bound (nanoseconds).
+
+        Returns
+        -------
+        dict[int, int]
+
+        """
+        return {_bucket_lower(i): self._buckets[i] for i in sorted(self._buckets)}
+
+    cpdef dict to_dict(self):
+        """
+        Return a dictionary representation of the histogram summary.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "min_ns": self.min_ns,
+            "mean_ns": self.total_ns // self.count if self.count else 0,
+            "p50_ns": self.percentile(50.0),
+            "p90_ns": self.percentile(90.0),
+            "p99_ns": self.percentile(99.0),
+            "p999_ns": self.percentile(99.9),
+            "max_ns": self.max_ns,
+        }
+
+
+cdef inline int _bucket_index(uint64_t value) except *:
+    if value < _SUB_COUNT:
+        return <int>value
+    cdef int shift = -_SUB_BITS - 1
+    cdef uint64_t v = value
+    while v:
+        v >>= 1
+        shift += 1
+    # The top `_SUB_BITS` + 1 bits select the sub-bucket
+    return <int>((shift + 1) * _SUB_COUNT + ((value >> shift) - _SUB_COUNT))
+
+
+cdef inline uint64_t _bucket_lower(int index) except *:
+    if index < <int>_SUB_COUNT:
+        return index
+    cdef int shift = index // _SUB_COUNT - 1
+    return (index % _SUB_COUNT + _SUB_COUNT) << shift
+
+
+cdef inline uint64_t _bucket_upper(int index) except *:
+    if index < <int>_SUB_COUNT:
+        return index
+    cdef int shift = index // _SUB_COUNT - 1
+    return ((index % _SUB_COUNT + _SUB_COUNT + 1) << shift) - 1
+
+
+cdef class MessageBusMetrics:
+    """
+    Provides per topic and per handler metrics for a `MessageBus`.
+
+    Records the count of messages published on each topic, and a latency
+    histogram of handler execution for each handler subscribed to the topic.
+    Metrics are only recorded (and the timing cost paid) once set on a bus
+    with `MessageBus.set_metrics()`.
+
+    Handlers are named from the ID of their owning component where available
+    (otherwise the owner type), for instance EMACross-000.handle_bar.
+    """
+
+    def __init__(self):
+        self._publish_counts: dict[str, int] = {}
+        self._histograms: dict[str, dict[object, LatencyHistogram]] = {}
+        self._handler_names: dict[object, str] = {}
+
+    cpdef void record_publish(self, str topic) except *:
+        """
+        Record a message published on the given topic.
+
+        Parameters
+        ----------
+        topic : str
+            The topic published on.
+
+        """
+        self._publish_counts[topic] = self._publish_counts.get(topic, 0) + 1
+
+    cpdef void record_handler(self, str topic, handler, uint64_t elapsed_ns) except *:
+        """
+        Record a call of the given handler for a message on the given topic.
+
+        Parameters
+        ----------
+        topic : str
+            The topic published on.
+        handler : Callable
+            The handler which was called.
+        elapsed_ns : uint64_t
+            The elapsed wall time for the call (nanoseconds).
+
+        """
+        cdef dict handlers = self._histograms.get(topic)
+        if handlers is None:
+            handlers = {}
+            self._histograms[topic] = handlers
+
+        cdef LatencyHistogram histogram = handlers.get(handler)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            handlers[handler] = histogram
+            if handler not in self._handler_names:
+                self._handler_names[handler] = format_handler_name(handler)
+
+        histogram.record(elapsed_ns)
+
+    cpdef dict publish_counts(self):
+        """
+        Return the count of messages published per topic.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return dict(self._publish_counts)
+
+    cpdef LatencyHistogram histogram(self, str topic, str handler_name):
+        """
+        Return the latency histogram for the given topic and handler name.
+
+        Parameters
+        ----------
+        topic : str
+            The topic published on.
+        handler_name : str
+            The handler name (as per `stats()`).
+
+        Returns
+        -------
+        LatencyHistogram or ``None``
+
+        """
+        cdef dict handlers = self._histograms.get(topic)
+        if handlers is None:
+            return None
+
+        for handler, histogram in handlers.items():
+            if self._handler_names[handler] == handler_name:
+                return histogram
+
+        return None
+
+    cpdef dict stats(self):
+        """
+        Return the recorded statistics per topic.
+
+        Returns
+        -------
+        dict[str, dict]
+            The published count and handler latency summaries (keyed by
+            handler name) for each topic.
+
+        """
+        cdef dict stats = {}
+        cdef str topic
+        cdef dict handlers
+        # A topic may have handler latencies but no published count yet (if a
+        # handler raised before the publish completed)
+        for topic in {**self._publish_counts, **self._histograms}:
+            handlers = self._histograms.get(topic, {})
+            stats[topic] = {
+                "count": self._publish_counts.get(topic, 0),
+                "handlers": {
+                    self._handler_names[handler]: histogram.to_dict()
+                    for handler, histogram in handlers.items()
+                },
+            }
+
+        return stats
+
+    cpdef list slowest_handlers(self, int n = 10):
+        """
+        Return the handlers with the highest maximum latency.
+
+        Parameters
+        ----------
+        n : int, default 10
+            The maximum number of handlers to return.
+
+        Returns
+        -------
+        list[tuple[str, str, LatencyHistogram]]
+            The topic, handler name and histogram, ordered by maximum latency
+            (descending).
+
+        """
+        cdef list rows = [
+            (topic, self._handler_names[handler], histogram)
+            for topic, handlers in self._histograms.items()
+            for handler, histogram in handlers.items()
+        ]
+        rows.sort(key=_row_max_ns, reverse=True)
+        return rows[:n]
+
+    cpdef void dump(self, str path) except *:
+        """
+        Write the recorded statistics to the given path as JSON.
+
+        Includes the histogram bucket counts for each handler.
+
+        Parameters
+        ----------
+        path : str
+            The file path to write to.
+
+        """
+        Condition.valid_string(path, "path")
+
+        cdef dict stats = self.stats()
+        cdef str topic
+        for topic, handlers in self._histograms.items():
+            for handler, histogram in handlers.items():
+                stats[topic]["handlers"][self._handler_names[handler]]["buckets"] = {
+                    str(k): v for k, v in histogram.buckets().items()
+                }
+
+        with open(path, "w") as f:
+            json.dump(stats, f, indent=2)
+
+    cpdef void reset(self) except *:
+        """
+        Reset the metrics.
+
+        All recorded statistics are cleared.
+
+        """
+        self._publish_counts.clear()
+        self._histograms.clear()
+        self._handler_names.clear()
+
+
+def _row_max_ns(tuple row) -> int:
+    return row[2].max_ns
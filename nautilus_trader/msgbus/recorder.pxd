@@ -0,0 +1,51 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.msgbus.bus cimport MessageBus
+from nautilus_trader.msgbus.codec cimport MessageCodec
+
+
+cdef class MessageBusRecorder:
+    cdef Clock _clock
+    cdef LoggerAdapter _log
+    cdef MessageBus _msgbus
+    cdef MessageCodec _codec
+    cdef list _topics
+    cdef dict _recording
+    cdef set _skipped_types
+    cdef int _buffer_size
+    cdef object _file
+
+    cdef readonly str path
+    """The path of the log file.\n\n:returns: `str`"""
+    cdef readonly int record_count
+    """The count of messages recorded.\n\n:returns: `int`"""
+    cdef readonly int skipped_count
+    """The count of messages skipped as not serializable.\n\n:returns: `int`"""
+
+    cpdef void start(self) except *
+    cpdef void stop(self) except *
+
+
+cdef class MessageBusReplayer:
+    cdef MessageCodec _codec
+
+    cdef readonly str path
+    """The path of the log file.\n\n:returns: `str`"""
+
+    cpdef list load(self)
+    cpdef int replay(self, MessageBus msgbus, list records=*) except *
@@ -0,0 +1,296 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import struct
+from typing import Any
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.clock cimport TestClock
+from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.msgbus.bus cimport MessageBus
+from nautilus_trader.msgbus.codec cimport MessageCodec
+from nautilus_trader.msgbus.codec cimport MessageKind
+from nautilus_trader.msgbus.wildcard cimport is_matching
+from nautilus_trader.serialization.base cimport Serializer
+
+from nautilus_trader.msgbus.codec import FRAME_PREFIX_SIZE
+
+
+# Log file header, then a timestamp (`uint64`) preceding each message frame
+_MAGIC = b"NTBUSLOG\x01"
+_TIMESTAMP = struct.Struct("<Q")
+
+
+cdef class MessageBusRecorder:
+    """
+    Provides a recorder of the messages published on a message bus.
+
+    Each published message is appended to a binary log file as the publish
+    timestamp followed by a `MessageCodec` frame of the topic and serialized
+    message. The log can then be replayed with a `MessageBusReplayer`.
+
+    Parameters
+    ----------
+    msgbus : MessageBus
+        The message bus to record.
+    clock : Clock
+        The clock to timestamp messages with.
+    logger : Logger
+        The logger for the recorder.
+    path : str
+        The path of the log file (appended to if it already exists).
+    topics : list[str], optional
+        The topics to record. May include wildcard characters `*` and `?`.
+        If ``None`` then **all** topics are recorded.
+    serializer : Serializer, optional
+        The serializer for messages. If ``None`` then a `MsgPackSerializer`
+        is used.
+    buffer_size : int, default 1_048_576
+        The file write buffer size (bytes).
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a valid string.
+    ValueError
+        If `buffer_size` is not positive (> 0).
+
+    Notes
+    -----
+    Messages published by handlers in response to other messages are also
+    recorded. To replay into a bus with the same components attached, filter
+    `topics` to the inputs only (such as ``["data.*"]``) so that derived
+    messages are not published twice.
+
+    Messages which cannot be serialized are skipped, with a warning logged for
+    the first message of each type.
+    """
+
+    def __init__(
+        self,
+        MessageBus msgbus not None,
+        Clock clock not None,
+        Logger logger not None,
+        str path,
+        list topics = None,
+        Serializer serializer = None,
+        int buffer_size = 1_048_576,
+    ):
+        Condition.valid_string(path, "path")
+        Condition.positive_int(buffer_size, "buffer_size")
+        if topics is not None:
+            Condition.list_type(topics, str, "topics")
+
+        self.path = path
+        self.record_count = 0
+        self.skipped_count = 0
+
+        self._clock = clock
+        self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
+        self._msgbus = msgbus
+        self._codec = MessageCodec(serializer)
+        self._topics = topics
+        self._recording: dict[str, bool] = {}  # Cached topic filter
+        self._skipped_types: set[type] = set()
+        self._buffer_size = buffer_size
+        self._file = None  # Open while recording
+
+    @property
+    def is_recording(self) -> bool:
+        """
+        If the recorder is currently recording.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._file is not None
+
+    cpdef void start(self) except *:
+        """
+        Start recording messages published on the message bus.
+
+        The log file is opened (and created if it does not exist), with records
+        appended to any already in the file.
+
+        """
+        if self._file is not None:
+            self._log.warning("Already recording.")
+            return
+
+        self._file = open(self.path, "ab", buffering=self._buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(_MAGIC)
+
+        self._msgbus.add_listener(self._on_publish)
+        self._log.info(f"Recording to {self.path}.")
+
+    cpdef void stop(self) except *:
+        """
+        Stop recording and close the log file.
+        """
+        if self._file is None:
+            self._log.warning("Not recording.")
+            return
+
+        self._msgbus.remove_listener(self._on_publish)
+        self._file.close()
+        self._file = None
+        self._log.info(f"Stopped, recorded {self.record_count:,} messages.")
+
+    def _on_publish(self, str topic, msg: Any) -> None:
+        record = self._recording.get(topic)
+        if record is None:
+            record = self._topics is None or any(
+                is_matching(topic, pattern) for pattern in self._topics
+            )
+            self._recording[topic] = record
+        if not record:
+            return
+
+        cdef bytes frame
+        try:
+            frame = self._codec.encode(MessageKind.PUBLISH, topic, msg)
+        except RuntimeError:
+            self.skipped_count += 1
+            if type(msg) not in self._skipped_types:
+                self._skipped_types.add(type(msg))
+                self._log.warning(
+                    f"Cannot record {type(msg).__name__} on '{topic}': not serializable.",
+                )
+            return
+
+        self._file.write(_TIMESTAMP.pack(self._clock.timestamp_ns()))
+        self._file.write(frame)
+        self.record_count += 1
+
+
+cdef class MessageBusReplayer:
+    """
+    Provides a replayer of messages from a `MessageBusRecorder` log file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the log file.
+    serializer : Serializer, optional
+        The serializer for messages (must match the recorder). If ``None``
+        then a `MsgPackSerializer` is used.
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a valid string.
+    """
+
+    def __init__(self, str path, Serializer serializer = None):
+        Condition.valid_string(path, "path")
+
+        self.path = path
+
+        self._codec = MessageCodec(serializer)
+
+    def __iter__(self):
+        """
+        Iterate the records of the log file.
+
+        Yields
+        ------
+        tuple[int, str, object]
+            The publish timestamp (UNIX nanoseconds), topic and message.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a message bus log.
+
+        """
+        cdef uint64_t ts
+        with open(self.path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"not a message bus log file, was {self.path}")
+            while True:
+                prefix = f.read(_TIMESTAMP.size + FRAME_PREFIX_SIZE)
+                if len(prefix) < _TIMESTAMP.size + FRAME_PREFIX_SIZE:
+                    return  # End of log (or truncated final record)
+                ts = _TIMESTAMP.unpack_from(prefix)[0]
+                length = MessageCodec.frame_length(prefix[_TIMESTAMP.size:])
+                frame = f.read(length)
+                if len(frame) < length:
+                    return  # Truncated final record
+                _, topic, msg = self._codec.decode(frame)
+                yield ts, topic, msg
+
+    cpdef list load(self):
+        """
+        Load all records of the log file.
+
+        Returns
+        -------
+        list[tuple[int, str, object]]
+            The publish timestamp (UNIX nanoseconds), topic and message of
+            each record.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a message bus log.
+
+        """
+        return list(self)
+
+    cpdef int replay(self, MessageBus msgbus, list records = None) except *:
+        """
+        Publish the recorded messages on the given message bus in sequence.
+
+        Messages are published as fast as possible. If the message bus clock is
+        a `TestClock` then it is set to each publish timestamp first, so that
+        a replay is deterministic.
+
+        Parameters
+        ----------
+        msgbus : MessageBus
+            The message bus to publish on.
+        records : list[tuple[int, str, object]], optional
+            The records to publish (from `load`). If ``None`` then the log file
+            is loaded first, so decoding is excluded from the publish loop.
+
+        Returns
+        -------
+        int
+            The count of messages published.
+
+        """
+        Condition.not_none(msgbus, "msgbus")
+
+        if records is None:
+            records = self.load()
+
+        cdef TestClock clock = None
+        if isinstance(msgbus._clock, TestClock):
+            clock = msgbus._clock
+
+        cdef tuple record
+        for record in records:
+            if clock is not None and record[0] > clock.timestamp_ns():
+                clock.set_time(record[0])
+            msgbus.publish_c(record[1], record[2])
+
+        return len(records)
@@ -0,0 +1,32 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+cdef class _TrieNode:
+    cdef dict children
+    cdef list values
+
+
+cdef class TopicTrie:
+    cdef _TrieNode _root
+
+    cdef readonly int count
+    """The count of values in the trie.\n\n:returns: `int`"""
+
+    cpdef void add(self, str key, value) except *
+    cpdef bint remove(self, str key, value) except *
+    cpdef list match(self, str topic)
+    cpdef list find_matching(self, str pattern)
+    cdef void _match(self, _TrieNode node, str topic, int i, set visited, list out) except *
+    cdef void _find(self, _TrieNode node, str pattern, int j, set visited, list out) except *
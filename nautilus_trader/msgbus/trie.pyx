@@ -0,0 +1,192 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from typing import Any
+
+
+cdef class _TrieNode:
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.values: list[Any] = []
+
+
+cdef class TopicTrie:
+    """
+    Provides a character trie index of values by topic key, supporting the
+    message bus wildcard characters `*` and `?` (see `is_matching`).
+
+    Lookups walk only the branches of the trie which can match, so the cost
+    scales with the length of the query and the number of matching keys,
+    rather than the total number of keys held.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self.count = 0
+
+    cpdef void add(self, str key, value: Any) except *:
+        """
+        Add the given value at the given key.
+
+        Parameters
+        ----------
+        key : str
+            The key for the value (may include wildcard characters).
+        value : object
+            The value to add.
+
+        """
+        cdef _TrieNode node = self._root
+        cdef _TrieNode child
+        cdef str c
+        for c in key:
+            child = node.children.get(c)
+            if child is None:
+                child = _TrieNode()
+                node.children[c] = child
+            node = child
+
+        node.values.append(value)
+        self.count += 1
+
+    cpdef bint remove(self, str key, value: Any) except *:
+        """
+        Remove the given value from the given key.
+
+        Parameters
+        ----------
+        key : str
+            The key for the value.
+        value : object
+            The value to remove.
+
+        Returns
+        -------
+        bool
+            True if the value was found and removed, else False.
+
+        """
+        cdef list path = []
+        cdef _TrieNode node = self._root
+        cdef str c
+        for c in key:
+            path.append((node, c))
+            node = node.children.get(c)
+            if node is None:
+                return False
+
+        if value not in node.values:
+            return False
+        node.values.remove(value)
+        self.count -= 1
+
+        # Prune nodes which no longer lead to any values
+        cdef _TrieNode parent
+        for parent, c in reversed(path):
+            if node.values or node.children:
+                break
+            del parent.children[c]
+            node = parent
+
+        return True
+
+    cpdef list match(self, str topic):
+        """
+        Return the values for all keys (as patterns) which match the given topic.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to match (wildcard characters are taken literally).
+
+        Returns
+        -------
+        list[object]
+
+        """
+        cdef list out = []
+        self._match(self._root, topic, 0, set(), out)
+        return out
+
+    cpdef list find_matching(self, str pattern):
+        """
+        Return the values for all keys (as topics) matched by the given pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            The pattern to match with. May include wildcard characters `*` and `?`.
+
+        Returns
+        -------
+        list[object]
+
+        """
+        cdef list out = []
+        self._find(self._root, pattern, 0, set(), out)
+        return out
+
+    cdef void _match(self, _TrieNode node, str topic, int i, set visited, list out) except *:
+        cdef tuple state = (node, i)
+        if state in visited:
+            return
+        visited.add(state)
+
+        cdef int n = len(topic)
+        cdef _TrieNode child = node.children.get("*")
+        cdef int k
+        if child is not None:
+            # Asterisk matches zero or more characters
+            for k in range(i, n + 1):
+                self._match(child, topic, k, visited, out)
+
+        if i == n:
+            out.extend(node.values)
+            return
+
+        cdef str c = topic[i]
+        if c != "*" and c != "?":  # Otherwise only matched by wildcards
+            child = node.children.get(c)
+            if child is not None:
+                self._match(child, topic, i + 1, visited, out)
+
+        child = node.children.get("?")
+        if child is not None:
+            self._match(child, topic, i + 1, visited, out)
+
+    cdef void _find(self, _TrieNode node, str pattern, int j, set visited, list out) except *:
+        cdef tuple state = (node, j)
+        if state in visited:
+            return
+        visited.add(state)
+
+        if j == len(pattern):
+            out.extend(node.values)
+            return
+
+        cdef str p = pattern[j]
+        cdef _TrieNode child
+        if p == "*":
+            # Asterisk matches zero or more characters
+            self._find(node, pattern, j + 1, visited, out)
+            for child in node.children.values():
+                self._find(child, pattern, j, visited, out)
+        elif p == "?":
+            for child in node.children.values():
+                self._find(child, pattern, j + 1, visited, out)
+        else:
+            child = node.children.get(p)
+            if child is not None:
+                self._find(child, pattern, j + 1, visited, out)
@@ -16,8 +16,11 @@
 import heapq
 import itertools
 import sys
+import threading
 from collections import namedtuple
-from typing import Iterator
+from queue import Full
+from queue import Queue
+from typing import Iterable, Iterator, TypeVar
 
 import fsspec
 import pandas as pd
@@ -34,6 +37,8 @@ from nautilus_trader.serialization.arrow.util import clean_key
 
 FileMeta = namedtuple("FileMeta", "filename datatype instrument_id client_id start end")
 
+T = TypeVar("T")
+
 
 def dataset_batches(
     file_meta: FileMeta,
@@ -172,3 +177,85 @@ def extract_generic_data_client_ids(data_configs: list[BacktestDataConfig]) -> d
         dict(data_client_ids)
     ), "data_type found with multiple client_ids"
     return dict(data_client_ids)
+
+
+class _PrefetchError:
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+_PREFETCH_DONE = object()
+
+
+class _Prefetcher:
+    # Reads an iterable ahead into a bounded queue on a background thread
+    def __init__(self, iterable: Iterable, maxsize: int):
+        self.queue: Queue = Queue(maxsize=maxsize)
+        self._stopped = threading.Event()
+        self._iterable = iterable
+        self._thread = threading.Thread(target=self._produce, name="prefetch", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _put(self, item) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            for item in self._iterable:
+                if not self._put(item):
+                    return
+        except BaseException as e:
+            self._put(_PrefetchError(e))
+            return
+        self._put(_PREFETCH_DONE)
+
+
+def prefetch(iterable: Iterable[T], maxsize: int) -> Iterator[T]:
+    """
+    Iterate the given iterable on a background thread, reading ahead up to
+    `maxsize` items into a bounded queue.
+
+    Exceptions raised by the iterable are re-raised to the consumer. If the
+    consumer stops early then the background thread is stopped.
+
+    Parameters
+    ----------
+    iterable : Iterable[T]
+        The iterable to read ahead.
+    maxsize : int
+        The maximum number of items to read ahead. If zero then the iterable
+        is iterated synchronously.
+
+    Returns
+    -------
+    Iterator[T]
+
+    """
+    if maxsize <= 0:
+        yield from iterable
+        return
+
+    prefetcher = _Prefetcher(iterable, maxsize)
+    prefetcher.start()
+    try:
+        while True:
+            item = prefetcher.queue.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.exception
+            yield item
+    finally:
+        prefetcher.stop()
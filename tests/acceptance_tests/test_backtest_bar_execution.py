@@ -0,0 +1,316 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestDataProvider
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.data.wranglers import BarDataWrangler
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.examples.strategies.ema_cross import EMACross
+from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
+from nautilus_trader.examples.strategies.ema_cross_bracket import EMACrossBracket
+from nautilus_trader.examples.strategies.ema_cross_bracket import EMACrossBracketConfig
+from nautilus_trader.examples.strategies.ema_cross_stop_entry import EMACrossStopEntry
+from nautilus_trader.examples.strategies.ema_cross_stop_entry import EMACrossStopEntryConfig
+from nautilus_trader.model.currencies import BTC
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.bar import BarType
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderType
+from nautilus_trader.model.events.order import OrderFilled
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.trading.strategy import Strategy
+
+
+BAR_COUNT = 5_000
+
+
+def gbpusd_quote_bars_engine(bar_single_pass: bool, bar_low_first: bool) -> BacktestEngine:
+    engine = BacktestEngine(config=BacktestEngineConfig(bypass_logging=True, run_analysis=False))
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OMSType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+        bar_single_pass=bar_single_pass,
+        bar_low_first=bar_low_first,
+    )
+
+    gbpusd = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+    engine.add_instrument(gbpusd)
+
+    provider = TestDataProvider()
+    for price_type in ("BID", "ASK"):
+        wrangler = BarDataWrangler(
+            bar_type=BarType.from_str(f"GBP/USD.SIM-1-MINUTE-{price_type}-EXTERNAL"),
+            instrument=gbpusd,
+        )
+        engine.add_data(
+            wrangler.process(
+                provider.read_csv_bars(f"fxcm-gbpusd-m1-{price_type.lower()}-2012.csv")[:BAR_COUNT],
+            ),
+        )
+
+    return engine
+
+
+def btcusdt_trade_bars_engine(bar_single_pass: bool, bar_low_first: bool) -> BacktestEngine:
+    engine = BacktestEngine(config=BacktestEngineConfig(bypass_logging=True, run_analysis=False))
+    engine.add_venue(
+        venue=Venue("BINANCE"),
+        oms_type=OMSType.NETTING,
+        account_type=AccountType.CASH,
+        base_currency=None,
+        starting_balances=[Money(10, BTC), Money(10_000_000, USDT)],
+        bar_single_pass=bar_single_pass,
+        bar_low_first=bar_low_first,
+    )
+
+    btcusdt = TestInstrumentProvider.btcusdt_binance()
+    engine.add_instrument(btcusdt)
+
+    wrangler = BarDataWrangler(
+        bar_type=BarType.from_str("BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL"),
+        instrument=btcusdt,
+    )
+    provider = TestDataProvider()
+    bars = provider.read_csv_bars("ftx-btc-perp-20211231-20220201_1m.csv")[:BAR_COUNT]
+    engine.add_data(wrangler.process(bars))
+
+    return engine
+
+
+def ema_cross(instrument_id: str, bar_type: str, trade_size: Decimal):
+    return EMACross(
+        EMACrossConfig(
+            instrument_id=instrument_id,
+            bar_type=bar_type,
+            trade_size=trade_size,
+        ),
+    )
+
+
+def ema_cross_bracket(instrument_id: str, bar_type: str, trade_size: Decimal):
+    return EMACrossBracket(
+        EMACrossBracketConfig(
+            instrument_id=instrument_id,
+            bar_type=bar_type,
+            trade_size=trade_size,
+            bracket_distance_atr=1.0,
+        ),
+    )
+
+
+def ema_cross_stop_entry(instrument_id: str, bar_type: str, trade_size: Decimal):
+    return EMACrossStopEntry(
+        EMACrossStopEntryConfig(
+            instrument_id=instrument_id,
+            bar_type=bar_type,
+            trade_size=trade_size,
+            atr_period=20,
+            trailing_atr_multiple=2.0,
+            trailing_offset_type="PRICE",
+            trigger_type="LAST",
+        ),
+    )
+
+
+MARKETS = [
+    pytest.param(
+        gbpusd_quote_bars_engine,
+        "GBP/USD.SIM",
+        "GBP/USD.SIM-1-MINUTE-BID-EXTERNAL",
+        Decimal(100_000),
+        id="quote-bars",
+    ),
+    pytest.param(
+        btcusdt_trade_bars_engine,
+        "BTCUSDT.BINANCE",
+        "BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL",
+        Decimal("0.01"),
+        id="trade-bars",
+    ),
+]
+
+
+class TestBarExecutionEquivalence:
+    """
+    Bars processed in a single pass must produce exactly the same fills as
+    sampling each bar as a sequence of ticks, for either price path convention.
+    """
+
+    @staticmethod
+    def run(engine_factory, strategy_factory, instrument_id, bar_type, trade_size, **kwargs):
+        engine = engine_factory(**kwargs)
+        engine.add_strategy(strategy_factory(instrument_id, bar_type, trade_size))
+        engine.run()
+
+        fills = engine.trader.generate_order_fills_report()
+        balances = [
+            engine.portfolio.account(venue).balances_total() for venue in engine.list_venues()
+        ]
+        engine.dispose()
+        return fills, balances
+
+    @pytest.mark.parametrize("bar_low_first", [False, True])
+    @pytest.mark.parametrize(
+        "strategy_factory",
+        [ema_cross, ema_cross_bracket, ema_cross_stop_entry],
+    )
+    @pytest.mark.parametrize(
+        "engine_factory, instrument_id, bar_type, trade_size",
+        MARKETS,
+    )
+    def test_single_pass_produces_same_fills_as_tick_sampling(
+        self,
+        engine_factory,
+        instrument_id,
+        bar_type,
+        trade_size,
+        strategy_factory,
+        bar_low_first,
+    ):
+        # Arrange
+        args = (engine_factory, strategy_factory, instrument_id, bar_type, trade_size)
+
+        # Act
+        expected_fills, expected_balances = self.run(
+            *args,
+            bar_single_pass=False,
+            bar_low_first=bar_low_first,
+        )
+        fills, balances = self.run(
+            *args,
+            bar_single_pass=True,
+            bar_low_first=bar_low_first,
+        )
+
+        # Assert
+        assert len(expected_fills) > 0
+        pd.testing.assert_frame_equal(fills, expected_fills)
+        assert balances == expected_balances
+
+
+class BracketingOrdersStrategy(Strategy):
+    """
+    Places a sell limit above and a sell stop below the market on the first bar,
+    then records the order types in the sequence they fill.
+    """
+
+    def __init__(self, bar_type: BarType):
+        super().__init__()
+        self.bar_type = bar_type
+        self.fills: list[OrderType] = []
+
+    def on_start(self):
+        self.subscribe_bars(self.bar_type)
+
+    def on_bar(self, bar: Bar):
+        if self.cache.orders():
+            return
+        instrument_id = self.bar_type.instrument_id
+        self.submit_order(
+            self.order_factory.limit(
+                instrument_id=instrument_id,
+                order_side=OrderSide.SELL,
+                quantity=Quantity.from_str("0.010000"),
+                price=Price.from_str("105.00"),
+            ),
+        )
+        self.submit_order(
+            self.order_factory.stop_market(
+                instrument_id=instrument_id,
+                order_side=OrderSide.SELL,
+                quantity=Quantity.from_str("0.010000"),
+                trigger_price=Price.from_str("95.00"),
+            ),
+        )
+
+    def on_event(self, event):
+        if isinstance(event, OrderFilled):
+            self.fills.append(event.order_type)
+
+
+class TestBarPathConvention:
+    @staticmethod
+    def run(bar_single_pass: bool, bar_low_first: bool) -> list[OrderType]:
+        engine = BacktestEngine(
+            config=BacktestEngineConfig(bypass_logging=True, run_analysis=False),
+        )
+        engine.add_venue(
+            venue=Venue("BINANCE"),
+            oms_type=OMSType.NETTING,
+            account_type=AccountType.CASH,
+            base_currency=None,
+            starting_balances=[Money(10, BTC), Money(10_000_000, USDT)],
+            bar_single_pass=bar_single_pass,
+            bar_low_first=bar_low_first,
+        )
+        btcusdt = TestInstrumentProvider.btcusdt_binance()
+        engine.add_instrument(btcusdt)
+
+        bar_type = BarType.from_str("BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL")
+        prices = [
+            ("100.00", "100.00", "100.00", "100.00"),
+            ("100.00", "110.00", "90.00", "100.00"),  # Crosses both orders
+        ]
+        engine.add_data(
+            [
+                Bar(
+                    bar_type=bar_type,
+                    open=Price.from_str(open_),
+                    high=Price.from_str(high),
+                    low=Price.from_str(low),
+                    close=Price.from_str(close),
+                    volume=Quantity.from_str("100.000000"),
+                    ts_event=i * 60_000_000_000,
+                    ts_init=i * 60_000_000_000,
+                )
+                for i, (open_, high, low, close) in enumerate(prices)
+            ],
+        )
+        strategy = BracketingOrdersStrategy(bar_type)
+        engine.add_strategy(strategy)
+        engine.run()
+        engine.dispose()
+        return strategy.fills
+
+    @pytest.mark.parametrize("bar_single_pass", [False, True])
+    @pytest.mark.parametrize(
+        "bar_low_first, expected",
+        [
+            (False, [OrderType.LIMIT, OrderType.STOP_MARKET]),  # O-H-L-C
+            (True, [OrderType.STOP_MARKET, OrderType.LIMIT]),  # O-L-H-C
+        ],
+    )
+    def test_orders_within_bar_fill_in_path_order(self, bar_single_pass, bar_low_first, expected):
+        # Arrange, Act
+        fills = self.run(bar_single_pass=bar_single_pass, bar_low_first=bar_low_first)
+
+        # Assert
+        assert fills == expected
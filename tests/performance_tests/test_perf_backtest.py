@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import os
+import time
 from datetime import datetime
 from decimal import Decimal
 
@@ -178,3 +179,41 @@ class TestBacktestEnginePerformance(PerformanceHarness):
             engine.run(start=start, end=end)
 
         benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
+
+    @staticmethod
+    def test_run_ticks_per_second(benchmark):
+        def setup():
+            config = BacktestEngineConfig(bypass_logging=True)
+            engine = BacktestEngine(config=config)
+
+            engine.add_venue(
+                venue=Venue("SIM"),
+                oms_type=OMSType.HEDGING,
+                account_type=AccountType.MARGIN,
+                base_currency=USD,
+                starting_balances=[Money(1_000_000, USD)],
+            )
+
+            engine.add_instrument(USDJPY_SIM)
+
+            # Setup data
+            wrangler = QuoteTickDataWrangler(USDJPY_SIM)
+            provider = TestDataProvider()
+            ticks = wrangler.process_bar_data(
+                bid_data=provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv"),
+                ask_data=provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv"),
+            )
+            engine.add_data(ticks)
+            engine.add_strategy(Strategy())
+
+            return (engine,), {}
+
+        def run(engine):
+            ts_start = time.perf_counter()
+            engine.run()
+            elapsed = time.perf_counter() - ts_start
+            assert engine.iteration > 0
+            benchmark.extra_info["ticks"] = engine.iteration
+            benchmark.extra_info["ticks_per_second"] = round(engine.iteration / elapsed)
+
+        benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
@@ -0,0 +1,368 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+End-to-end backtest throughput benchmarks over deterministic synthetic data.
+
+Each scenario records `events`, `events_per_second` and `peak_memory_bytes`
+(traced Python allocations during a separate untimed run) in the benchmark
+`extra_info`, which pytest-benchmark writes to its JSON output along with the
+commit and machine info. To save results and compare against a previous run:
+
+    pytest tests/performance_tests/test_perf_backtest_scenarios.py --benchmark-autosave
+    pytest tests/performance_tests/test_perf_backtest_scenarios.py \
+        --benchmark-compare --benchmark-compare-fail=min:10%
+
+"""
+
+import random
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Callable
+
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.backtest.models import LatencyModel
+from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.core.datetime import secs_to_nanos
+from nautilus_trader.examples.strategies.ema_cross import EMACross
+from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
+from nautilus_trader.model.currencies import BTC
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.bar import BarType
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orderbook.data import Order
+from nautilus_trader.model.orderbook.data import OrderBookDelta
+from nautilus_trader.model.orderbook.data import OrderBookDeltas
+from nautilus_trader.trading.strategy import Strategy
+
+
+SEED = 42
+TICK_COUNT = 200_000
+BAR_COUNT = 50_000
+INSTRUMENT_COUNT = 10
+STRATEGY_COUNT = 20
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+FX_SYMBOLS = [
+    "AUD/USD",
+    "EUR/USD",
+    "GBP/USD",
+    "NZD/USD",
+    "USD/CAD",
+    "USD/CHF",
+    "USD/JPY",
+    "EUR/GBP",
+    "EUR/JPY",
+    "GBP/JPY",
+]
+
+
+def random_walk(rng: random.Random, start: float, step: float, count: int) -> list[float]:
+    prices = []
+    price = start
+    for _ in range(count):
+        price = max(price + rng.choice((-step, 0.0, 0.0, step)), step)
+        prices.append(price)
+    return prices
+
+
+def synthetic_quote_ticks(instrument: Instrument, count: int, seed: int = SEED) -> list[QuoteTick]:
+    rng = random.Random(seed)
+    increment = float(instrument.price_increment)
+    start = 100.0 if instrument.quote_currency.code == "JPY" else 1.0
+    size = Quantity.from_int(1_000_000)
+    ticks = []
+    for i, mid in enumerate(random_walk(rng, start, increment, count)):
+        ts = millis_to_nanos(i * 500)
+        ticks.append(
+            QuoteTick(
+                instrument_id=instrument.id,
+                bid=instrument.make_price(mid),
+                ask=instrument.make_price(mid + increment * rng.randint(1, 3)),
+                bid_size=size,
+                ask_size=size,
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        )
+    return ticks
+
+
+def synthetic_trade_ticks(instrument: Instrument, count: int, seed: int = SEED) -> list[TradeTick]:
+    rng = random.Random(seed)
+    increment = float(instrument.price_increment)
+    ticks = []
+    for i, price in enumerate(random_walk(rng, 50_000.0, increment * 100, count)):
+        ts = millis_to_nanos(i * 500)
+        ticks.append(
+            TradeTick(
+                instrument_id=instrument.id,
+                price=instrument.make_price(price),
+                size=instrument.make_qty(rng.randint(1, 100) / 1000),
+                aggressor_side=AggressorSide.BUY if rng.random() < 0.5 else AggressorSide.SELL,
+                trade_id=TradeId(str(i)),
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        )
+    return ticks
+
+
+def synthetic_bars(bar_type: BarType, instrument: Instrument, count: int, seed: int = SEED):
+    rng = random.Random(seed)
+    increment = float(instrument.price_increment) * 100
+    bars = []
+    for i, close in enumerate(random_walk(rng, 50_000.0, increment, count)):
+        ts = secs_to_nanos((i + 1) * 60)
+        open_ = close + rng.choice((-increment, 0.0, increment))
+        bars.append(
+            Bar(
+                bar_type=bar_type,
+                open=instrument.make_price(open_),
+                high=instrument.make_price(max(open_, close) + increment * rng.randint(0, 3)),
+                low=instrument.make_price(min(open_, close) - increment * rng.randint(0, 3)),
+                close=instrument.make_price(close),
+                volume=instrument.make_qty(rng.randint(1, 100)),
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        )
+    return bars
+
+
+def synthetic_l2_deltas(instrument: Instrument, count: int, seed: int = SEED, depth: int = 10):
+    rng = random.Random(seed)
+    increment = float(instrument.price_increment)
+    bid_prices = [instrument.make_price(1.0 - increment * i) for i in range(depth)]
+    ask_prices = [instrument.make_price(1.0 + increment * (i + 1)) for i in range(depth)]
+
+    def delta(action, price, side, ts):
+        return OrderBookDelta(
+            instrument_id=instrument.id,
+            book_type=BookType.L2_MBP,
+            action=action,
+            order=Order(
+                price=price,
+                size=Quantity.from_int(rng.randint(1, 100) * 10_000),
+                side=side,
+            ),
+            ts_event=ts,
+            ts_init=ts,
+        )
+
+    data = [
+        OrderBookDeltas(
+            instrument_id=instrument.id,
+            book_type=BookType.L2_MBP,
+            deltas=[delta(BookAction.ADD, p, OrderSide.BUY, 0) for p in bid_prices]
+            + [delta(BookAction.ADD, p, OrderSide.SELL, 0) for p in ask_prices],
+            ts_event=0,
+            ts_init=0,
+        ),
+    ]
+    for i in range(1, count):
+        ts = millis_to_nanos(i * 100)
+        data.append(
+            OrderBookDeltas(
+                instrument_id=instrument.id,
+                book_type=BookType.L2_MBP,
+                deltas=[
+                    delta(BookAction.UPDATE, rng.choice(bid_prices), OrderSide.BUY, ts),
+                    delta(BookAction.UPDATE, rng.choice(ask_prices), OrderSide.SELL, ts),
+                ],
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        )
+    return data
+
+
+def ema_cross(instrument: Instrument, bar_type: str, trade_size: Decimal, tag: int = 0):
+    return EMACross(
+        EMACrossConfig(
+            instrument_id=str(instrument.id),
+            bar_type=bar_type,
+            trade_size=trade_size,
+            fast_ema_period=10 + tag,
+            slow_ema_period=20 + 2 * tag,
+            order_id_tag=str(tag).zfill(3),
+        ),
+    )
+
+
+def fx_engine(
+    book_type: BookType = BookType.L1_TBBO,
+    latency_model: LatencyModel = None,
+) -> BacktestEngine:
+    engine = BacktestEngine(config=BacktestEngineConfig(bypass_logging=True, run_analysis=False))
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OMSType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000_000, USD)],
+        book_type=book_type,
+        latency_model=latency_model,
+    )
+    return engine
+
+
+def crypto_engine() -> BacktestEngine:
+    engine = BacktestEngine(config=BacktestEngineConfig(bypass_logging=True, run_analysis=False))
+    engine.add_venue(
+        venue=Venue("BINANCE"),
+        oms_type=OMSType.NETTING,
+        account_type=AccountType.CASH,
+        base_currency=None,
+        starting_balances=[Money(1_000, BTC), Money(100_000_000, USDT)],
+    )
+    engine.add_instrument(BTCUSDT_BINANCE)
+    return engine
+
+
+def quotes_scenario(latency_model: LatencyModel = None, strategy_count: int = 1):
+    ticks = synthetic_quote_ticks(AUDUSD_SIM, TICK_COUNT)
+
+    def build() -> BacktestEngine:
+        engine = fx_engine(latency_model=latency_model)
+        engine.add_instrument(AUDUSD_SIM)
+        engine.add_data(ticks)
+        for i in range(strategy_count):
+            engine.add_strategy(
+                ema_cross(AUDUSD_SIM, "AUD/USD.SIM-1-MINUTE-BID-INTERNAL", Decimal(100_000), i),
+            )
+        return engine
+
+    return build
+
+
+def trades_scenario():
+    ticks = synthetic_trade_ticks(BTCUSDT_BINANCE, TICK_COUNT)
+
+    def build() -> BacktestEngine:
+        engine = crypto_engine()
+        engine.add_data(ticks)
+        engine.add_strategy(
+            ema_cross(BTCUSDT_BINANCE, "BTCUSDT.BINANCE-1-MINUTE-LAST-INTERNAL", Decimal("0.01")),
+        )
+        return engine
+
+    return build
+
+
+def bars_scenario():
+    bar_type = BarType.from_str("BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL")
+    bars = synthetic_bars(bar_type, BTCUSDT_BINANCE, BAR_COUNT)
+
+    def build() -> BacktestEngine:
+        engine = crypto_engine()
+        engine.add_data(bars)
+        engine.add_strategy(ema_cross(BTCUSDT_BINANCE, str(bar_type), Decimal("0.01")))
+        return engine
+
+    return build
+
+
+def l2_deltas_scenario():
+    deltas = synthetic_l2_deltas(AUDUSD_SIM, TICK_COUNT)
+
+    def build() -> BacktestEngine:
+        engine = fx_engine(book_type=BookType.L2_MBP)
+        engine.add_instrument(AUDUSD_SIM)
+        engine.add_data(deltas)
+        engine.add_strategy(Strategy())
+        return engine
+
+    return build
+
+
+def many_instruments_scenario():
+    instruments = [TestInstrumentProvider.default_fx_ccy(s) for s in FX_SYMBOLS[:INSTRUMENT_COUNT]]
+    count = TICK_COUNT // INSTRUMENT_COUNT
+    data = [synthetic_quote_ticks(x, count, seed=SEED + i) for i, x in enumerate(instruments)]
+
+    def build() -> BacktestEngine:
+        engine = fx_engine()
+        for instrument, ticks in zip(instruments, data):
+            engine.add_instrument(instrument)
+            engine.add_data(ticks)
+        engine.add_strategy(Strategy())
+        return engine
+
+    return build
+
+
+SCENARIOS = [
+    pytest.param(quotes_scenario, id="quotes"),
+    pytest.param(trades_scenario, id="trades"),
+    pytest.param(bars_scenario, id="bars"),
+    pytest.param(l2_deltas_scenario, id="l2-deltas"),
+    pytest.param(lambda: quotes_scenario(strategy_count=STRATEGY_COUNT), id="many-strategies"),
+    pytest.param(many_instruments_scenario, id="many-instruments"),
+    pytest.param(
+        lambda: quotes_scenario(latency_model=LatencyModel(base_latency_nanos=millis_to_nanos(5))),
+        id="latency-model",
+    ),
+]
+
+
+def peak_memory_bytes(build: Callable[[], BacktestEngine]) -> int:
+    engine = build()
+    tracemalloc.start()
+    try:
+        engine.run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        engine.dispose()
+
+
+class TestBacktestScenarioPerformance:
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    def test_run_scenario(self, benchmark, scenario):
+        build = scenario()
+
+        def setup():
+            return (build(),), {}
+
+        def run(engine):
+            ts_start = time.perf_counter()
+            engine.run()
+            elapsed = time.perf_counter() - ts_start
+            benchmark.extra_info["events"] = engine.iteration
+            benchmark.extra_info["events_per_second"] = round(engine.iteration / elapsed)
+            engine.dispose()
+
+        benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
+        benchmark.extra_info["peak_memory_bytes"] = peak_memory_bytes(build)
@@ -0,0 +1,267 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.backtest.data.columnar import ColumnarDataStream
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.stubs.data import TestDataStubs
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+class TestColumnarDataStream:
+    def test_from_data_with_empty_list_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            ColumnarDataStream.from_data([])
+
+    def test_from_data_with_unsupported_type_raises_type_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(TypeError):
+            ColumnarDataStream.from_data([TestDataStubs.ticker()])
+
+    def test_from_data_materializes_equal_objects(self):
+        # Arrange
+        quote = QuoteTick(
+            instrument_id=TestIdStubs.audusd_id(),
+            bid=Price.from_str("1.00001"),
+            ask=Price.from_str("1.00003"),
+            bid_size=Quantity.from_int(1_000_000),
+            ask_size=Quantity.from_int(2_000_000),
+            ts_event=1,
+            ts_init=2,
+        )
+        trade = TradeTick(
+            instrument_id=TestIdStubs.usdjpy_id(),
+            price=Price.from_str("90.001"),
+            size=Quantity.from_int(100_000),
+            aggressor_side=AggressorSide.SELL,
+            trade_id=TradeId("123456"),
+            ts_event=3,
+            ts_init=4,
+        )
+        bar = Bar(
+            bar_type=TestDataStubs.bartype_audusd_1min_bid(),
+            open=Price.from_str("1.00002"),
+            high=Price.from_str("1.00004"),
+            low=Price.from_str("1.00001"),
+            close=Price.from_str("1.00003"),
+            volume=Quantity.from_int(1_000_000),
+            ts_event=5,
+            ts_init=6,
+        )
+        data = [quote, trade, bar]
+
+        # Act
+        stream = ColumnarDataStream.from_data(data)
+
+        # Assert
+        assert len(stream) == 3
+        assert list(stream) == data
+        assert [type(x) for x in stream] == [QuoteTick, TradeTick, Bar]
+        assert stream[1].trade_id == TradeId("123456")
+        assert stream[1].aggressor_side == AggressorSide.SELL
+        assert stream[-1] == bar
+        assert stream[-1].ts_event == 5
+        assert stream[-1].ts_init == 6
+        assert stream.keys == [quote.instrument_id, trade.instrument_id, bar.bar_type]
+
+    def test_getitem_out_of_range_raises_index_error(self):
+        # Arrange
+        stream = ColumnarDataStream.from_data([TestDataStubs.quote_tick_5decimal()])
+
+        # Act, Assert
+        with pytest.raises(IndexError):
+            stream[1]
+
+    def test_from_data_sorts_stably_by_ts_init(self):
+        # Arrange
+        ticks = [
+            QuoteTick(
+                instrument_id=TestIdStubs.audusd_id(),
+                bid=Price.from_str("1.00001"),
+                ask=Price(ask, 5),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts, ask in ((2, 1.00002), (1, 1.00003), (2, 1.00004))
+        ]
+
+        # Act
+        stream = ColumnarDataStream.from_data(ticks)
+
+        # Assert
+        assert list(stream) == [ticks[1], ticks[0], ticks[2]]
+
+    def test_quote_only_stream_omits_unused_columns(self):
+        # Arrange
+        ticks = [TestDataStubs.quote_tick_5decimal() for _ in range(10)]
+
+        # Act
+        stream = ColumnarDataStream.from_data(ticks)
+
+        # Assert
+        assert "price_2" not in stream.columns
+        assert "trade_id" not in stream.columns
+        assert stream.nbytes == 10 * 55
+
+    def test_instantiate_from_columns(self):
+        # Arrange
+        instrument_id = TestIdStubs.audusd_id()
+        columns = {
+            "kind": np.zeros(2, dtype=np.uint8),
+            "key": np.zeros(2, dtype=np.uint32),
+            "ts_event": np.array([1, 2], dtype=np.uint64),
+            "ts_init": np.array([1, 2], dtype=np.uint64),
+            "price_prec": np.full(2, 5, dtype=np.uint8),
+            "size_prec": np.zeros(2, dtype=np.uint8),
+            "price_0": np.array([100_001, 100_002], dtype=np.int64) * 10_000,
+            "price_1": np.array([100_003, 100_004], dtype=np.int64) * 10_000,
+            "size_0": np.full(2, 1_000_000 * 10**9, dtype=np.uint64),
+            "size_1": np.full(2, 1_000_000 * 10**9, dtype=np.uint64),
+        }
+
+        # Act
+        stream = ColumnarDataStream([instrument_id], columns)
+
+        # Assert
+        assert stream[0].instrument_id == instrument_id
+        assert stream[0].bid == Price.from_str("1.00001")
+        assert stream[1].ask == Price.from_str("1.00004")
+        assert stream[1].ask_size == Quantity.from_int(1_000_000)
+
+    def test_instantiate_with_key_out_of_range_raises_value_error(self):
+        # Arrange
+        columns = {
+            "kind": np.zeros(1, dtype=np.uint8),
+            "key": np.ones(1, dtype=np.uint32),
+            "ts_event": np.zeros(1, dtype=np.uint64),
+            "ts_init": np.zeros(1, dtype=np.uint64),
+            "price_prec": np.zeros(1, dtype=np.uint8),
+            "size_prec": np.zeros(1, dtype=np.uint8),
+        }
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            ColumnarDataStream([TestIdStubs.audusd_id()], columns)
+
+    @pytest.mark.parametrize(
+        "kind, missing",
+        [
+            [0, "size_1"],  # Quote tick
+            [1, "trade_id"],  # Trade tick
+            [2, "price_3"],  # Bar
+        ],
+    )
+    def test_instantiate_with_column_missing_for_kind_raises_value_error(self, kind, missing):
+        # Arrange
+        columns = {
+            "kind": np.full(1, kind, dtype=np.uint8),
+            "key": np.zeros(1, dtype=np.uint32),
+            "ts_event": np.zeros(1, dtype=np.uint64),
+            "ts_init": np.zeros(1, dtype=np.uint64),
+            "price_prec": np.zeros(1, dtype=np.uint8),
+            "size_prec": np.zeros(1, dtype=np.uint8),
+            "price_0": np.zeros(1, dtype=np.int64),
+            "price_1": np.zeros(1, dtype=np.int64),
+            "price_2": np.zeros(1, dtype=np.int64),
+            "price_3": np.zeros(1, dtype=np.int64),
+            "size_0": np.zeros(1, dtype=np.uint64),
+            "size_1": np.zeros(1, dtype=np.uint64),
+            "side": np.ones(1, dtype=np.uint8),
+            "trade_id": np.array([b"1"], dtype=np.bytes_),
+        }
+        del columns[missing]
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            ColumnarDataStream([TestIdStubs.audusd_id()], columns)
+
+    def test_instantiate_with_invalid_kind_raises_value_error(self):
+        # Arrange
+        columns = {
+            "kind": np.full(1, 3, dtype=np.uint8),
+            "key": np.zeros(1, dtype=np.uint32),
+            "ts_event": np.zeros(1, dtype=np.uint64),
+            "ts_init": np.zeros(1, dtype=np.uint64),
+            "price_prec": np.zeros(1, dtype=np.uint8),
+            "size_prec": np.zeros(1, dtype=np.uint8),
+        }
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            ColumnarDataStream([TestIdStubs.audusd_id()], columns)
+
+    def test_from_data_with_differing_quote_size_precisions_raises_value_error(self):
+        # Arrange
+        quote = QuoteTick(
+            instrument_id=TestIdStubs.audusd_id(),
+            bid=Price.from_str("1.00001"),
+            ask=Price.from_str("1.00003"),
+            bid_size=Quantity.from_str("1.0"),
+            ask_size=Quantity.from_str("1.00"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            ColumnarDataStream.from_data([quote])
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_to_file_and_from_file_round_trip(self, tmp_path, mmap):
+        # Arrange
+        bar = TestDataStubs.bar_5decimal()
+        trade = TestDataStubs.trade_tick_5decimal()
+        quote = TestDataStubs.quote_tick_5decimal()
+        stream = ColumnarDataStream.from_data([quote, trade, bar])
+        path = tmp_path / "data.bin"
+
+        # Act
+        stream.to_file(path)
+        result = ColumnarDataStream.from_file(path, mmap=mmap)
+
+        # Assert
+        assert list(result) == list(stream)
+        assert result.keys == stream.keys
+        assert result.columns.keys() == stream.columns.keys()
+
+    def test_from_file_with_invalid_file_raises_value_error(self, tmp_path):
+        # Arrange
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"not a columnar data file")
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            ColumnarDataStream.from_file(path)
+
+    def test_from_file_with_unknown_version_raises_value_error(self, tmp_path):
+        # Arrange
+        path = tmp_path / "data.bin"
+        ColumnarDataStream.from_data([TestDataStubs.quote_tick_5decimal()]).to_file(path)
+        path.write_bytes(path.read_bytes().replace(b'"version": 1', b'"version": 9'))
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            ColumnarDataStream.from_file(path)
@@ -0,0 +1,136 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.data.iterator import IteratorDataStream
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+def quote_ticks(count: int) -> list[QuoteTick]:
+    return [
+        QuoteTick(
+            instrument_id=TestIdStubs.audusd_id(),
+            bid=Price.from_str("1.00001"),
+            ask=Price.from_str("1.00003"),
+            bid_size=Quantity.from_int(1_000_000),
+            ask_size=Quantity.from_int(1_000_000),
+            ts_event=ts,
+            ts_init=ts,
+        )
+        for ts in range(count)
+    ]
+
+
+class ExhaustibleReader:
+    """
+    A chunked source which continues from where the previous pass finished,
+    in the same way as a `ParquetReader`.
+    """
+
+    def __init__(self, chunks: list[list]):
+        self._chunks = iter(chunks)
+
+    def __iter__(self):
+        yield from self._chunks
+
+
+class TestIteratorDataStream:
+    def test_instantiate_with_invalid_buffer_size_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            IteratorDataStream(quote_ticks(3), buffer_size=0)
+
+    def test_iter_returns_all_data(self):
+        # Arrange
+        ticks = quote_ticks(5)
+        stream = IteratorDataStream(ticks, buffer_size=2)
+
+        # Act, Assert
+        assert list(stream) == ticks
+        assert list(stream) == ticks  # Iterables can be passed over again
+        assert stream.position == 0
+
+    def test_iter_with_chunked_source_flattens_chunks(self):
+        # Arrange
+        ticks = quote_ticks(5)
+        stream = IteratorDataStream([ticks[:2], [], ticks[2:]], chunked=True)
+
+        # Act, Assert
+        assert list(stream) == ticks
+
+    def test_iter_with_callable_source_calls_for_each_pass(self):
+        # Arrange
+        ticks = quote_ticks(5)
+        stream = IteratorDataStream(lambda: (x for x in ticks))
+
+        # Act, Assert
+        assert list(stream) == ticks
+        assert list(stream) == ticks
+
+    def test_reset_with_consumed_iterator_source_raises_runtime_error(self):
+        # Arrange
+        stream = IteratorDataStream(x for x in quote_ticks(5))
+        stream.reset()
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            stream.reset()
+
+    def test_reset_with_callable_source_can_be_repeated(self):
+        # Arrange
+        ticks = quote_ticks(5)
+        stream = IteratorDataStream(lambda: (x for x in ticks))
+
+        # Act
+        stream.reset()
+        stream.reset()
+
+        # Assert
+        assert stream.position == 0
+
+    def test_iter_with_exhausted_reader_source_raises_runtime_error(self):
+        # Arrange
+        ticks = quote_ticks(5)
+        stream = IteratorDataStream(ExhaustibleReader([ticks[:2], ticks[2:]]), chunked=True)
+        assert list(stream) == ticks
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            list(stream)
+
+    def test_reset_with_exhausted_reader_source_raises_runtime_error(self):
+        # Arrange
+        ticks = quote_ticks(5)
+        stream = IteratorDataStream(ExhaustibleReader([ticks[:2], ticks[2:]]), chunked=True)
+        stream.reset()
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            stream.reset()
+
+    def test_reset_with_empty_reader_source_does_not_raise(self):
+        # Arrange
+        stream = IteratorDataStream(ExhaustibleReader([]), chunked=True)
+        stream.reset()
+
+        # Act
+        stream.reset()
+
+        # Assert
+        assert stream.position == 0
@@ -0,0 +1,78 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pickle
+
+import pytest
+
+from nautilus_trader.backtest.data.columnar import ColumnarDataStream
+from nautilus_trader.backtest.data.shared import SharedColumnarDataStream
+from tests.test_kit.stubs.data import TestDataStubs
+
+
+class TestSharedColumnarDataStream:
+    def setup(self):
+        # Fixture Setup
+        self.data = [
+            TestDataStubs.quote_tick_5decimal(),
+            TestDataStubs.trade_tick_5decimal(),
+            TestDataStubs.bar_5decimal(),
+        ]
+        self.shared = SharedColumnarDataStream(ColumnarDataStream.from_data(self.data))
+
+    def teardown(self):
+        self.shared.unlink()
+
+    def test_attach_returns_equal_stream(self):
+        # Arrange, Act
+        stream = self.shared.attach()
+
+        # Assert
+        assert list(stream) == self.data
+        del stream
+
+    def test_attach_from_unpickled_handle(self):
+        # Arrange
+        handle = pickle.loads(pickle.dumps(self.shared))
+
+        # Act
+        stream = handle.attach()
+
+        # Assert
+        assert handle.name == self.shared.name
+        assert list(stream) == self.data
+        assert not stream.columns["ts_init"].flags.writeable
+
+    def test_unlink_from_unpickled_handle_raises_runtime_error(self):
+        # Arrange
+        handle = pickle.loads(pickle.dumps(self.shared))
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            handle.unlink()
+
+    def test_close_from_unpickled_handle_allows_attach_again(self):
+        # Arrange
+        handle = pickle.loads(pickle.dumps(self.shared))
+        stream = handle.attach()
+        del stream
+
+        # Act
+        handle.close()
+        handle.close()  # Idempotent
+
+        # Assert
+        assert list(handle.attach()) == self.data
+        handle.close()
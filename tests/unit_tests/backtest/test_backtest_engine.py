@@ -20,6 +20,7 @@ from typing import Optional
 import pandas as pd
 import pytest
 
+from nautilus_trader.backtest.data.columnar import ColumnarDataStream
 from nautilus_trader.backtest.data.providers import TestDataProvider
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.backtest.data.wranglers import BarDataWrangler
@@ -40,6 +41,7 @@ from nautilus_trader.model.data.bar import BarSpecification
 from nautilus_trader.model.data.bar import BarType
 from nautilus_trader.model.data.base import DataType
 from nautilus_trader.model.data.base import GenericData
+from nautilus_trader.model.data.tick import QuoteTick
 from nautilus_trader.model.data.venue import InstrumentStatusUpdate
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import AggregationSource
@@ -65,6 +67,7 @@ from tests.test_kit.stubs import MyData
 from tests.test_kit.stubs.component import TestComponentStubs
 from tests.test_kit.stubs.config import TestConfigStubs
 from tests.test_kit.stubs.data import TestDataStubs
+from tests.unit_tests.backtest.test_backtest_data_iterator import ExhaustibleReader
 
 
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
@@ -146,6 +149,43 @@ class TestBacktestEngine:
         # Assert
         assert len(self.engine.trader.strategy_states()) == 1
 
+    def test_run_with_profile_records_stages(self):
+        # Arrange
+        engine = self.create_engine(config=BacktestEngineConfig(profile=True))
+        engine.add_strategy(Strategy())
+
+        # Act
+        engine.run()
+
+        # Assert
+        result = engine.get_result()
+        assert self.engine.profiler is None
+        assert result.stats_profile == engine.profiler.stats()
+        assert result.stats_profile["DataEngine.process"]["count"] == 8000
+        assert result.stats_profile["SimulatedExchange.process"]["count"] == 8000
+        assert "Handler Portfolio.update_quote_tick" in result.stats_profile
+
+    def test_run_with_filter_unsubscribed_data_only_caches_unsubscribed_ticks(self):
+        # Arrange
+        engine = self.create_engine(config=BacktestEngineConfig(filter_unsubscribed_data=True))
+        engine.add_strategy(Strategy())
+
+        # Act
+        engine.run()
+
+        # Assert
+        assert engine.iteration == 8000
+        assert engine.kernel.data_engine.data_count == 0
+        assert engine.cache.quote_tick(USDJPY_SIM.id) == engine.data[-1]
+        assert engine.cache.quote_tick_count(USDJPY_SIM.id) > 0
+
+    def test_run_without_profile_result_has_no_profile(self):
+        # Arrange, Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.get_result().stats_profile is None
+
     def test_change_fill_model(self):
         # Arrange, Act
         self.engine.change_fill_model(Venue("SIM"), FillModel())
@@ -428,6 +468,18 @@ class TestBacktestEngineData:
         # Assert
         assert len(self.engine.data) == 100000
 
+    def test_add_data_copies_given_list(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        ticks = [TestDataStubs.quote_tick_5decimal(AUDUSD_SIM.id)]
+        self.engine.add_data(ticks)
+
+        # Act
+        ticks.append(TestDataStubs.trade_tick_5decimal(AUDUSD_SIM.id))
+
+        # Assert
+        assert self.engine.data == ticks[:1]
+
     def test_add_trade_ticks_adds_to_engine(self, capsys):
         # Arrange
         self.engine.add_instrument(ETHUSDT_BINANCE)
@@ -495,6 +547,227 @@ class TestBacktestEngineData:
         assert len(self.engine.data) == 2
         assert self.engine.data == data
 
+    def test_add_multiple_data_streams_merges_by_ts_init(self):
+        # Arrange
+        self.engine.add_instrument(USDJPY_SIM)
+        self.engine.add_instrument(AUDUSD_SIM)
+        ticks1 = [
+            QuoteTick(
+                instrument_id=USDJPY_SIM.id,
+                bid=Price.from_str("90.002"),
+                ask=Price.from_str("90.005"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in (0, 2, 4)
+        ]
+        ticks2 = [
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str("1.00001"),
+                ask=Price.from_str("1.00003"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in (4, 3, 1)  # <-- not sorted
+        ]
+
+        # Act
+        self.engine.add_data(ticks1)
+        self.engine.add_data(ticks2)
+
+        # Assert
+        data = self.engine.data
+        assert [x.ts_init for x in data] == [0, 1, 2, 3, 4, 4]
+        assert data[4] is ticks1[2]  # Ties resolved in the order streams were added
+        assert data[5] is ticks2[0]
+
+    def test_add_columnar_data_merges_with_object_streams(self):
+        # Arrange
+        self.engine.add_instrument(USDJPY_SIM)
+        self.engine.add_instrument(AUDUSD_SIM)
+        ticks1 = [
+            QuoteTick(
+                instrument_id=USDJPY_SIM.id,
+                bid=Price.from_str("90.002"),
+                ask=Price.from_str("90.005"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in (0, 2, 4)
+        ]
+        ticks2 = [
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str("1.00001"),
+                ask=Price.from_str("1.00003"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in (1, 3, 4)
+        ]
+
+        # Act
+        self.engine.add_data(ticks1)
+        self.engine.add_columnar_data(ColumnarDataStream.from_data(ticks2))
+
+        # Assert
+        assert self.engine.data == sorted(ticks1 + ticks2, key=lambda x: x.ts_init)
+
+    def test_run_routes_multi_instrument_stream_to_each_matching_engine(self):
+        # Arrange
+        self.engine.add_instrument(USDJPY_SIM)
+        self.engine.add_instrument(AUDUSD_SIM)
+        ticks = [
+            QuoteTick(
+                instrument_id=USDJPY_SIM.id,
+                bid=Price.from_str("90.002"),
+                ask=Price.from_str("90.005"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=0,
+                ts_init=0,
+            ),
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str("1.00001"),
+                ask=Price.from_str("1.00003"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=1,
+                ts_init=1,
+            ),
+        ]
+        self.engine.add_data(ticks)  # <-- single stream with two instruments
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 2
+        assert self.engine.kernel.data_engine.data_count == 2
+        assert self.engine.cache.quote_tick(USDJPY_SIM.id) == ticks[0]
+        assert self.engine.cache.quote_tick(AUDUSD_SIM.id) == ticks[1]
+
+    def test_add_data_iterator_merges_with_object_streams(self):
+        # Arrange
+        self.engine.add_instrument(USDJPY_SIM)
+        self.engine.add_instrument(AUDUSD_SIM)
+        ticks1 = [
+            QuoteTick(
+                instrument_id=USDJPY_SIM.id,
+                bid=Price.from_str("90.002"),
+                ask=Price.from_str("90.005"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in (0, 2, 4)
+        ]
+        ticks2 = [
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str("1.00001"),
+                ask=Price.from_str("1.00003"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in (1, 3, 5)
+        ]
+
+        # Act
+        self.engine.add_data(ticks1)
+        self.engine.add_data_iterator(lambda: (x for x in ticks2), buffer_size=2)
+        self.engine.run(start=pd.Timestamp(1, unit="ns", tz="UTC"))
+
+        # Assert
+        assert self.engine.data == ticks1  # <-- lazily iterated data excluded
+        assert self.engine.iteration == 5  # <-- data before start skipped
+        assert self.engine.cache.quote_tick(USDJPY_SIM.id) == ticks1[2]
+        assert self.engine.cache.quote_tick(AUDUSD_SIM.id) == ticks2[2]
+
+    def test_data_and_dumps_with_generator_source_leave_source_for_run(self, tmp_path):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        ticks = [
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str("1.00001"),
+                ask=Price.from_str("1.00003"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in range(3)
+        ]
+        self.engine.add_data_iterator(x for x in ticks)
+
+        # Act, Assert
+        assert self.engine.data == []
+        with pytest.raises(RuntimeError):
+            self.engine.dump_pickled_data()
+        with pytest.raises(RuntimeError):
+            self.engine.dump_data(tmp_path / "data.bin")
+
+        self.engine.run()
+        assert self.engine.iteration == 3
+
+    def test_run_twice_with_reader_source_raises_runtime_error(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        ticks = [
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str("1.00001"),
+                ask=Price.from_str("1.00003"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in range(5)
+        ]
+        self.engine.add_data_iterator(ExhaustibleReader([ticks[:2], ticks[2:]]), chunked=True)
+        self.engine.run()
+        self.engine.reset()
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            self.engine.run()
+
+    def test_run_with_unsorted_data_iterator_raises_value_error(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        ticks = [
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str("1.00001"),
+                ask=Price.from_str("1.00003"),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for ts in (1, 3, 2)  # <-- not sorted
+        ]
+        self.engine.add_data_iterator(ticks)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.run()
+
 
 class TestBacktestWithAddedBars:
     def setup(self):
@@ -577,6 +850,123 @@ class TestBacktestWithAddedBars:
             1011166.89, USD
         )
 
+    def test_run_ema_cross_with_data_iterator_repeats_after_reset(self):
+        # Arrange
+        bars = self.engine.data
+        self.engine.clear_data()
+        self.engine.add_data_iterator(lambda: iter(bars), buffer_size=1_000)
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,
+        )
+        config = EMACrossConfig(
+            instrument_id=str(GBPUSD_SIM.id),
+            bar_type=str(bar_type),
+            trade_size=Decimal(100_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        # Act
+        self.engine.run()
+        first_balance = self.engine.portfolio.account(self.venue).balance_total(USD)
+        self.engine.reset()
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 60234
+        assert first_balance == Money(1011166.89, USD)
+        assert self.engine.portfolio.account(self.venue).balance_total(USD) == first_balance
+
+    def test_run_windows_matches_separate_runs(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,
+        )
+        config = EMACrossConfig(
+            instrument_id=str(GBPUSD_SIM.id),
+            bar_type=str(bar_type),
+            trade_size=Decimal(100_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+        self.engine.add_strategy(EMACross(config=config))
+        windows = [
+            ("2012-02-01", "2012-03-01"),
+            ("2012-03-01", "2012-04-01"),
+            ("2012-02-15", "2012-03-15"),  # <-- overlapping (walk-forward)
+        ]
+
+        # Act
+        results = self.engine.run_windows(windows)
+
+        # Assert
+        assert len(results) == 3
+        for (start, end), result in zip(windows, results):
+            self.engine.reset()
+            self.engine.run(start=start, end=end)
+            expected = self.engine.get_result()
+            assert result.total_orders > 0
+            assert result.total_orders == expected.total_orders
+            assert result.stats_pnls == expected.stats_pnls
+            assert result.backtest_start == expected.backtest_start
+
+    def test_run_windows_with_empty_windows_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.run_windows([])
+
+    def test_fork_runs_from_checkpoint(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=str(GBPUSD_SIM.id),
+            bar_type=str(bar_type),
+            trade_size=Decimal(100_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+        self.engine.run_streaming(end="2012-02-01")  # Warm-up to checkpoint
+        checkpoint_iteration = self.engine.iteration
+
+        def double_trade_size(engine: BacktestEngine) -> None:
+            engine.trader.strategies()[0].trade_size = Decimal(200_000)
+
+        # Act
+        results = self.engine.fork_runs(
+            [lambda engine: None, lambda engine: None, double_trade_size]
+        )
+
+        # Assert
+        assert len(results) == 3
+        assert results[0].total_orders > 0
+        assert results[0].total_orders == results[1].total_orders
+        assert results[0].stats_pnls == results[1].stats_pnls
+        assert results[0].stats_pnls != results[2].stats_pnls
+        assert self.engine.iteration == checkpoint_iteration  # Checkpoint state unchanged
+
+    def test_fork_runs_with_failing_variant_raises_runtime_error(self):
+        # Arrange
+        self.engine.run_streaming(end="2012-02-01")
+
+        def failing_variant(engine: BacktestEngine) -> None:
+            raise ValueError("invalid variant")
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            self.engine.fork_runs([lambda engine: None, failing_variant], max_workers=1)
+
     def test_dump_pickled_data(self):
         # Arrange, # Act, # Assert
         assert len(self.engine.dump_pickled_data()) == 5181010
@@ -610,3 +1000,120 @@ class TestBacktestWithAddedBars:
         assert self.engine.portfolio.account(self.venue).balance_total(USD) == Money(
             1011166.89, USD
         )
+
+    def test_dump_and_load_data(self, tmp_path):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=str(GBPUSD_SIM.id),
+            bar_type=str(bar_type),
+            trade_size=Decimal(100_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        path = tmp_path / "data.bin"
+        self.engine.dump_data(path)
+
+        # Act
+        self.engine.load_data(path)
+        self.engine.run()
+
+        # Assert
+        assert strategy.fast_ema.count == 30117
+        assert self.engine.iteration == 60234
+        assert self.engine.portfolio.account(self.venue).balance_total(USD) == Money(
+            1011166.89, USD
+        )
+
+
+class TestBacktestWithFilteredBars:
+    def setup(self):
+        # Fixture Setup
+        config = BacktestEngineConfig(
+            run_analysis=False,
+            filter_unsubscribed_data=True,
+        )
+        self.engine = BacktestEngine(config=config)
+        self.venue = Venue("SIM")
+
+        # Setup venue
+        self.engine.add_venue(
+            venue=self.venue,
+            oms_type=OMSType.HEDGING,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+
+        # Setup data
+        provider = TestDataProvider()
+        self.engine.add_instrument(GBPUSD_SIM)
+        for bar_spec, filename in (
+            (TestDataStubs.bar_spec_1min_bid(), "fxcm-gbpusd-m1-bid-2012.csv"),
+            (TestDataStubs.bar_spec_1min_ask(), "fxcm-gbpusd-m1-ask-2012.csv"),
+        ):
+            wrangler = BarDataWrangler(
+                bar_type=BarType(
+                    instrument_id=GBPUSD_SIM.id,
+                    bar_spec=bar_spec,
+                    aggregation_source=AggregationSource.EXTERNAL,
+                ),
+                instrument=GBPUSD_SIM,
+            )
+            self.engine.add_data(wrangler.process(provider.read_csv_bars(filename)))
+
+    def teardown(self):
+        self.engine.dispose()
+
+    def test_run_ema_cross_with_filter_unsubscribed_data(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,
+        )
+        config = EMACrossConfig(
+            instrument_id=str(GBPUSD_SIM.id),
+            bar_type=str(bar_type),
+            trade_size=Decimal(100_000),
+            fast_ema=10,
+            slow_ema=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        # Act
+        self.engine.run()
+
+        # Assert: Ask bars only reached the matching engine, with the same result
+        assert strategy.fast_ema.count == 30117
+        assert self.engine.iteration == 60234
+        assert self.engine.kernel.data_engine.data_count == 30117
+        assert self.engine.portfolio.account(self.venue).balance_total(USD) == Money(
+            1011166.89,
+            USD,
+        )
+
+    def test_run_with_filter_unsubscribed_data_caches_latest_bars(self):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_ask(),
+            aggregation_source=AggregationSource.EXTERNAL,
+        )
+        last_bar = [x for x in self.engine.data if x.bar_type == bar_type][-1]
+
+        # Act
+        self.engine.run()
+
+        # Assert: No bars subscribed, so none reached the data engine
+        assert self.engine.kernel.data_engine.data_count == 0
+        assert self.engine.cache.bar(bar_type) == last_bar
+        assert self.engine.cache.bar_count(bar_type) > 1
@@ -1927,6 +1927,178 @@ class TestSimulatedExchange:
         assert order.avg_px == 90.001
         assert self.exchange.get_account().balance_total(USD) == Money(999998.00, USD)
 
+    def test_process_quote_tick_fills_only_crossed_resting_orders(self):
+        # Arrange: Prepare market
+        tick1 = TestDataStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+        )
+        self.data_engine.process(tick1)
+        self.exchange.process_quote_tick(tick1)
+
+        buy_limits = [
+            self.strategy.order_factory.limit(
+                USDJPY_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+                Price.from_str(price),
+            )
+            for price in ("90.001", "89.999", "90.000")
+        ]
+        sell_stop = self.strategy.order_factory.stop_market(
+            USDJPY_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            trigger_price=Price.from_str("89.990"),
+        )
+        for order in buy_limits + [sell_stop]:
+            self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        # Act
+        tick2 = QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("89.995"),
+            ask=Price.from_str("90.000"),
+            bid_size=Quantity.from_int(100000),
+            ask_size=Quantity.from_int(100000),
+            ts_event=0,
+            ts_init=0,
+        )
+        self.exchange.process_quote_tick(tick2)
+
+        # Assert
+        assert buy_limits[0].status == OrderStatus.FILLED
+        assert buy_limits[1].status == OrderStatus.ACCEPTED
+        assert buy_limits[2].status == OrderStatus.FILLED
+        assert sell_stop.status == OrderStatus.ACCEPTED
+        assert self.exchange.get_open_bid_orders() == [buy_limits[1]]
+        assert self.exchange.get_open_ask_orders() == [sell_stop]
+
+    def test_process_quote_tick_fills_modified_limit_order_at_new_price(self):
+        # Arrange: Prepare market
+        tick1 = TestDataStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+        )
+        self.data_engine.process(tick1)
+        self.exchange.process_quote_tick(tick1)
+
+        order = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("89.000"),
+        )
+        self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        self.strategy.modify_order(order, price=Price.from_str("90.001"))
+        self.exchange.process(0)
+
+        # Act
+        tick2 = QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.000"),
+            ask=Price.from_str("90.001"),
+            bid_size=Quantity.from_int(100000),
+            ask_size=Quantity.from_int(100000),
+            ts_event=0,
+            ts_init=0,
+        )
+        self.exchange.process_quote_tick(tick2)
+
+        # Assert
+        assert order.status == OrderStatus.FILLED
+        assert order.avg_px == 90.001
+
+    def test_process_quote_tick_with_size_only_update_then_price_move_fills_order(self):
+        # Arrange: Prepare market
+        tick1 = TestDataStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+        )
+        self.data_engine.process(tick1)
+        self.exchange.process_quote_tick(tick1)
+
+        order = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("90.001"),
+        )
+        self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        tick2 = QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+            bid_size=Quantity.from_int(500000),  # <-- size-only update
+            ask_size=Quantity.from_int(500000),
+            ts_event=0,
+            ts_init=0,
+        )
+        tick3 = QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.000"),
+            ask=Price.from_str("90.001"),
+            bid_size=Quantity.from_int(100000),
+            ask_size=Quantity.from_int(100000),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.exchange.process_quote_tick(tick2)
+        status_after_size_update = order.status
+        self.exchange.process_quote_tick(tick3)
+
+        # Assert
+        assert status_after_size_update == OrderStatus.ACCEPTED
+        assert order.status == OrderStatus.FILLED
+        assert order.avg_px == 90.001
+
+    def test_get_open_bid_orders_returns_orders_by_matching_price(self):
+        # Arrange: Prepare market
+        tick = TestDataStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+        )
+        self.data_engine.process(tick)
+        self.exchange.process_quote_tick(tick)
+
+        limit1 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("89.000"),
+        )
+        stop = self.strategy.order_factory.stop_market(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            trigger_price=Price.from_str("91.000"),
+        )
+        limit2 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("90.000"),
+        )
+
+        # Act
+        for order in (limit1, stop, limit2):
+            self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        # Assert
+        assert self.exchange.get_open_bid_orders() == [stop, limit2, limit1]
+
     def test_process_quote_tick_fills_sell_stop_order(self):
         # Arrange: Prepare market
         tick = TestDataStubs.quote_tick_3decimal(
@@ -2321,6 +2493,65 @@ class TestSimulatedExchange:
         assert entry.status == OrderStatus.ACCEPTED
         assert entry.quantity == 100000
 
+    def test_has_pending_work_when_idle_returns_false(self):
+        # Arrange, Act, Assert
+        assert not self.exchange.has_pending_work(0)
+
+    def test_has_pending_work_with_in_flight_command(self):
+        # Arrange
+        self.exchange.set_latency_model(LatencyModel(secs_to_nanos(1)))
+        entry = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(100),
+            quantity=Quantity.from_int(200000),
+        )
+
+        # Act
+        self.strategy.submit_order(entry)
+
+        # Assert
+        assert not self.exchange.has_pending_work(0)
+        assert self.exchange.has_pending_work(secs_to_nanos(1))
+        self.exchange.process(secs_to_nanos(1))
+        assert not self.exchange.has_pending_work(secs_to_nanos(1))
+
+    def test_latency_model_processes_in_flight_commands_in_arrival_order(self):
+        # Arrange
+        self.exchange.set_latency_model(
+            LatencyModel(
+                base_latency_nanos=0,
+                insert_latency_nanos=secs_to_nanos(2),
+                cancel_latency_nanos=secs_to_nanos(1),
+            ),
+        )
+        orders = [
+            self.strategy.order_factory.limit(
+                instrument_id=USDJPY_SIM.id,
+                order_side=OrderSide.BUY,
+                price=Price.from_int(100),
+                quantity=Quantity.from_int(200000),
+            )
+            for _ in range(3)
+        ]
+        self.strategy.submit_order(orders[0])
+        self.exchange.process(secs_to_nanos(2))
+
+        # Act
+        self.strategy.submit_order(orders[1])  # Arrives at 4s
+        self.strategy.submit_order(orders[2])  # Arrives at 4s
+        self.strategy.cancel_order(orders[0])  # Arrives at 3s
+        self.exchange.process(secs_to_nanos(3))
+
+        # Assert
+        assert orders[0].status == OrderStatus.CANCELED
+        assert orders[1].status == OrderStatus.SUBMITTED
+        assert orders[2].status == OrderStatus.SUBMITTED
+        self.exchange.process(secs_to_nanos(4))
+        assert orders[1].status == OrderStatus.ACCEPTED
+        assert orders[2].status == OrderStatus.ACCEPTED
+        assert not self.exchange.has_pending_work(secs_to_nanos(4))
+
     def test_latency_model_large_int(self):
         # Arrange
         self.exchange.set_latency_model(LatencyModel(secs_to_nanos(10)))
@@ -0,0 +1,162 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+from datetime import datetime
+
+import pandas as pd
+import pytest
+import pytz
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.backtest.modules import FXRolloverInterestModule
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.trading.strategy import Strategy
+from tests.test_kit import PACKAGE_ROOT
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+TZ_US_EAST = pytz.timezone("US/Eastern")
+
+
+def rate_data() -> pd.DataFrame:
+    return pd.read_csv(os.path.join(PACKAGE_ROOT, "data", "short-term-interest.csv"))
+
+
+def nanos(timestamp: str) -> int:
+    return pd.Timestamp(timestamp, tz="UTC").value
+
+
+def expected_rollovers(timestamps: list[int]) -> list[int]:
+    # The rollover schedule when converting every timestamp (without deadlines)
+    day_number = 0
+    rollover_applied = False
+    rollover_time = None
+    rollovers = []
+    for ts in timestamps:
+        now = pd.Timestamp(ts, tz="UTC")
+        if day_number != now.day:
+            day_number = now.day
+            rollover_applied = False
+            local = now.astimezone(TZ_US_EAST)
+            rollover_time = TZ_US_EAST.localize(
+                datetime(local.year, local.month, local.day, 17),
+            ).astimezone(pytz.utc)
+        if not rollover_applied and now >= rollover_time:
+            rollovers.append(ts)
+            rollover_applied = True
+    return rollovers
+
+
+class BuyOnceStrategy(Strategy):
+    def __init__(self):
+        super().__init__()
+        self.submitted = False
+
+    def on_start(self):
+        self.subscribe_quote_ticks(USDJPY_SIM.id)
+
+    def on_quote_tick(self, tick: QuoteTick):
+        if self.submitted:
+            return
+        order = self.order_factory.market(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(100_000),
+        )
+        self.submit_order(order)
+        self.submitted = True
+
+
+class TestFXRolloverInterestModule:
+    def test_process_before_deadline_skips_timestamp_conversion(self, mocker):
+        # Arrange
+        module = FXRolloverInterestModule(rate_data=rate_data())
+        mock_pd = mocker.patch("nautilus_trader.backtest.modules.pd", wraps=pd)
+        start = nanos("2013-01-02 10:00")
+
+        # Act: Pending rollover is 2013-01-02 22:00 UTC (17:00 US/Eastern)
+        for minute in range(12 * 60 - 1):
+            module.process(start + minute * 60_000_000_000)
+
+        # Assert
+        assert mock_pd.Timestamp.call_count == 1
+
+    @pytest.mark.parametrize(
+        "timestamps",
+        [
+            # Within a day, before and after the 17:00 US/Eastern rollover
+            ["2013-01-02 21:59", "2013-01-02 22:00", "2013-01-02 23:00"],
+            # Across a UTC day boundary
+            ["2013-01-02 21:00", "2013-01-02 23:59", "2013-01-03 00:00", "2013-01-03 12:00"],
+            # Several days between ticks
+            ["2013-01-02 21:00", "2013-01-07 03:00", "2013-01-07 23:00", "2013-01-11 23:00"],
+        ],
+        ids=["intraday", "day-boundary", "multi-day-gap"],
+    )
+    def test_run_applies_rollover_at_most_once_per_utc_day(self, timestamps):
+        # Arrange
+        engine = BacktestEngine(
+            config=BacktestEngineConfig(bypass_logging=True, run_analysis=False),
+        )
+        engine.add_venue(
+            venue=Venue("SIM"),
+            oms_type=OMSType.HEDGING,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            starting_balances=[Money(1_000_000, USD)],
+            modules=[FXRolloverInterestModule(rate_data=rate_data())],
+        )
+        engine.add_instrument(USDJPY_SIM)
+
+        # Open the position on the first two ticks (before any rollover)
+        ts_ticks = [nanos("2013-01-02 10:00"), nanos("2013-01-02 10:01")]
+        ts_ticks += [nanos(timestamp) for timestamp in timestamps]
+        engine.add_data(
+            [
+                QuoteTick(
+                    instrument_id=USDJPY_SIM.id,
+                    bid=Price.from_str("90.002"),
+                    ask=Price.from_str("90.005"),
+                    bid_size=Quantity.from_int(1_000_000),
+                    ask_size=Quantity.from_int(1_000_000),
+                    ts_event=ts,
+                    ts_init=ts,
+                )
+                for ts in ts_ticks
+            ],
+        )
+        engine.add_strategy(BuyOnceStrategy())
+
+        # Act
+        engine.run()
+
+        # Assert: Each rollover adjusts the account once, after the position opened
+        account = engine.portfolio.account(Venue("SIM"))
+        rollovers = [event.ts_event for event in account.events if event.ts_event > ts_ticks[1]]
+        assert rollovers == expected_rollovers(ts_ticks)
+        assert len(rollovers) == len(set(rollovers))
+        assert len(rollovers) > 0
+        engine.dispose()
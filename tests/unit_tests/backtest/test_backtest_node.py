@@ -16,6 +16,8 @@
 import json
 from decimal import Decimal
 
+import pytest
+
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.node import BacktestNode
 from nautilus_trader.config import BacktestDataConfig
@@ -84,6 +86,93 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_run_with_invalid_max_workers_raises_value_error(self):
+        # Arrange
+        node = BacktestNode(configs=self.backtest_configs)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            node.run(max_workers=0)
+
+    def test_run_parallel(self):
+        # Arrange
+        configs = [
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(strategies=self.strategies),
+                venues=[self.venue_config],
+                data=[self.data_config],
+            ),
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(strategies=self.strategies, trader_id="BACKTESTER-002"),
+                venues=[self.venue_config],
+                data=[self.data_config],
+            ),
+        ]
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run(max_workers=2)
+
+        # Assert
+        assert [r.run_config_id for r in results] == [c.id for c in configs]
+        assert results[0].total_orders == results[1].total_orders
+        assert node.failures == {}
+        assert node.get_engines() == []
+
+    def test_run_parallel_isolates_failed_runs(self):
+        # Arrange
+        failing_strategies = [
+            ImportableStrategyConfig(
+                strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+                config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+                config=dict(instrument_id="AUD/USD.SIM"),  # <-- missing required fields
+            )
+        ]
+        failing_config = BacktestRunConfig(
+            engine=BacktestEngineConfig(strategies=failing_strategies),
+            venues=[self.venue_config],
+            data=[self.data_config],
+        )
+        node = BacktestNode(configs=self.backtest_configs + [failing_config])
+
+        # Act
+        results = node.run(max_workers=2)
+
+        # Assert
+        assert len(results) == 1
+        assert results[0].run_config_id == self.backtest_configs[0].id
+        assert list(node.failures) == [failing_config.id]
+
+    def test_run_with_share_data_and_no_max_workers_raises_value_error(self):
+        # Arrange
+        node = BacktestNode(configs=self.backtest_configs)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            node.run(share_data=True)
+
+    def test_run_with_share_data_matches_sequential_run(self):
+        # Arrange
+        configs = [
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(strategies=self.strategies, trader_id=trader_id),
+                venues=[self.venue_config],
+                data=[self.data_config],
+            )
+            for trader_id in ("BACKTESTER-001", "BACKTESTER-002")
+        ]
+        expected = BacktestNode(configs=configs).run()
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run(max_workers=2, share_data=True)
+
+        # Assert
+        assert [r.run_config_id for r in results] == [c.id for c in configs]
+        assert [r.iterations for r in results] == [r.iterations for r in expected]
+        assert [r.total_orders for r in results] == [r.total_orders for r in expected]
+        assert [r.stats_pnls for r in results] == [r.stats_pnls for r in expected]
+
     def test_backtest_run_streaming_sync(self):
         # Arrange
         config = BacktestRunConfig(
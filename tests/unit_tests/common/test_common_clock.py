@@ -25,6 +25,7 @@ import pytz
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.clock import TimerScheduler
 from nautilus_trader.common.timer import TimeEvent
 from nautilus_trader.common.timer import TimeEventHandler
 from nautilus_trader.core.datetime import millis_to_nanos
@@ -557,6 +558,107 @@ class TestTestClock:
         assert clock.timer_count == 2
 
 
+class TestTimerScheduler:
+    def setup(self):
+        # Fixture Setup
+        self.handler = []
+        self.clock1 = TestClock()
+        self.clock1.register_default_handler(self.handler.append)
+        self.clock2 = TestClock()
+        self.clock2.register_default_handler(self.handler.append)
+        self.scheduler = TimerScheduler()
+
+    def test_instantiate_scheduler(self):
+        # Arrange, Act, Assert
+        assert self.scheduler.clock_count == 0
+        assert self.scheduler.next_time_ns == 2**64 - 1
+
+    def test_register_clock_with_existing_timer_updates_next_time(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("TEST_ALERT", 100)
+
+        # Act
+        self.scheduler.register_clock(self.clock1)
+
+        # Assert
+        assert self.scheduler.clock_count == 1
+        assert self.scheduler.next_time_ns == 100
+
+    def test_setting_timers_on_registered_clocks_updates_next_time(self):
+        # Arrange
+        self.scheduler.register_clock(self.clock1)
+        self.scheduler.register_clock(self.clock2)
+
+        # Act
+        self.clock1.set_timer_ns("TEST_TIMER", 50, 0, 0)
+        self.clock2.set_time_alert_ns("TEST_ALERT", 20)
+
+        # Assert
+        assert self.scheduler.next_time_ns == 20
+
+    def test_advance_time_before_next_time_only_sets_time(self):
+        # Arrange
+        self.scheduler.register_clock(self.clock1)
+        self.scheduler.register_clock(self.clock2)
+        self.clock1.set_time_alert_ns("TEST_ALERT", 100)
+
+        # Act
+        events = self.scheduler.advance_time(99)
+
+        # Assert
+        assert events == []
+        assert self.clock1.timestamp_ns() == 99
+        assert self.clock2.timestamp_ns() == 99
+        assert self.scheduler.next_time_ns == 100
+
+    def test_advance_time_backwards_raises_value_error(self):
+        # Arrange
+        self.scheduler.register_clock(self.clock1)
+        self.scheduler.advance_time(99)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.scheduler.advance_time(98)
+
+    def test_clear_keeps_latest_time_on_clocks(self):
+        # Arrange
+        self.scheduler.register_clock(self.clock1)
+        self.scheduler.advance_time(99)
+
+        # Act
+        self.scheduler.clear()
+
+        # Assert
+        assert self.scheduler.time_ns == 0
+        assert self.clock1.timestamp_ns() == 99
+
+    def test_advance_time_to_next_time_returns_sorted_events(self):
+        # Arrange
+        self.scheduler.register_clock(self.clock1)
+        self.scheduler.register_clock(self.clock2)
+        self.clock1.set_timer_ns("TEST_TIMER", 50, 0, 0)
+        self.clock2.set_time_alert_ns("TEST_ALERT", 20)
+
+        # Act
+        events = self.scheduler.advance_time(100)
+
+        # Assert
+        assert [e.event.ts_event for e in events] == [20, 50, 100]
+        assert self.scheduler.next_time_ns == 150
+
+    def test_clear_deregisters_clocks(self):
+        # Arrange
+        self.scheduler.register_clock(self.clock1)
+
+        # Act
+        self.scheduler.clear()
+        self.clock1.set_time_alert_ns("TEST_ALERT", 20)
+
+        # Assert
+        assert self.scheduler.clock_count == 0
+        assert self.scheduler.next_time_ns == 2**64 - 1
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Randomly failing on Windows in CI")
 class TestLiveClockWithThreadTimer:
     def setup(self):
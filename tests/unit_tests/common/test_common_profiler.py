@@ -0,0 +1,76 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.profiler import Profiler
+
+
+class TestProfiler:
+    def test_stats_when_nothing_recorded_returns_empty_dict(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act, Assert
+        assert profiler.stats() == {}
+
+    def test_record_accumulates_per_stage_sorted_by_total(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act
+        profiler.record("DataEngine.process", 100)
+        profiler.record("SimulatedExchange.process", 50)
+        profiler.record("DataEngine.process", 300)
+
+        # Assert
+        assert profiler.stats() == {
+            "DataEngine.process": {"total_ns": 400, "count": 2},
+            "SimulatedExchange.process": {"total_ns": 50, "count": 1},
+        }
+
+    def test_record_handler_names_stage_from_owner(self):
+        # Arrange
+        profiler = Profiler()
+        handler = []
+
+        # Act
+        profiler.record_handler(handler.append, 10)
+
+        # Assert
+        assert profiler.stats() == {"Handler list.append": {"total_ns": 10, "count": 1}}
+
+    def test_format_table(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record("DataEngine.process", 3_000_000)
+        profiler.record("DataEngine.process", 1_000_000)
+
+        # Act
+        lines = profiler.format_table()
+
+        # Assert
+        assert len(lines) == 2
+        assert lines[0].split() == ["Stage", "Calls", "Total", "(ms)", "Mean", "(us)"]
+        assert lines[1].split() == ["DataEngine.process", "2", "4.0", "2,000.00"]
+
+    def test_reset(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record("DataEngine.process", 100)
+
+        # Act
+        profiler.reset()
+
+        # Assert
+        assert profiler.stats() == {}
@@ -0,0 +1,268 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import socket
+import struct
+
+import pytest
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.msgbus.bridge import MessageBusBridgeClient
+from nautilus_trader.msgbus.bridge import MessageBusBridgeServer
+from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.msgbus.codec import FRAME_PREFIX_SIZE
+from nautilus_trader.msgbus.codec import MessageCodec
+from nautilus_trader.msgbus.codec import MessageKind
+from tests.test_kit.stubs.data import TestDataStubs
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+async def eventually(condition, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+class TestMessageCodec:
+    def test_encode_decode_round_trip(self):
+        # Arrange
+        codec = MessageCodec()
+        tick = TestDataStubs.quote_tick_5decimal()
+
+        # Act
+        frame = codec.encode(MessageKind.PUBLISH, "data.quotes.SIM.AUD/USD", tick)
+        result = codec.decode(frame[FRAME_PREFIX_SIZE:])
+
+        # Assert
+        assert (
+            MessageCodec.frame_length(frame[:FRAME_PREFIX_SIZE]) == len(frame) - FRAME_PREFIX_SIZE
+        )
+        assert result == (MessageKind.PUBLISH, "data.quotes.SIM.AUD/USD", tick)
+
+    def test_encode_unserializable_message_raises_runtime_error(self):
+        # Arrange
+        codec = MessageCodec()
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            codec.encode(MessageKind.SEND, "mailbox", object())
+
+
+class TestMessageBusBridge:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(self.clock)
+
+        self.server_msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+            logger=self.logger,
+        )
+        self.client_msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+    async def start_bridges(self, path, server_kwargs, client_kwargs):
+        loop = asyncio.get_running_loop()
+        server = MessageBusBridgeServer(
+            loop=loop,
+            msgbus=self.server_msgbus,
+            logger=self.logger,
+            path=str(path),
+            **server_kwargs,
+        )
+        client = MessageBusBridgeClient(
+            loop=loop,
+            msgbus=self.client_msgbus,
+            logger=self.logger,
+            path=str(path),
+            **client_kwargs,
+        )
+        await server.start()
+        await client.connect()
+        await eventually(lambda: server.peer_count == 1)
+        return server, client
+
+    @pytest.mark.asyncio
+    async def test_forwards_matching_publishes_to_client(self, tmp_path):
+        # Arrange
+        server, client = await self.start_bridges(
+            path=tmp_path / "bridge.sock",
+            server_kwargs={"topics": ["data.quotes.*"]},
+            client_kwargs={},
+        )
+        received = []
+        self.client_msgbus.subscribe("data.quotes.SIM.AUD/USD", received.append)
+        tick = TestDataStubs.quote_tick_5decimal()
+
+        # Act
+        self.server_msgbus.publish("data.quotes.SIM.AUD/USD", tick)
+        self.server_msgbus.publish("data.trades.SIM.AUD/USD", tick)  # Not forwarded
+        await eventually(lambda: len(received) == 1)
+
+        # Assert
+        assert received == [tick]
+        assert server.sent_count == 1
+        assert client.recv_count == 1
+
+        await client.disconnect()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_forwards_sends_to_server_endpoint(self, tmp_path):
+        # Arrange
+        server, client = await self.start_bridges(
+            path=tmp_path / "bridge.sock",
+            server_kwargs={},
+            client_kwargs={"endpoints": ["RiskEngine.execute"]},
+        )
+        received = []
+        self.server_msgbus.register("RiskEngine.execute", received.append)
+        tick = TestDataStubs.quote_tick_5decimal()
+
+        # Act
+        self.client_msgbus.send("RiskEngine.execute", tick)
+        await eventually(lambda: len(received) == 1)
+
+        # Assert
+        assert received == [tick]
+        assert "RiskEngine.execute" in self.client_msgbus.endpoints()
+
+        await client.disconnect()
+        await server.stop()
+
+        assert "RiskEngine.execute" not in self.client_msgbus.endpoints()
+
+    @pytest.mark.asyncio
+    async def test_forwards_sends_to_every_peer(self, tmp_path):
+        # Arrange
+        server, client = await self.start_bridges(
+            path=tmp_path / "bridge.sock",
+            server_kwargs={"endpoints": ["Portfolio.update"]},
+            client_kwargs={},
+        )
+        other_msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+            logger=self.logger,
+        )
+        other_client = MessageBusBridgeClient(
+            loop=asyncio.get_running_loop(),
+            msgbus=other_msgbus,
+            logger=self.logger,
+            path=str(tmp_path / "bridge.sock"),
+        )
+        await other_client.connect()
+        await eventually(lambda: server.peer_count == 2)
+        received = []
+        other_received = []
+        self.client_msgbus.register("Portfolio.update", received.append)
+        other_msgbus.register("Portfolio.update", other_received.append)
+        tick = TestDataStubs.quote_tick_5decimal()
+
+        # Act
+        self.server_msgbus.send("Portfolio.update", tick)
+        await eventually(lambda: len(received) == 1 and len(other_received) == 1)
+
+        # Assert: Handled once by each peer with the endpoint registered
+        assert received == [tick]
+        assert other_received == [tick]
+        assert server.sent_count == 2
+
+        await other_client.disconnect()
+        await client.disconnect()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_does_not_echo_received_publishes_back_to_peer(self, tmp_path):
+        # Arrange
+        server, client = await self.start_bridges(
+            path=tmp_path / "bridge.sock",
+            server_kwargs={"topics": ["data.*"]},
+            client_kwargs={"topics": ["data.*"]},
+        )
+        received = []
+        self.server_msgbus.subscribe("data.*", received.append)
+        tick = TestDataStubs.quote_tick_5decimal()
+
+        # Act
+        self.client_msgbus.publish("data.signal", tick)
+        await eventually(lambda: len(received) == 1)
+        await asyncio.sleep(0.05)
+
+        # Assert
+        assert received == [tick]
+        assert server.sent_count == 0
+        assert client.recv_count == 0
+
+        await client.disconnect()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_removes_stale_socket_and_stop_removes_socket(self, tmp_path):
+        # Arrange
+        path = tmp_path / "bridge.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()  # <-- socket file left behind
+        server = MessageBusBridgeServer(
+            loop=asyncio.get_running_loop(),
+            msgbus=self.server_msgbus,
+            logger=self.logger,
+            path=str(path),
+        )
+
+        # Act
+        await server.start()
+        await server.stop()
+
+        # Assert
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_undecodable_frame_is_dropped_and_reading_continues(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "bridge.sock")
+        server = MessageBusBridgeServer(
+            loop=asyncio.get_running_loop(),
+            msgbus=self.server_msgbus,
+            logger=self.logger,
+            path=path,
+        )
+        await server.start()
+        received = []
+        self.server_msgbus.subscribe("data.*", received.append)
+        tick = TestDataStubs.quote_tick_5decimal()
+        _, writer = await asyncio.open_unix_connection(path=path)
+
+        # Act
+        writer.write(struct.pack("<I", 2) + b"\x01\x00")  # <-- truncated header
+        writer.write(MessageCodec().encode(MessageKind.PUBLISH, "data.signal", tick))
+        await writer.drain()
+        await eventually(lambda: len(received) == 1)
+
+        # Assert
+        assert received == [tick]
+        assert server.recv_count == 1
+        assert server.peer_count == 1
+
+        writer.close()
+        await server.stop()
@@ -13,8 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.profiler import Profiler
 from nautilus_trader.core.message import Request
 from nautilus_trader.core.message import Response
 from nautilus_trader.core.uuid import UUID4
@@ -424,3 +427,107 @@ class TestMessageBus:
         # Assert
         assert handler1 == ["message1"]
         assert handler2 == ["message1", "message2", "message3"]
+
+    def test_subscribe_after_publish_then_receives_message_on_matching_topic(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        handler3 = []
+        self.msgbus.subscribe(topic="data.signal.my_signal", handler=handler1.append)
+        self.msgbus.publish("data.signal.my_signal", "message1")
+
+        # Act
+        self.msgbus.subscribe(topic="data.signal.*", handler=handler2.append)
+        self.msgbus.subscribe(topic="data.trades.*", handler=handler3.append)
+        self.msgbus.publish("data.signal.my_signal", "message2")
+
+        # Assert
+        assert handler1 == ["message1", "message2"]
+        assert handler2 == ["message2"]
+        assert handler3 == []
+
+    def test_publish_with_equal_priority_sends_in_subscription_order(self):
+        # Arrange
+        received = []
+        self.msgbus.subscribe(topic="data.*", handler=lambda m: received.append(1))
+        self.msgbus.subscribe(topic="data.signal", handler=lambda m: received.append(2))
+        self.msgbus.subscribe(topic="data.sig*", handler=lambda m: received.append(3), priority=1)
+        self.msgbus.subscribe(topic="*", handler=lambda m: received.append(4))
+
+        # Act
+        self.msgbus.publish("data.signal", "message")
+
+        # Assert
+        assert received == [3, 1, 2, 4]
+        assert [s.topic for s in self.msgbus.subscriptions("data*")] == [
+            "data.*",
+            "data.signal",
+            "data.sig*",
+        ]
+
+    def test_publish_and_send_with_profiler_records_stages(self):
+        # Arrange
+        profiler = Profiler()
+        self.msgbus.set_profiler(profiler)
+        subscriber = []
+        endpoint = []
+        self.msgbus.subscribe(topic="system", handler=subscriber.append)
+        self.msgbus.register(endpoint="mailbox", handler=endpoint.append)
+
+        # Act
+        self.msgbus.publish("system", "hello world")
+        self.msgbus.publish("system", "hello again")
+        self.msgbus.send("mailbox", "message")
+
+        # Assert
+        stats = profiler.stats()
+        assert subscriber == ["hello world", "hello again"]
+        assert endpoint == ["message"]
+        assert self.msgbus.pub_count == 2
+        assert stats["MessageBus.publish system"]["count"] == 2
+        assert stats["Handler list.append"]["count"] == 2
+        assert stats["MessageBus.send mailbox"]["count"] == 1
+
+    def test_add_listener_receives_all_publishes_before_handlers(self):
+        # Arrange
+        received = []
+        self.msgbus.subscribe(topic="system", handler=lambda m: received.append(("handler", m)))
+        self.msgbus.add_listener(lambda t, m: received.append((t, m)))
+
+        # Act
+        self.msgbus.publish("system", "hello world")
+        self.msgbus.publish("orphan", "no subscribers")
+
+        # Assert
+        assert received == [
+            ("system", "hello world"),
+            ("handler", "hello world"),
+            ("orphan", "no subscribers"),
+        ]
+
+    def test_add_listener_when_already_added_raises_key_error(self):
+        # Arrange
+        def listener(topic, msg):
+            pass
+
+        self.msgbus.add_listener(listener)
+
+        # Act, Assert
+        with pytest.raises(KeyError):
+            self.msgbus.add_listener(listener)
+
+    def test_remove_listener_stops_receiving_publishes(self):
+        # Arrange
+        received = []
+
+        def listener(topic, msg):
+            received.append(msg)
+
+        self.msgbus.add_listener(listener)
+
+        # Act
+        self.msgbus.remove_listener(listener)
+        self.msgbus.publish("system", "hello world")
+
+        # Assert
+        assert received == []
@@ -0,0 +1,219 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import json
+
+import pytest
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.msgbus.metrics import LatencyHistogram
+from nautilus_trader.msgbus.metrics import MessageBusMetrics
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+class TestLatencyHistogram:
+    def test_instantiate_has_no_values(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act, Assert
+        assert histogram.count == 0
+        assert histogram.percentile(99.0) == 0
+        assert histogram.buckets() == {}
+
+    def test_record_small_values_exactly(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for value in (1, 5, 5, 15):
+            histogram.record(value)
+
+        # Assert
+        assert histogram.count == 4
+        assert histogram.total_ns == 26
+        assert histogram.min_ns == 1
+        assert histogram.max_ns == 15
+        assert histogram.buckets() == {1: 1, 5: 2, 15: 1}
+        assert histogram.percentile(50.0) == 5
+
+    def test_record_large_values_into_log_linear_buckets(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        histogram.record(1_000)
+        histogram.record(1_010)
+        histogram.record(1_000_000)
+
+        # Assert
+        assert histogram.buckets() == {992: 2, 983_040: 1}
+        assert histogram.percentile(50.0) == 1_023  # Highest equivalent value
+        assert histogram.percentile(100.0) == 1_000_000  # Capped at max
+
+    @pytest.mark.parametrize("value", [16, 100, 12_345, 987_654_321, 2**63])
+    def test_percentile_relative_error_is_bounded(self, value):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        histogram.record(value)
+        histogram.record(value + 1)  # Max of the next value
+
+        # Assert
+        assert value <= histogram.percentile(50.0) <= value * 1.0625
+
+    def test_percentile_with_invalid_q_raises_value_error(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            histogram.percentile(101.0)
+
+    def test_to_dict(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record(10)
+        histogram.record(20)
+
+        # Act
+        result = histogram.to_dict()
+
+        # Assert
+        assert result == {
+            "count": 2,
+            "total_ns": 30,
+            "min_ns": 10,
+            "mean_ns": 15,
+            "p50_ns": 10,
+            "p90_ns": 20,
+            "p99_ns": 20,
+            "p999_ns": 20,
+            "max_ns": 20,
+        }
+
+
+class TestMessageBusMetrics:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+            logger=Logger(self.clock, bypass=True),
+        )
+        self.metrics = MessageBusMetrics()
+        self.msgbus.set_metrics(self.metrics)
+
+    def test_stats_when_nothing_recorded_returns_empty_dict(self):
+        # Arrange, Act, Assert
+        assert self.metrics.stats() == {}
+        assert self.metrics.slowest_handlers() == []
+
+    def test_publish_records_counts_and_handler_latencies_per_topic(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        self.msgbus.subscribe(topic="data.*", handler=handler1.append)
+        self.msgbus.subscribe(topic="data.quotes", handler=handler2.append)
+
+        # Act
+        self.msgbus.publish("data.quotes", "quote1")
+        self.msgbus.publish("data.quotes", "quote2")
+        self.msgbus.publish("data.trades", "trade")
+        self.msgbus.publish("events", "event")
+
+        # Assert
+        stats = self.metrics.stats()
+        assert handler1 == ["quote1", "quote2", "trade"]
+        assert self.metrics.publish_counts() == {"data.quotes": 2, "data.trades": 1, "events": 1}
+        assert list(stats) == ["data.quotes", "data.trades", "events"]
+        assert list(stats["data.quotes"]["handlers"]) == ["list.append"]
+        assert stats["data.quotes"]["handlers"]["list.append"]["count"] == 2
+        assert stats["events"]["handlers"] == {}
+        assert len(self.metrics.slowest_handlers()) == 3
+
+    def test_histogram_returns_histogram_for_handler_name(self):
+        # Arrange
+        self.msgbus.subscribe(topic="data.quotes", handler=[].append)
+        self.msgbus.publish("data.quotes", "quote")
+
+        # Act
+        histogram = self.metrics.histogram("data.quotes", "list.append")
+
+        # Assert
+        assert histogram.count == 1
+        assert self.metrics.histogram("data.quotes", "other") is None
+        assert self.metrics.histogram("data.trades", "list.append") is None
+
+    def test_dump_writes_json_including_buckets(self, tmp_path):
+        # Arrange
+        self.msgbus.subscribe(topic="data.quotes", handler=[].append)
+        self.msgbus.publish("data.quotes", "quote")
+        path = tmp_path / "metrics.json"
+
+        # Act
+        self.metrics.dump(str(path))
+
+        # Assert
+        result = json.loads(path.read_text())
+        handler = result["data.quotes"]["handlers"]["list.append"]
+        assert result["data.quotes"]["count"] == 1
+        assert handler["count"] == 1
+        assert sum(handler["buckets"].values()) == 1
+
+    def test_dump_after_handler_raised_writes_json(self, tmp_path):
+        # Arrange
+        def handler(msg):
+            raise RuntimeError("boom")
+
+        self.msgbus.subscribe(topic="data.quotes", handler=[].append, priority=1)
+        self.msgbus.subscribe(topic="data.quotes", handler=handler)
+        with pytest.raises(RuntimeError):
+            self.msgbus.publish("data.quotes", "quote")
+        path = tmp_path / "metrics.json"
+
+        # Act
+        self.metrics.dump(str(path))
+
+        # Assert
+        result = json.loads(path.read_text())
+        assert result["data.quotes"]["count"] == 0
+        assert result["data.quotes"]["handlers"]["list.append"]["count"] == 1
+
+    def test_reset(self):
+        # Arrange
+        self.msgbus.subscribe(topic="data.quotes", handler=[].append)
+        self.msgbus.publish("data.quotes", "quote")
+
+        # Act
+        self.metrics.reset()
+
+        # Assert
+        assert self.metrics.stats() == {}
+
+    def test_set_metrics_none_stops_recording(self):
+        # Arrange
+        self.msgbus.set_metrics(None)
+
+        # Act
+        self.msgbus.publish("data.quotes", "quote")
+
+        # Assert
+        assert self.metrics.stats() == {}
+        assert self.msgbus.pub_count == 1
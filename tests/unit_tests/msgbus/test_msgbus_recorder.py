@@ -0,0 +1,187 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.msgbus.recorder import MessageBusRecorder
+from nautilus_trader.msgbus.recorder import MessageBusReplayer
+from tests.test_kit.stubs.data import TestDataStubs
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+class TestMessageBusRecorder:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(self.clock)
+
+        self.msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+    def new_msgbus(self, clock=None) -> MessageBus:
+        return MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=clock or TestClock(),
+            logger=self.logger,
+        )
+
+    def test_record_and_replay_publishes_same_sequence(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "msgbus.log")
+        recorder = MessageBusRecorder(
+            msgbus=self.msgbus,
+            clock=self.clock,
+            logger=self.logger,
+            path=path,
+        )
+        recorder.start()
+        quote = TestDataStubs.quote_tick_5decimal()
+        trade = TestDataStubs.trade_tick_5decimal()
+
+        self.clock.set_time(1_000)
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", quote)
+        self.clock.set_time(2_000)
+        self.msgbus.publish("data.trades.SIM.AUD/USD", trade)
+        recorder.stop()
+
+        clock = TestClock()
+        msgbus = self.new_msgbus(clock)
+        received = []
+        msgbus.subscribe("data.*", received.append)
+
+        # Act
+        count = MessageBusReplayer(path).replay(msgbus)
+
+        # Assert
+        assert recorder.record_count == 2
+        assert count == 2
+        assert received == [quote, trade]
+        assert clock.timestamp_ns() == 2_000
+
+    def test_record_with_topics_filters_published_topics(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "msgbus.log")
+        recorder = MessageBusRecorder(
+            msgbus=self.msgbus,
+            clock=self.clock,
+            logger=self.logger,
+            path=path,
+            topics=["data.quotes.*"],
+        )
+        recorder.start()
+        quote = TestDataStubs.quote_tick_5decimal()
+
+        # Act
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", quote)
+        self.msgbus.publish("data.trades.SIM.AUD/USD", TestDataStubs.trade_tick_5decimal())
+        recorder.stop()
+
+        # Assert
+        assert MessageBusReplayer(path).load() == [(0, "data.quotes.SIM.AUD/USD", quote)]
+
+    def test_record_skips_unserializable_messages(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "msgbus.log")
+        recorder = MessageBusRecorder(
+            msgbus=self.msgbus,
+            clock=self.clock,
+            logger=self.logger,
+            path=path,
+        )
+        recorder.start()
+
+        # Act
+        self.msgbus.publish("system", "hello world")
+        recorder.stop()
+
+        # Assert
+        assert recorder.record_count == 0
+        assert recorder.skipped_count == 1
+        assert MessageBusReplayer(path).load() == []
+
+    def test_instantiate_does_not_create_file(self, tmp_path):
+        # Arrange
+        path = tmp_path / "msgbus.log"
+
+        # Act
+        recorder = MessageBusRecorder(
+            msgbus=self.msgbus,
+            clock=self.clock,
+            logger=self.logger,
+            path=str(path),
+        )
+
+        # Assert
+        assert not recorder.is_recording
+        assert not path.exists()
+
+    def test_start_after_stop_appends_to_log(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "msgbus.log")
+        recorder = MessageBusRecorder(
+            msgbus=self.msgbus,
+            clock=self.clock,
+            logger=self.logger,
+            path=path,
+        )
+        quote = TestDataStubs.quote_tick_5decimal()
+        recorder.start()
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", quote)
+        recorder.stop()
+
+        # Act
+        recorder.start()
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", quote)
+        recorder.stop()
+
+        # Assert
+        assert not recorder.is_recording
+        assert recorder.record_count == 2
+        assert len(MessageBusReplayer(path).load()) == 2
+
+    def test_start_when_recording_does_not_add_listener_again(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "msgbus.log")
+        recorder = MessageBusRecorder(
+            msgbus=self.msgbus,
+            clock=self.clock,
+            logger=self.logger,
+            path=path,
+        )
+        recorder.start()
+
+        # Act
+        recorder.start()
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", TestDataStubs.quote_tick_5decimal())
+        recorder.stop()
+
+        # Assert
+        assert recorder.record_count == 1
+        assert not recorder.is_recording
+
+    def test_replay_with_invalid_file_raises_value_error(self, tmp_path):
+        # Arrange
+        path = tmp_path / "invalid.log"
+        path.write_bytes(b"not a log")
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            MessageBusReplayer(str(path)).load()
@@ -0,0 +1,122 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.msgbus.trie import TopicTrie
+from nautilus_trader.msgbus.wildcard import is_matching
+
+
+TOPICS = [
+    "*",
+    "a",
+    "data.quotes.BINANCE",
+    "data.trades.BINANCE.ETHUSDT",
+    "data.trades.BINANCE.BTCUSDT",
+    "data.bars.ETHUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL",
+    "events.order.S-001",
+    "events.order*",
+]
+
+PATTERNS = [
+    "*",
+    "a",
+    "b",
+    "data.*",
+    "data.quotes*",
+    "data.*.BINANCE",
+    "data.*.BINANCE.*",
+    "data.*.BINANCE.ETH*",
+    "data.trades.BINANCE.???USDT",
+    "*USDT",
+    "events.order*",
+    "events.order.S-00?",
+]
+
+
+class TestTopicTrie:
+    def test_instantiate_has_no_values(self):
+        # Arrange
+        trie = TopicTrie()
+
+        # Act, Assert
+        assert trie.count == 0
+        assert trie.match("a") == []
+        assert trie.find_matching("*") == []
+
+    @pytest.mark.parametrize("topic", TOPICS)
+    def test_match_returns_same_as_is_matching(self, topic):
+        # Arrange
+        trie = TopicTrie()
+        for pattern in PATTERNS:
+            trie.add(pattern, pattern)
+
+        # Act
+        result = trie.match(topic)
+
+        # Assert
+        assert sorted(result) == sorted(p for p in PATTERNS if is_matching(topic, p))
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    def test_find_matching_returns_same_as_is_matching(self, pattern):
+        # Arrange
+        trie = TopicTrie()
+        for topic in TOPICS:
+            trie.add(topic, topic)
+
+        # Act
+        result = trie.find_matching(pattern)
+
+        # Assert
+        assert sorted(result) == sorted(t for t in TOPICS if is_matching(t, pattern))
+
+    def test_add_multiple_values_at_same_key_returns_all(self):
+        # Arrange
+        trie = TopicTrie()
+
+        # Act
+        trie.add("data.*", 1)
+        trie.add("data.*", 2)
+
+        # Assert
+        assert trie.count == 2
+        assert trie.match("data.quotes") == [1, 2]
+
+    def test_remove_value_prunes_key(self):
+        # Arrange
+        trie = TopicTrie()
+        trie.add("data.*", 1)
+        trie.add("data.quotes", 2)
+
+        # Act
+        result1 = trie.remove("data.*", 1)
+        result2 = trie.remove("data.*", 1)
+
+        # Assert
+        assert result1
+        assert not result2
+        assert trie.count == 1
+        assert trie.match("data.quotes") == [2]
+        assert trie.find_matching("data.*") == [2]
+
+    def test_remove_when_key_not_found_returns_false(self):
+        # Arrange
+        trie = TopicTrie()
+        trie.add("data.quotes", 1)
+
+        # Act, Assert
+        assert not trie.remove("data.trades", 1)
+        assert not trie.remove("data", 1)
+        assert trie.count == 1
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import fsspec
+import pytest
 
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.backtest.node import BacktestNode
@@ -23,6 +24,7 @@ from nautilus_trader.config import BacktestRunConfig
 from nautilus_trader.model.data.venue import InstrumentStatusUpdate
 from nautilus_trader.model.orderbook.data import OrderBookData
 from nautilus_trader.persistence.batching import batch_files
+from nautilus_trader.persistence.batching import prefetch
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.catalog.parquet import resolve_path
 from nautilus_trader.persistence.external.core import process_files
@@ -123,3 +125,51 @@ class TestPersistenceBatching:
 
         # Assert
         assert node
+
+
+class TestPrefetch:
+    def test_prefetch_yields_all_items_in_order(self):
+        # Arrange, Act
+        result = list(prefetch(iter(range(100)), maxsize=2))
+
+        # Assert
+        assert result == list(range(100))
+
+    def test_prefetch_with_zero_maxsize_iterates_synchronously(self):
+        # Arrange, Act
+        result = list(prefetch(iter(range(10)), maxsize=0))
+
+        # Assert
+        assert result == list(range(10))
+
+    def test_prefetch_reraises_producer_exception(self):
+        # Arrange
+        def failing():
+            yield 1
+            raise ValueError("read failed")
+
+        # Act
+        iterator = prefetch(failing(), maxsize=2)
+
+        # Assert
+        assert next(iterator) == 1
+        with pytest.raises(ValueError):
+            next(iterator)
+
+    def test_prefetch_stops_producer_when_consumer_closes(self):
+        # Arrange
+        produced = []
+
+        def producer():
+            for i in range(1_000):
+                produced.append(i)
+                yield i
+
+        iterator = prefetch(producer(), maxsize=2)
+
+        # Act
+        next(iterator)
+        iterator.close()
+
+        # Assert
+        assert len(produced) < 10